@@ -0,0 +1,72 @@
+"""Query latency of the perceptual-hash similarity index.
+
+Fills ImageHashIndex with random hashes (plus a few near-duplicates of the
+query) and times top-k Hamming queries. Run from the backend directory:
+
+    python -m benchmarks.bench_image_similarity --images 100000
+"""
+import argparse
+import random
+import statistics
+import time
+
+from PIL import Image, ImageDraw
+
+from fastapi_app.matching.image_hash import ImageHashIndex, dhash, phash
+
+
+def flip_bits(value: int, bits: int, rng: random.Random) -> int:
+    for bit in rng.sample(range(64), bits):
+        value ^= 1 << bit
+    return value
+
+
+def hashing_cost(repeat: int) -> float:
+    """Seconds to hash one 1024x768 photo-sized image (what the background worker pays per upload)."""
+    image = Image.new("RGB", (1024, 768), "white")
+    draw = ImageDraw.Draw(image)
+    for i in range(40):
+        draw.rectangle([i * 20, i * 15, i * 20 + 200, i * 15 + 120], fill=(i * 6, 80, 255 - i * 6))
+    start = time.perf_counter()
+    for _ in range(repeat):
+        phash(image), dhash(image)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--max-distance", type=int, default=24)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    index = ImageHashIndex()
+    start = time.perf_counter()
+    for i in range(args.images):
+        index.add(i, (rng.getrandbits(64), rng.getrandbits(64)))
+    build = time.perf_counter() - start
+
+    query = (rng.getrandbits(64), rng.getrandbits(64))
+    for i in range(5):
+        index.add(f"near-{i}", (flip_bits(query[0], i, rng), flip_bits(query[1], i, rng)))
+
+    timings = []
+    for _ in range(args.queries):
+        start = time.perf_counter()
+        results = index.search(query, limit=args.limit, max_distance=args.max_distance)
+        timings.append(time.perf_counter() - start)
+    assert [item_id for item_id, _ in results][:5] == [f"near-{i}" for i in range(5)]
+
+    timings.sort()
+    print(f"images indexed        {len(index):>10}")
+    print(f"index build (s)       {build:>10.2f}")
+    print(f"index size (MB)       {index.hashes.nbytes / 1e6:>10.2f}")
+    print(f"query p50 (ms)        {statistics.median(timings) * 1e3:>10.2f}")
+    print(f"query p95 (ms)        {timings[int(len(timings) * 0.95) - 1] * 1e3:>10.2f}")
+    print(f"hash one photo (ms)   {hashing_cost(20) * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
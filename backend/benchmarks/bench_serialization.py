@@ -0,0 +1,85 @@
+"""Per-item serialisation cost for a page of items.
+
+Compares the previous path (format_item mutation + jsonable_encoder + json)
+with serialize_item + orjson. Run from the backend directory:
+
+    python -m benchmarks.bench_serialization --items 10000
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+
+from fastapi_app.schemas.item_serializer import dumps, serialize_item
+
+
+def legacy_format_item(item):
+    """The per-field formatter that routes/items.py used before serialize_item."""
+    item["id"] = str(item.get("_id"))
+    item["_id"] = str(item.get("_id"))
+    for field in ("date", "created_at", "approved_at", "rejected_at"):
+        if item.get(field) and isinstance(item[field], datetime):
+            item[field] = item[field].isoformat()
+    return item
+
+
+def make_items(n):
+    base = datetime(2026, 1, 1)
+    return [
+        {
+            "_id": ObjectId(),
+            "title": f"Black leather wallet #{i}",
+            "description": "Found near the library entrance, contains a student card.",
+            "category": "Wallets",
+            "location": "Library 2nd floor",
+            "type": "found" if i % 2 else "lost",
+            "date": base + timedelta(days=i % 90),
+            "status": "approved",
+            "created_at": base + timedelta(minutes=i),
+            "image_path": f"ab/{i:064x}.jpg",
+            "submitted_by": f"user{i % 500}",
+            "approved_by": "admin",
+            "approved_at": base + timedelta(minutes=i + 5),
+        }
+        for i in range(n)
+    ]
+
+
+def legacy(items):
+    page = {"items": [legacy_format_item(dict(it)) for it in items], "next_cursor": None}
+    return json.dumps(jsonable_encoder(page)).encode()
+
+
+def fast(items):
+    return dumps({"items": [serialize_item(it) for it in items], "next_cursor": None})
+
+
+def bench(fn, items, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(items)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    items = make_items(args.items)
+    assert json.loads(legacy(items)) == json.loads(fast(items))
+
+    print(f"{'path':<34}{'page (ms)':>12}{'per item (us)':>16}")
+    for name, fn in (("format_item + jsonable_encoder", legacy), ("serialize_item + orjson", fast)):
+        seconds = bench(fn, items, args.repeat)
+        print(f"{name:<34}{seconds * 1e3:>12.2f}{seconds / args.items * 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Import-time report for the app module, i.e. what every worker pays before its lifespan runs.
+
+Imports the module in fresh interpreters under `python -X importtime` and
+reports the median wall time plus the most expensive top-level packages
+(own import time of all their modules, so the rows add up to the total):
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --module fastapi_app.routes.items --top 30
+    python -m benchmarks.import_time --budget-ms 800
+
+With --budget-ms the exit status is 1 when the median exceeds the budget.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_once(module: str) -> Tuple[float, Dict[str, int]]:
+    """Wall seconds to import `module` in a new interpreter, and microseconds per top-level package."""
+    env = {**os.environ, "PYTHONPATH": BACKEND_DIR}
+    env.setdefault("SECRET_KEY", "import-time-report")
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        sys.exit(result.stderr)
+
+    packages = defaultdict(int)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        own, _, name = line[len("import time:"):].split("|")
+        packages[name.strip().split(".")[0]] += int(own)
+    return elapsed, packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="fastapi_app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, help="fail when the median import takes longer")
+    args = parser.parse_args()
+
+    runs = [import_once(args.module) for _ in range(args.runs)]
+    median_ms = statistics.median(elapsed for elapsed, _ in runs) * 1000
+    per_package = defaultdict(list)
+    for _, packages in runs:
+        for name, micros in packages.items():
+            per_package[name].append(micros)
+
+    print(f"import {args.module}: median {median_ms:.0f} ms over {args.runs} runs (interpreter start included)")
+    print(f"{'package':<28}{'ms':>9}")
+    ranked = sorted(per_package.items(), key=lambda kv: statistics.median(kv[1]), reverse=True)
+    for name, micros in ranked[:args.top]:
+        print(f"{name:<28}{statistics.median(micros) / 1000:>9.1f}")
+
+    if args.budget_ms and median_ms > args.budget_ms:
+        print(f"\nOver budget: {median_ms:.0f} ms > {args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
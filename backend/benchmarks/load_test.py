@@ -0,0 +1,203 @@
+"""Concurrent load test for the hot routes, with baseline comparison.
+
+Runs the app in-process over ASGI against either the mongomock-motor stand-in
+(default) or a real mongod, with a throwaway SQLite users DB, and reports
+p50/p95/p99 latency and throughput per route:
+
+    python -m benchmarks.load_test --items 10000 --concurrency 32 --requests 500
+    python -m benchmarks.load_test --mongo real --save baseline.json
+    python -m benchmarks.load_test --compare baseline.json --threshold 0.10
+
+--base-url drives an already running server instead (seed it first with
+benchmarks.seed). In --compare mode the exit status is 1 when any route's p95
+or throughput regresses by more than --threshold. Admission control (rate
+limits, concurrency caps) is off for the in-process app unless --admission.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+import httpx
+
+from benchmarks.seed import BENCH_PASSWORD, SEARCH_TERMS, seed_items, seed_users, username
+
+ROUTES = ["approved", "search", "my-items", "login", "submit"]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def build_requests(users: int, tokens: Dict[str, str], rng: random.Random) -> Dict[str, Callable]:
+    def auth(user):
+        return {"Authorization": f"Bearer {tokens[user]}"}
+
+    return {
+        "approved": lambda c: c.get("/items/approved", params={"limit": 50}),
+        "search": lambda c: c.get("/items/search", params={"keyword": rng.choice(SEARCH_TERMS)}),
+        "my-items": lambda c: c.get("/items/my-items", headers=auth(username(rng.randrange(users)))),
+        "login": lambda c: c.post("/auth/login", json={
+            "username": username(rng.randrange(users)), "password": BENCH_PASSWORD, "client_role": "user"
+        }),
+        "submit": lambda c: c.post("/items/submit", headers=auth(username(rng.randrange(users))), data={
+            "title": "Bench wallet", "description": "load test item", "category": "Wallets",
+            "location": "Main Library", "date": "2026-01-15", "type": "lost"
+        }),
+    }
+
+
+async def drive(client: httpx.AsyncClient, make_request: Callable, concurrency: int, total: int) -> dict:
+    latencies: List[float] = []
+    errors = 0
+    remaining = total
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await make_request(client)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1e3, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1e3, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1e3, 2),
+    }
+
+
+def print_report(results: Dict[str, dict], baseline: Dict[str, dict] = None) -> None:
+    header = f"{'route':<10}{'reqs':>7}{'errs':>6}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    if baseline:
+        header += f"{'Δp95':>9}{'Δrps':>9}"
+    print(header)
+    for route, r in results.items():
+        line = f"{route:<10}{r['requests']:>7}{r['errors']:>6}{r['rps']:>9}{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}"
+        if baseline and route in baseline:
+            b = baseline[route]
+            line += f"{relative_change(b['p95_ms'], r['p95_ms']):>+9.1%}{relative_change(b['rps'], r['rps']):>+9.1%}"
+        print(line)
+
+
+def relative_change(before: float, after: float) -> float:
+    return (after - before) / before if before else 0.0
+
+
+def regressions(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    found = []
+    for route, r in results.items():
+        b = baseline.get(route)
+        if not b:
+            continue
+        if relative_change(b["p95_ms"], r["p95_ms"]) > threshold:
+            found.append(f"{route}: p95 {b['p95_ms']} -> {r['p95_ms']} ms")
+        if relative_change(b["rps"], r["rps"]) < -threshold:
+            found.append(f"{route}: throughput {b['rps']} -> {r['rps']} rps")
+    return found
+
+
+async def run(args) -> Dict[str, dict]:
+    rng = random.Random(args.seed)
+
+    if args.base_url:
+        from fastapi_app.auth.jwt_handler import create_access_token
+        tokens = {username(i): create_access_token({"sub": username(i), "role": "user"}) for i in range(args.users)}
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=30) as client:
+            requests = build_requests(args.users, tokens, rng)
+            return {route: await drive(client, requests[route], args.concurrency, args.requests)
+                    for route in args.routes}
+
+    # In-process: the users DB and (optionally) Mongo are replaced before the app is imported
+    tmp = tempfile.mkdtemp(prefix="lf-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/bench.db"
+    os.environ["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{tmp}/bench.db"
+    os.environ.setdefault("SECRET_KEY", "bench-secret")
+    # All in-process traffic comes from one client, so the per-client rate limits would
+    # measure the 429 fast path rather than the routes
+    os.environ["ADMISSION_ENABLED"] = "true" if args.admission else "false"
+    if args.mongo == "mock":
+        from mongomock_motor import AsyncMongoMockClient
+        from fastapi_app.db.mongo import mongo_connection
+        mongo_connection.attach(AsyncMongoMockClient()["lost_and_found_bench"])
+
+    from fastapi_app.auth.jwt_handler import create_access_token
+    from fastapi_app.db.mongo import db, mongo_connection
+    from fastapi_app.main import app
+    from fastapi_app.routes import items as items_routes
+    items_routes.UPLOAD_FOLDER = tmp
+
+    print(f"Seeding {args.items} items / {args.users} users ({args.mongo} mongo)...", file=sys.stderr)
+    await mongo_connection.connect()
+    await seed_items(db.items, args.items, args.users, seed=args.seed)
+    await seed_users(args.users)
+    tokens = {username(i): create_access_token({"sub": username(i), "role": "user"}) for i in range(args.users)}
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=30) as client:
+            requests = build_requests(args.users, tokens, rng)
+            return {route: await drive(client, requests[route], args.concurrency, args.requests)
+                    for route in args.routes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10000, help="items to seed (e.g. 10000, 100000, 1000000)")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=500, help="requests per route")
+    parser.add_argument("--routes", nargs="+", choices=ROUTES, default=ROUTES)
+    parser.add_argument("--mongo", choices=["mock", "real"], default="mock",
+                        help="mock: mongomock-motor stand-in; real: MONGO_URI (its items collection is replaced)")
+    parser.add_argument("--base-url", help="benchmark a running server instead of the in-process app")
+    parser.add_argument("--admission", action="store_true",
+                        help="keep rate limits and concurrency caps on for the in-process app (off by default)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON from an earlier --save")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed relative regression")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+    print_report(results, baseline)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"config": {k: v for k, v in vars(args).items() if k not in ("save", "compare")},
+                       "results": results}, f, indent=2)
+
+    if baseline:
+        found = regressions(results, baseline, args.threshold)
+        for line in found:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        sys.exit(1 if found else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Seed the items collection and the users DB with synthetic data for benchmarks.
+
+    python -m benchmarks.seed --items 100000 --users 200            # real mongod (MONGO_URI)
+
+The load test calls these helpers directly when it runs against the
+in-process mongomock-motor stand-in.
+"""
+import argparse
+import asyncio
+import random
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+CATEGORIES = ["Wallets", "Keys", "Electronics", "Bags", "Books", "Clothing", "Jewelry", "ID Cards"]
+LOCATIONS = ["Main Library", "Library 2nd floor", "Cafeteria", "Gym", "Lecture Hall A", "Parking Lot", "Hostel Block C"]
+ADJECTIVES = ["black", "blue", "red", "leather", "small", "silver", "old", "new", "brown", "striped"]
+NOUNS = {
+    "Wallets": ["wallet", "purse"], "Keys": ["keys", "keychain"], "Electronics": ["phone", "charger", "earbuds"],
+    "Bags": ["backpack", "tote"], "Books": ["textbook", "notebook"], "Clothing": ["jacket", "scarf", "cap"],
+    "Jewelry": ["ring", "bracelet"], "ID Cards": ["student card", "id card"],
+}
+SEARCH_TERMS = ["wallet", "black", "phone", "keys", "leather", "libr", "jacket", "silver ring", "backpack"]
+BENCH_PASSWORD = "bench-password"
+BATCH_SIZE = 5000
+
+
+def username(i: int) -> str:
+    return f"bench_user_{i}"
+
+
+def make_item(i: int, users: int, rng: random.Random, now: datetime) -> dict:
+    category = rng.choice(CATEGORIES)
+    noun = rng.choice(NOUNS[category])
+    created_at = now - timedelta(minutes=i)
+    status = "approved" if rng.random() < 0.8 else rng.choice(["pending", "rejected"])
+    submitter = username(rng.randrange(users))
+    item = {
+        "_id": ObjectId(),
+        "title": f"{rng.choice(ADJECTIVES).title()} {noun}",
+        "description": f"{rng.choice(ADJECTIVES)} {rng.choice(ADJECTIVES)} {noun} near {rng.choice(LOCATIONS).lower()}",
+        "category": category,
+        "location": rng.choice(LOCATIONS),
+        "type": rng.choice(["lost", "found"]),
+        "date": created_at - timedelta(days=rng.randrange(30)),
+        "status": status,
+        "created_at": created_at,
+        "image_path": None,
+        "submitted_by": submitter,
+        "submitted_by_key": submitter.casefold(),
+    }
+    if status == "approved":
+        item.update(approved_by="admin", approved_at=created_at + timedelta(hours=1))
+    return item
+
+
+async def seed_items(collection, n: int, users: int, seed: int = 42) -> None:
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    await collection.delete_many({})
+    for start in range(0, n, BATCH_SIZE):
+        batch = [make_item(i, users, rng, now) for i in range(start, min(start + BATCH_SIZE, n))]
+        await collection.insert_many(batch, ordered=False)
+
+
+async def seed_users(users: int) -> None:
+    """Create bench users (one bcrypt hash shared by all, so seeding stays fast)."""
+    from sqlalchemy import delete
+    from fastapi_app.auth.jwt_handler import hash_password
+    from fastapi_app.db.database import Base, AsyncSessionLocal, users_db
+    from fastapi_app.models.user_model import User
+
+    engine = await users_db.connect()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    hashed = hash_password(BENCH_PASSWORD)
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(User).where(User.username.like("bench_user_%")))
+        db.add_all([User(username=username(i), hashed_password=hashed, role="user") for i in range(users)])
+        await db.commit()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Seed benchmark data into MONGO_URI and the users DB")
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=200)
+    args = parser.parse_args()
+
+    from fastapi_app.db.database import users_db
+    from fastapi_app.db.mongo import db, mongo_connection
+    await mongo_connection.connect()
+    await seed_items(db.items, args.items, args.users)
+    await seed_users(args.users)
+    mongo_connection.close()
+    await users_db.close()
+    print(f"Seeded {args.items} items and {args.users} users")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -15,13 +15,20 @@ async def check_user_items():
     exact = await db.items.find({"submitted_by": username}).to_list(100)
     print(f"Exact matches: {len(exact)}")
     
-    # 2. Regex match (the one used in items.py)
+    # 2. Legacy regex match (fallback for items without submitted_by_key)
     regex_pattern = f"^{re.escape(username)}\\s*$"
     regex_query = {"submitted_by": Regex(regex_pattern, "i")}
     regex_matches = await db.items.find(regex_query).to_list(100)
     print(f"Regex matches ({regex_pattern}): {len(regex_matches)}")
     
-    # 3. All items sample
+    # 3. Normalised key match (the one used in items.py)
+    key = username.strip().casefold()
+    keyed = await db.items.find({"submitted_by_key": key}).to_list(100)
+    print(f"Key matches ('{key}'): {len(keyed)}")
+    missing = await db.items.count_documents({"submitted_by_key": None})
+    print(f"Items still missing submitted_by_key: {missing}")
+    
+    # 4. All items sample
     all_items = await db.items.find().limit(5).to_list(5)
     print(f"\n--- Sample from database (first 5 items) ---")
     for it in all_items:
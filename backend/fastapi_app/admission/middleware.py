@@ -0,0 +1,150 @@
+import math
+import time
+from typing import Dict, Optional, Tuple
+
+import orjson
+
+from fastapi_app.auth.jwt_handler import verify_access_token
+from fastapi_app.cache.ttl_cache import TTLCache
+from fastapi_app.config import (
+    ADMISSION_ENABLED, ROUTE_CONCURRENCY_LIMITS, ROUTE_RATE_LIMITS,
+    RATE_LIMIT_MAX_CLIENTS, TRUST_FORWARDED_FOR
+)
+from fastapi_app.metrics.registry import registry
+
+SHED = registry.counter("admission_shed_total", "Requests rejected before reaching a handler, by route and reason")
+ADMITTED = registry.counter("admission_admitted_total", "Requests admitted on a limited route")
+
+
+class RouteRules:
+    """Looks up the rule for a request from "METHOD /path" keys (a trailing * matches a prefix)."""
+
+    def __init__(self, rules: Dict[str, object]):
+        self.exact = {}
+        self.prefixes = []
+        for key, value in rules.items():
+            method, _, path = key.partition(" ")
+            if path.endswith("*"):
+                self.prefixes.append((method.upper(), path[:-1], key, value))
+            else:
+                self.exact[(method.upper(), path.rstrip("/") or "/")] = (key, value)
+        self.prefixes.sort(key=lambda rule: len(rule[1]), reverse=True)  # longest prefix wins
+
+    def match(self, method: str, path: str) -> Optional[Tuple[str, object]]:
+        rule = self.exact.get((method, path.rstrip("/") or "/"))
+        if rule:
+            return rule
+        for rule_method, prefix, key, value in self.prefixes:
+            if rule_method == method and path.startswith(prefix):
+                return key, value
+        return None
+
+
+class TokenBuckets:
+    """One token bucket per (route, client). Idle buckets expire once they would be full
+    again anyway, and at most `max_clients` are kept (least recently seen are dropped)."""
+
+    def __init__(self, max_clients: int = RATE_LIMIT_MAX_CLIENTS):
+        self.buckets = TTLCache(maxsize=max_clients, ttl=60)
+
+    def take(self, route: str, client: str, rate: float, burst: float) -> float:
+        """Spend one token; returns 0 when allowed, else seconds until a token is available."""
+        now = time.monotonic()
+        key = (route, client)
+        tokens, last = self.buckets.get(key) or (burst, now)
+        tokens = min(burst, tokens + (now - last) * rate)
+        if tokens < 1:
+            self.buckets.set(key, (tokens, now), ttl=(burst - tokens) / rate)
+            return (1 - tokens) / rate
+        tokens -= 1
+        self.buckets.set(key, (tokens, now), ttl=(burst - tokens) / rate)
+        return 0.0
+
+
+def client_key(scope) -> str:
+    """JWT subject when the request carries a valid bearer token, otherwise the client IP."""
+    headers = dict(scope.get("headers") or [])
+    auth = headers.get(b"authorization", b"").decode("latin-1")
+    if auth[:7].lower() == "bearer ":
+        payload = verify_access_token(auth[7:].strip())
+        if payload:
+            return f"user:{payload['sub']}"
+    if TRUST_FORWARDED_FOR and b"x-forwarded-for" in headers:
+        return "ip:" + headers[b"x-forwarded-for"].decode("latin-1").split(",")[0].strip()
+    client = scope.get("client")
+    return f"ip:{client[0]}" if client else "ip:unknown"
+
+
+class AdmissionController:
+    """Route rules, token buckets and in-flight counts shared by the middleware and /metrics."""
+
+    def __init__(self, concurrency_limits: Dict[str, int] = ROUTE_CONCURRENCY_LIMITS,
+                 rate_limits: Dict[str, list] = ROUTE_RATE_LIMITS, enabled: bool = ADMISSION_ENABLED):
+        self.enabled = enabled
+        self.concurrency = RouteRules(concurrency_limits)
+        self.rates = RouteRules(rate_limits)
+        self.buckets = TokenBuckets()
+        self.in_flight: Dict[str, int] = {}
+
+    def stats(self) -> dict:
+        return {"in_flight": dict(self.in_flight), "tracked_clients": len(self.buckets.buckets)}
+
+
+admission = AdmissionController()
+
+
+class AdmissionMiddleware:
+    """ASGI middleware that sheds load before it reaches a handler.
+
+    Per-client token buckets answer 429 when one client sends too fast; a
+    per-route in-flight cap answers 503 when the route as a whole is saturated
+    (e.g. bcrypt on /auth/login). Both carry Retry-After. A streaming response
+    holds its slot until the body has been sent.
+    """
+
+    def __init__(self, app, controller: AdmissionController = admission):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        ctl = self.controller
+        if not ctl.enabled or scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        method, path = scope["method"], scope["path"]
+
+        rate_rule = ctl.rates.match(method, path)
+        if rate_rule:
+            route, (rate, burst) = rate_rule
+            wait = ctl.buckets.take(route, client_key(scope), float(rate), float(burst))
+            if wait:
+                SHED.inc(route=route, reason="rate_limited")
+                return await self.reject(send, 429, "Too many requests, slow down", wait)
+
+        limit_rule = ctl.concurrency.match(method, path)
+        if not limit_rule:
+            return await self.app(scope, receive, send)
+
+        route, limit = limit_rule
+        if ctl.in_flight.get(route, 0) >= limit:
+            SHED.inc(route=route, reason="overloaded")
+            return await self.reject(send, 503, "Server busy, please retry", 1)
+        ctl.in_flight[route] = ctl.in_flight.get(route, 0) + 1
+        ADMITTED.inc(route=route)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            ctl.in_flight[route] -= 1
+
+    @staticmethod
+    async def reject(send, status: int, detail: str, retry_after: float) -> None:
+        body = orjson.dumps({"detail": detail})
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
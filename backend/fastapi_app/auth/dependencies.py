@@ -3,11 +3,13 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from fastapi_app.auth.jwt_handler import verify_access_token
 from fastapi_app.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 from fastapi_app.models.user_model import User
-from fastapi_app.db.database import SessionLocal
-from typing import Generator
+from fastapi_app.db.database import AsyncSessionLocal
+from fastapi_app.auth.principal_cache import get_cached_principal, cache_principal
+from typing import AsyncGenerator, Optional
 import logging
 
 # Set up logging
@@ -15,19 +17,30 @@ logger = logging.getLogger(__name__)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-def get_db() -> Generator:
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
-        
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-):
+
+async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User]:
+    result = await db.execute(select(User).where(User.username == username))
+    return result.scalar_one_or_none()
+
+async def load_principal(username: str) -> Optional[dict]:
+    """Fetch the user behind a token from the users DB."""
+    async with AsyncSessionLocal() as db:
+        user = await get_user_by_username(db, username)
+        if not user:
+            return None
+        return {
+            "username": user.username,
+            "role": user.role,
+            "id": user.id
+        }
+
+async def get_current_user(token: str = Depends(oauth2_scheme)):
     """
-    ✅ FIXED: Properly handle the payload dictionary from verify_access_token
+    ✅ Resolve the token to a principal, serving repeat requests from the principal cache
+    so the users DB is only hit on a cache miss.
     """
     try:
         # Verify the token - this now returns the full payload dictionary
@@ -48,21 +61,23 @@ def get_current_user(
                 detail="Invalid token: username not found"
             )
         
-        # Get user from database
-        user = db.query(User).filter(User.username == username).first()
+        # The token signature was just verified, so the principal cached for this very token
+        # (sub + jti) can be trusted as-is; role changes show up within the short cache TTL
+        principal = get_cached_principal(username, payload.get("jti"))
+        if principal:
+            return principal
         
-        if not user:
+        # Cache miss: get user from database
+        principal = await load_principal(username)
+        
+        if not principal:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found"
             )
         
-        # Return user information dictionary
-        return {
-            "username": user.username,
-            "role": user.role,
-            "id": user.id
-        }
+        cache_principal(username, payload.get("jti"), principal, token_exp=payload.get("exp"))
+        return principal
         
     except HTTPException:
         raise
@@ -73,7 +88,7 @@ def get_current_user(
             detail=f"Invalid token: {str(e)}"
         )
 
-def get_admin_user(current_user: dict = Depends(get_current_user)):
+async def get_admin_user(current_user: dict = Depends(get_current_user)):
     """
     ✅ OPTIONAL: Additional dependency to ensure admin access
     """
@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from fastapi import HTTPException, status
+
+from fastapi_app.auth.jwt_handler import hash_password, verify_password
+from fastapi_app.config import PASSWORD_POOL_KIND, PASSWORD_POOL_WORKERS, PASSWORD_POOL_QUEUE_LIMIT
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _timed_call(fn: Callable, *args):
+    """Runs inside the worker; wall-clock stamps so they compare across processes."""
+    started_at = time.time()
+    result = fn(*args)
+    return result, started_at, time.time()
+
+
+class LatencyStats:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    def snapshot(self) -> dict:
+        cumulative, running = {}, 0
+        for bound, n in zip(self.buckets, self.counts):
+            running += n
+            cumulative[str(bound)] = running
+        cumulative["+Inf"] = self.count
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "max": round(self.max, 6),
+            "buckets": cumulative,
+        }
+
+
+class PasswordPool:
+    """Bounded executor for bcrypt work with admission control.
+
+    At most `workers` hashes run at once and at most `queue_limit` more may
+    wait; anything beyond that is refused immediately with a 503 instead of
+    piling up behind a login storm.
+    """
+
+    def __init__(self, kind: str = PASSWORD_POOL_KIND, workers: int = PASSWORD_POOL_WORKERS,
+                 queue_limit: int = PASSWORD_POOL_QUEUE_LIMIT):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown PASSWORD_POOL_KIND '{kind}', expected 'thread' or 'process'")
+        self.kind = kind
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self._executor: Optional[Executor] = None
+        self.in_flight = 0
+        self.rejected = 0
+        self.hash_latency = LatencyStats()
+        self.queue_wait = LatencyStats()
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password")
+        return self._executor
+
+    async def run(self, fn: Callable, *args):
+        if self.in_flight >= self.workers + self.queue_limit:
+            self.rejected += 1
+            logger.warning(f"🚦 Password pool saturated ({self.in_flight} in flight), shedding request")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server busy, please retry shortly",
+                headers={"Retry-After": "1"}
+            )
+
+        self.in_flight += 1
+        submitted_at = time.time()
+        try:
+            loop = asyncio.get_running_loop()
+            result, started_at, finished_at = await loop.run_in_executor(self.executor, _timed_call, fn, *args)
+        finally:
+            self.in_flight -= 1
+        self.queue_wait.observe(max(started_at - submitted_at, 0.0))
+        self.hash_latency.observe(finished_at - started_at)
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self.run(hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self.run(verify_password, password, hashed_password)
+
+    def metrics(self) -> dict:
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "queue_limit": self.queue_limit,
+            "in_flight": self.in_flight,
+            "rejected_total": self.rejected,
+            "hash_latency_seconds": self.hash_latency.snapshot(),
+            "queue_wait_seconds": self.queue_wait.snapshot(),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_pool = PasswordPool()
@@ -0,0 +1,42 @@
+import time
+from typing import Dict, Optional
+
+from fastapi_app.cache.ttl_cache import TTLCache
+from fastapi_app.config import PRINCIPAL_CACHE_TTL_SECONDS, PRINCIPAL_CACHE_MAX_ENTRIES
+
+# (username, jti, generation) -> {"username", "role", "id"}. One entry per token, so a token is
+# only ever served what was loaded for that same token, never a principal cached for another
+# one (e.g. a token of an earlier account with the same name)
+principal_cache = TTLCache(maxsize=PRINCIPAL_CACHE_MAX_ENTRIES, ttl=PRINCIPAL_CACHE_TTL_SECONDS)
+
+# Per-user generation, part of every key: bumping it orphans all of the user's cached tokens at once
+_generations: Dict[str, int] = {}
+
+
+def _key(username: str, jti: str) -> tuple:
+    return (username, jti, _generations.get(username, 0))
+
+
+def get_cached_principal(username: str, jti: Optional[str]) -> Optional[dict]:
+    if not jti:
+        return None
+    return principal_cache.get(_key(username, jti))
+
+
+def cache_principal(username: str, jti: Optional[str], principal: dict, token_exp: Optional[float] = None) -> None:
+    """Cache a token's principal, never for longer than the token stays valid.
+
+    Tokens without a jti cannot be told apart, so they are always resolved from the users DB.
+    """
+    if not jti:
+        return
+    ttl = PRINCIPAL_CACHE_TTL_SECONDS
+    if token_exp is not None:
+        ttl = min(ttl, max(token_exp - time.time(), 0))
+    if ttl > 0:
+        principal_cache.set(_key(username, jti), principal, ttl=ttl)
+
+
+def invalidate_principal(username: str) -> None:
+    """Drop a user's cached principals; call whenever a user's role or account changes."""
+    _generations[username] = _generations.get(username, 0) + 1
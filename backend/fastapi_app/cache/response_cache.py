@@ -0,0 +1,116 @@
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional
+
+from fastapi import Request, Response
+from pymongo import ReturnDocument
+
+from fastapi_app.cache.ttl_cache import TTLCache
+from fastapi_app.schemas.item_serializer import dumps
+from fastapi_app.config import RESPONSE_CACHE_BACKEND, RESPONSE_CACHE_TTL_SECONDS, RESPONSE_CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+
+class NullCache:
+    """Backend that stores nothing; used when response caching is switched off."""
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        return {"size": 0}
+
+
+CACHE_BACKENDS = {
+    "memory": lambda: TTLCache(maxsize=RESPONSE_CACHE_MAX_ENTRIES, ttl=RESPONSE_CACHE_TTL_SECONDS),
+    "none": NullCache,
+}
+
+
+class ResponseCache:
+    """Caches serialised JSON responses by route and normalised parameters, with ETags.
+
+    Each namespace carries a generation number that is part of every key.
+    Bumping it with `invalidate(namespace)` orphans all of that namespace's
+    entries at once; the LRU bound then evicts them.
+
+    Once `attach`ed, generations live in a shared collection (one document per
+    namespace, read by _id on each request), so an invalidation in one worker
+    is seen by every worker on its next request. Without one they are per process.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._generations = {}
+        self._collection = None
+
+    def attach(self, collection) -> None:
+        self._collection = collection
+
+    async def invalidate(self, namespace: str) -> None:
+        if self._collection is None:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            return
+        doc = await self._collection.find_one_and_update(
+            {"_id": namespace}, {"$inc": {"generation": 1}}, upsert=True, return_document=ReturnDocument.AFTER
+        )
+        self._generations[namespace] = doc["generation"]
+
+    async def refresh(self, namespace: str) -> None:
+        """Pick up invalidations made by other workers."""
+        if self._collection is not None:
+            doc = await self._collection.find_one({"_id": namespace})
+            self._generations[namespace] = doc["generation"] if doc else 0
+
+    def make_key(self, namespace: str, params: dict, case_insensitive: Iterable[str] = ()) -> tuple:
+        normalised = []
+        for name, value in sorted(params.items()):
+            if value is None or value == "":
+                continue
+            if isinstance(value, str):
+                value = value.strip()
+                if name in case_insensitive:
+                    value = value.casefold()
+            normalised.append((name, value))
+        return (namespace, self._generations.get(namespace, 0), tuple(normalised))
+
+    async def respond(self, request: Request, namespace: str, params: dict,
+                      compute: Callable[[], Awaitable[Any]], case_insensitive: Iterable[str] = ()) -> Response:
+        """Serve from cache when possible; answer 304 when the client's ETag still matches."""
+        await self.refresh(namespace)
+        key = self.make_key(namespace, params, case_insensitive)
+        entry = self.backend.get(key)
+        if entry is None:
+            body = dumps(await compute())
+            entry = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+            self.backend.set(key, entry)
+        body, etag = entry
+
+        # no-cache: browsers may store the response but must revalidate with the ETag
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+def build_response_cache(name: str = RESPONSE_CACHE_BACKEND) -> ResponseCache:
+    try:
+        return ResponseCache(CACHE_BACKENDS[name]())
+    except KeyError:
+        raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND '{name}', expected one of {sorted(CACHE_BACKENDS)}")
+
+
+# Shared generation counters, one document per namespace
+GENERATIONS_COLLECTION = "cache_generations"
+
+# Namespace for every listing that only shows approved items (/items/approved, /items/search)
+APPROVED_LISTINGS = "approved"
+
+response_cache = build_response_cache()
@@ -1,3 +1,4 @@
+import json
 import os
 from dotenv import load_dotenv
 
@@ -7,4 +8,131 @@ load_dotenv()
 # Secret settings
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
\ No newline at end of file
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
+
+# Listing / pagination settings
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", 50))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 200))
+
+# Search settings: "memory" (in-process inverted index) or "mongo" ($text index)
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "memory")
+SEARCH_MAX_CANDIDATES = int(os.getenv("SEARCH_MAX_CANDIDATES", 1000))
+# The in-process indexes (memory search, suggest, matches, similar images) live in each worker
+# and are only updated by that worker's own routes. With several workers each one reads the items
+# moderated or archived since its last sync this often, so changes made through another worker
+# show up within the interval; 0 disables syncing (fine for a single worker). A full rebuild
+# every INDEX_REBUILD_SECONDS (0 never) catches changes made outside the app.
+INDEX_RESYNC_SECONDS = int(os.getenv("INDEX_RESYNC_SECONDS", 15))
+INDEX_REBUILD_SECONDS = int(os.getenv("INDEX_REBUILD_SECONDS", 3600))
+
+# Authenticated principal cache
+PRINCIPAL_CACHE_TTL_SECONDS = int(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", 30))
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", 10000))
+
+# MongoDB (items). The client is created in the app lifespan and pinged before traffic is served.
+MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017")
+MONGO_DB_NAME = os.getenv("MONGO_DB_NAME", "lost_and_found")
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", 100))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", 5))
+MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", 60000))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", 5000))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", 5000))
+MONGO_SOCKET_TIMEOUT_MS = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", 30000))
+# How long a request waits for a free pooled connection before failing
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", 5000))
+
+# Users database. DATABASE_URL is used by sync tooling (init_db), ASYNC_DATABASE_URL by
+# the request path; point both at a server database (e.g. postgresql+asyncpg://...) to move off SQLite.
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./fastapi_app/db/app.db")
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", "sqlite+aiosqlite:///./fastapi_app/db/app.db")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000))
+
+# Password hashing pool (bcrypt). Kind is "thread" or "process"; a process pool sidesteps the GIL.
+PASSWORD_POOL_KIND = os.getenv("PASSWORD_POOL_KIND", "thread")
+PASSWORD_POOL_WORKERS = int(os.getenv("PASSWORD_POOL_WORKERS", min(4, os.cpu_count() or 1)))
+PASSWORD_POOL_QUEUE_LIMIT = int(os.getenv("PASSWORD_POOL_QUEUE_LIMIT", 32))
+
+# Uploads
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", 10 * 1024 * 1024))
+UPLOAD_CHUNK_BYTES = int(os.getenv("UPLOAD_CHUNK_BYTES", 1024 * 1024))
+# Request bodies of upload routes are capped while they stream in, before multipart parsing
+# spools them to disk; the submit cap is the image limit plus room for the form fields
+MULTIPART_OVERHEAD_BYTES = int(os.getenv("MULTIPART_OVERHEAD_BYTES", 64 * 1024))
+MAX_IMPORT_BYTES = int(os.getenv("MAX_IMPORT_BYTES", 512 * 1024 * 1024))
+
+# Background image processing
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", 2))
+IMAGE_QUEUE_SIZE = int(os.getenv("IMAGE_QUEUE_SIZE", 200))
+
+# Public listing response cache: "memory" or "none"
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", 30))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 1000))
+
+# Bulk moderation
+BULK_MODERATION_MAX = int(os.getenv("BULK_MODERATION_MAX", 1000))
+
+# Live item events (server-sent events)
+EVENT_BUFFER_SIZE = int(os.getenv("EVENT_BUFFER_SIZE", 32))
+EVENT_HEARTBEAT_SECONDS = int(os.getenv("EVENT_HEARTBEAT_SECONDS", 15))
+# Lifetime of the single-use ticket a client redeems to open the event stream
+EVENT_TICKET_TTL_SECONDS = int(os.getenv("EVENT_TICKET_TTL_SECONDS", 60))
+# Feed events from a MongoDB change stream (needs a replica set) instead of from the routes
+EVENTS_FROM_CHANGE_STREAM = os.getenv("EVENTS_FROM_CHANGE_STREAM", "false").lower() == "true"
+
+# Lost <-> found matching
+MATCH_DATE_WINDOW_DAYS = int(os.getenv("MATCH_DATE_WINDOW_DAYS", 30))
+MATCH_MIN_SCORE = float(os.getenv("MATCH_MIN_SCORE", 0.15))
+MATCH_MAX_RESULTS = int(os.getenv("MATCH_MAX_RESULTS", 20))
+# Words shared by more items than this in a block ("black", "bag") don't pull in candidates
+MATCH_MAX_POSTING = int(os.getenv("MATCH_MAX_POSTING", 200))
+
+# Observability: sampling profiler endpoint is off unless explicitly enabled
+PROFILER_ENABLED = os.getenv("PROFILER_ENABLED", "false").lower() == "true"
+PROFILER_INTERVAL_MS = int(os.getenv("PROFILER_INTERVAL_MS", 5))
+
+# Precomputed item counters: how often to re-check them against the collection
+STATS_RECONCILE_SECONDS = int(os.getenv("STATS_RECONCILE_SECONDS", 300))
+
+# Bulk item import (CSV/NDJSON + zip of images)
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 500))
+IMPORT_IMAGE_CONCURRENCY = int(os.getenv("IMPORT_IMAGE_CONCURRENCY", 8))
+
+# Archival of resolved items to the items_archive collection (age <= 0 disables a status)
+ARCHIVE_ENABLED = os.getenv("ARCHIVE_ENABLED", "true").lower() == "true"
+ARCHIVE_REJECTED_AFTER_DAYS = int(os.getenv("ARCHIVE_REJECTED_AFTER_DAYS", 30))
+ARCHIVE_APPROVED_AFTER_DAYS = int(os.getenv("ARCHIVE_APPROVED_AFTER_DAYS", 180))
+ARCHIVE_INTERVAL_SECONDS = int(os.getenv("ARCHIVE_INTERVAL_SECONDS", 3600))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", 500))
+# What happens to archived items' images: "keep", "delete" or "move" (to ARCHIVE_IMAGE_DIR)
+ARCHIVE_IMAGE_POLICY = os.getenv("ARCHIVE_IMAGE_POLICY", "keep")
+ARCHIVE_IMAGE_DIR = os.getenv("ARCHIVE_IMAGE_DIR", "")
+
+# Visual similarity (perceptual hashes); distance is pHash + dHash Hamming bits, out of 128
+IMAGE_SIMILARITY_MAX_DISTANCE = int(os.getenv("IMAGE_SIMILARITY_MAX_DISTANCE", 24))
+IMAGE_SIMILARITY_MAX_RESULTS = int(os.getenv("IMAGE_SIMILARITY_MAX_RESULTS", 10))
+
+# Admission control. Keys are "METHOD /path" (a trailing * matches a path prefix).
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+# Max requests in flight per route across all clients; beyond that requests are shed with 503
+ROUTE_CONCURRENCY_LIMITS = json.loads(os.getenv("ROUTE_CONCURRENCY_LIMITS", json.dumps({
+    "POST /auth/login": 16,
+    "POST /auth/signup": 8,
+    "GET /items/search": 64,
+    "POST /items/submit": 32,
+    "POST /items/import": 2,
+})))
+# Per-client token buckets as [requests per second, burst]; beyond that requests get 429
+ROUTE_RATE_LIMITS = json.loads(os.getenv("ROUTE_RATE_LIMITS", json.dumps({
+    "POST /auth/login": [0.5, 10],
+    "POST /auth/signup": [0.1, 5],
+    "GET /items/search": [10, 30],
+    "GET /items/suggest": [20, 40],
+    "POST /items/submit": [0.5, 10],
+})))
+RATE_LIMIT_MAX_CLIENTS = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", 10000))
+# Only behind a trusted reverse proxy: take the client IP from X-Forwarded-For
+TRUST_FORWARDED_FOR = os.getenv("TRUST_FORWARDED_FOR", "false").lower() == "true"
@@ -0,0 +1,232 @@
+import asyncio
+import logging
+import os
+import re
+import shutil
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import BulkWriteError
+from starlette.concurrency import run_in_threadpool
+
+from fastapi_app.config import (
+    ARCHIVE_REJECTED_AFTER_DAYS, ARCHIVE_APPROVED_AFTER_DAYS, ARCHIVE_BATCH_SIZE,
+    ARCHIVE_IMAGE_POLICY, ARCHIVE_IMAGE_DIR
+)
+from fastapi_app.search.inverted_index import tokenize
+from fastapi_app.storage.renditions import rendition_paths
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_COLLECTION = "items_archive"
+
+# The archive serves include_archived listings, my-items and lookups by id
+ARCHIVE_INDEXES: List[IndexModel] = [
+    IndexModel(
+        [("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+        name="status_created_at"
+    ),
+    IndexModel(
+        [("submitted_by_key", ASCENDING), ("created_at", DESCENDING)],
+        name="submitted_by_key_created_at"
+    ),
+    IndexModel([("archived_at", DESCENDING)], name="archived_at"),
+]
+
+IMAGE_POLICIES = ("keep", "delete", "move")
+
+DUPLICATE_KEY = 11000
+
+# Photos stored or reused by an upload this recently are never retired
+RECENT_UPLOAD_SECONDS = 300
+
+
+def archive_policy() -> Dict[str, tuple]:
+    """status -> (timestamp field, age in days); a non-positive age disables that status."""
+    policy = {
+        "rejected": ("rejected_at", ARCHIVE_REJECTED_AFTER_DAYS),
+        "approved": ("approved_at", ARCHIVE_APPROVED_AFTER_DAYS),
+    }
+    return {status: rule for status, rule in policy.items() if rule[1] > 0}
+
+
+def archive_query(status: str, field: str, cutoff: datetime) -> dict:
+    """Items of `status` resolved before `cutoff` (falling back to created_at for legacy items)."""
+    return {
+        "status": status,
+        "$or": [
+            {field: {"$lt": cutoff}},
+            {field: None, "created_at": {"$lt": cutoff}},
+        ]
+    }
+
+
+async def search_archive(archive, keyword: str, query: dict, limit: int) -> list:
+    """Ids of archived items containing every keyword token, newest first.
+
+    The archive is outside the in-memory search index, so this is a plain
+    (unranked) regex scan; it only runs for include_archived searches.
+    """
+    tokens = tokenize(keyword)
+    if not tokens:
+        return []
+    conditions = [
+        {"$or": [{field: {"$regex": re.escape(tok), "$options": "i"}} for field in ("title", "description")]}
+        for tok in tokens
+    ]
+    cursor = archive.find({"$and": [query, *conditions]}, {"_id": 1}).sort("created_at", -1).limit(limit)
+    return [doc["_id"] async for doc in cursor]
+
+
+def image_files(doc: dict) -> List[str]:
+    """Relative paths of an item's original image and its renditions."""
+    if not doc.get("image_path"):
+        return []
+    return [doc["image_path"], *rendition_paths(doc["image_path"]).values()]
+
+
+def move_files(paths: List[str], src_dir: str, dest_dir: str) -> List[str]:
+    """Move the files that exist from `src_dir` to `dest_dir`; returns the relative paths moved.
+
+    An existing destination wins (it is the same content), and the source is dropped.
+    """
+    moved = []
+    for rel_path in paths:
+        src = os.path.join(src_dir, rel_path)
+        if not os.path.exists(src):
+            continue
+        dest = os.path.join(dest_dir, rel_path)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        if os.path.exists(dest):
+            os.remove(src)
+        else:
+            shutil.move(src, dest)
+        moved.append(rel_path)
+    return moved
+
+
+def touched_since(paths: List[str], folder: str, since: float) -> bool:
+    """Whether any of the files was modified at or after `since` (a time.time() value)."""
+    for rel_path in paths:
+        path = os.path.join(folder, rel_path)
+        if os.path.exists(path) and os.path.getmtime(path) >= since:
+            return True
+    return False
+
+
+def retire_files(paths: List[str], upload_folder: str, policy: str, cold_dir: str) -> int:
+    """Delete or move image files out of the upload folder (blocking; run in a thread)."""
+    retired = 0
+    for rel_path in paths:
+        src = os.path.join(upload_folder, rel_path)
+        if not os.path.exists(src):
+            continue
+        if policy == "move":
+            dest = os.path.join(cold_dir, rel_path)
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            shutil.move(src, dest)
+        else:
+            os.remove(src)
+        retired += 1
+    return retired
+
+
+class Archiver:
+    """Moves resolved items from the hot `items` collection to `items_archive`.
+
+    Each batch is copied before it is deleted, so a crash mid-batch leaves an
+    item in both collections (reads de-duplicate, and the next run finishes
+    the move) rather than in neither.
+    """
+
+    def __init__(self, items, archive, upload_folder: str, image_policy: str = ARCHIVE_IMAGE_POLICY,
+                 cold_dir: Optional[str] = None, batch_size: int = ARCHIVE_BATCH_SIZE):
+        if image_policy not in IMAGE_POLICIES:
+            raise ValueError(f"Unknown ARCHIVE_IMAGE_POLICY '{image_policy}' (expected one of {IMAGE_POLICIES})")
+        self.items = items
+        self.archive = archive
+        self.upload_folder = upload_folder
+        self.image_policy = image_policy
+        self.cold_dir = cold_dir or ARCHIVE_IMAGE_DIR or os.path.join(os.path.dirname(upload_folder), "uploads_archive")
+        self.staging_dir = os.path.join(os.path.dirname(upload_folder), "uploads_retiring")
+        self.batch_size = batch_size
+
+    async def move_batch(self, docs: List[dict], now: datetime) -> None:
+        for doc in docs:
+            doc["archived_at"] = now
+            if doc.get("image_path") and self.image_policy != "keep":
+                doc["image_store"] = "cold" if self.image_policy == "move" else "deleted"
+        try:
+            await self.archive.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            # Already archived by an earlier, interrupted run: fine; anything else is not
+            if any(err["code"] != DUPLICATE_KEY for err in e.details["writeErrors"]):
+                raise
+        await self.items.delete_many({"_id": {"$in": [doc["_id"] for doc in docs]}})
+
+    async def referenced(self, image_path: str) -> bool:
+        return await self.items.find_one({"image_path": image_path}, {"_id": 1}) is not None
+
+    async def retire_images(self, docs: List[dict]) -> int:
+        """Apply the image policy, skipping files that a hot item still references (uploads are deduplicated).
+
+        A new upload of the same photo can claim the file between the reference
+        check and its removal, so files are first moved aside, then checked
+        again: a photo that gained a reference, or that an upload stored or
+        reused recently (uploads refresh the mtime), is put back. An upload
+        that finds the file already moved aside simply stores it again.
+        """
+        if self.image_policy == "keep":
+            return 0
+        recent = time.time() - RECENT_UPLOAD_SECONDS
+        staged = {}
+        for image_path in {doc["image_path"] for doc in docs if doc.get("image_path")}:
+            if await self.referenced(image_path):
+                continue
+            files = image_files({"image_path": image_path})
+            staged[image_path] = await run_in_threadpool(move_files, files, self.upload_folder, self.staging_dir)
+
+        retired = 0
+        for image_path, files in staged.items():
+            if await self.referenced(image_path) or \
+                    await run_in_threadpool(touched_since, files, self.staging_dir, recent):
+                await run_in_threadpool(move_files, files, self.staging_dir, self.upload_folder)
+                continue
+            retired += await run_in_threadpool(retire_files, files, self.staging_dir, self.image_policy, self.cold_dir)
+        return retired
+
+    async def run(self, now: Optional[datetime] = None, on_archived=None) -> Dict[str, int]:
+        """Archive everything the policy says is due; returns counts per status.
+
+        `on_archived(docs)` is called after each batch so in-process indexes can drop them.
+        """
+        now = now or datetime.utcnow()
+        moved = {}
+        for status, (field, days) in archive_policy().items():
+            query = archive_query(status, field, now - timedelta(days=days))
+            moved[status] = 0
+            while True:
+                docs = await self.items.find(query).limit(self.batch_size).to_list(length=self.batch_size)
+                if not docs:
+                    break
+                await self.move_batch(docs, now)
+                if on_archived:
+                    await on_archived(docs)
+                try:
+                    await self.retire_images(docs)
+                except OSError as e:
+                    logger.error(f"Archival: could not retire images: {e}")
+                moved[status] += len(docs)
+        if any(moved.values()):
+            logger.info(f"🧊 Archived resolved items: {moved}")
+        return moved
+
+    async def run_forever(self, interval: int, on_archived=None) -> None:
+        while True:
+            try:
+                await self.run(on_archived=on_archived)
+            except Exception as e:
+                logger.error(f"Archival run failed: {e}")
+            await asyncio.sleep(interval)
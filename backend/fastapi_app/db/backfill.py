@@ -0,0 +1,81 @@
+import logging
+
+from pymongo import UpdateOne
+
+from fastapi_app.search.suggest import normalise
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def submitted_by_key(username: str) -> str:
+    """Canonical form of a username for exact-match lookups: trimmed and case-folded."""
+    return username.strip().casefold()
+
+
+def filter_key(value) -> str:
+    """Canonical form of a category or location for exact-match search filters.
+
+    Same normalisation as the typeahead, so a suggested value always filters.
+    """
+    return normalise(value if isinstance(value, str) else None)
+
+
+def filter_keys(item: dict) -> dict:
+    return {"category_key": filter_key(item.get("category")), "location_key": filter_key(item.get("location"))}
+
+
+async def backfill_submitted_by_key(collection, batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """Add `submitted_by_key` to items stored before it existed. Returns the number of items updated.
+
+    Safe to re-run: only documents still missing the key are touched.
+    """
+    updated = 0
+    while True:
+        docs = await collection.find(
+            {"submitted_by_key": None, "submitted_by": {"$type": "string"}},
+            {"submitted_by": 1}
+        ).limit(batch_size).to_list(length=batch_size)
+        if not docs:
+            break
+        result = await collection.bulk_write(
+            [
+                UpdateOne({"_id": doc["_id"]}, {"$set": {"submitted_by_key": submitted_by_key(doc["submitted_by"])}})
+                for doc in docs
+            ],
+            ordered=False
+        )
+        updated += result.modified_count
+        if len(docs) < batch_size:
+            break
+    logger.info(f"🧹 submitted_by_key backfill finished: {updated} items updated")
+    return updated
+
+
+async def backfill_filter_keys(collection, batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """Add `category_key`/`location_key` to items stored before they existed. Returns the number updated."""
+    updated = 0
+    while True:
+        docs = await collection.find(
+            {"$or": [{"category_key": None}, {"location_key": None}]},
+            {"category": 1, "location": 1}
+        ).limit(batch_size).to_list(length=batch_size)
+        if not docs:
+            break
+        result = await collection.bulk_write(
+            [UpdateOne({"_id": doc["_id"]}, {"$set": filter_keys(doc)}) for doc in docs],
+            ordered=False
+        )
+        updated += result.modified_count
+        if len(docs) < batch_size:
+            break
+    logger.info(f"🧹 Filter key backfill for '{collection.name}' finished: {updated} items updated")
+    return updated
+
+
+async def backfill_keys(items, archive) -> None:
+    """Every one-shot key backfill, in turn (the archive is searched with include_archived)."""
+    await backfill_submitted_by_key(items)
+    await backfill_filter_keys(items)
+    await backfill_filter_keys(archive)
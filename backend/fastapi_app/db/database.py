@@ -1,12 +1,84 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from fastapi_app.config import (
+    DATABASE_URL, ASYNC_DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT,
+    SQLITE_BUSY_TIMEOUT_MS
+)
+import logging
+import time
 
-DATABASE_URL = "sqlite:///./fastapi_app/db/app.db"
+logger = logging.getLogger(__name__)
 
-engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False}
-)  # Example for SQLite, change as needed]
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
\ No newline at end of file
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _apply_sqlite_pragmas(sync_engine):
+    """WAL lets readers run alongside the single writer; busy_timeout makes writers wait instead of failing."""
+    @event.listens_for(sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
+# Sessions are bound to an engine when one is created (see below), not at import
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
+
+def create_sync_engine():
+    """Sync engine for init_db and other offline tooling."""
+    engine = create_engine(
+        DATABASE_URL, connect_args={"check_same_thread": False} if _is_sqlite(DATABASE_URL) else {}
+    )
+    if _is_sqlite(DATABASE_URL):
+        _apply_sqlite_pragmas(engine)
+    SessionLocal.configure(bind=engine)
+    return engine
+
+
+class UsersDatabase:
+    """Owns the async engine used by the request path (auth routes and get_current_user).
+
+    Created and disposed by the app lifespan, so each worker opens its own
+    pool on its own event loop and nothing is left open across reloads.
+    """
+
+    def __init__(self, url: str = ASYNC_DATABASE_URL):
+        self.url = url
+        self.engine = None
+
+    async def connect(self):
+        if self.engine is None:
+            self.engine = create_async_engine(
+                self.url,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_timeout=DB_POOL_TIMEOUT,
+                pool_pre_ping=True,
+            )
+            if _is_sqlite(self.url):
+                _apply_sqlite_pragmas(self.engine.sync_engine)
+            AsyncSessionLocal.configure(bind=self.engine)
+        # Warm-up: open the first pooled connection before traffic arrives
+        started = time.perf_counter()
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        logger.info(f"🗄️ Users DB connected in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return self.engine
+
+    async def close(self) -> None:
+        if self.engine is not None:
+            await self.engine.dispose()
+            self.engine = None
+
+
+users_db = UsersDatabase()
+
+Base = declarative_base()
@@ -0,0 +1,111 @@
+import logging
+from typing import Dict, List
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+logger = logging.getLogger(__name__)
+
+# Indexes the app relies on. Names are fixed so reconciliation can tell
+# "missing" from "changed" and never touches indexes it does not own.
+ITEM_INDEXES: List[IndexModel] = [
+    # /items/approved, /items/pending: status filter + keyset sort (created_at, _id) desc
+    IndexModel(
+        [("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+        name="status_created_at"
+    ),
+    # distinct("submitted_by")
+    IndexModel(
+        [("submitted_by", ASCENDING), ("created_at", DESCENDING)],
+        name="submitted_by_created_at"
+    ),
+    # /items/my-items exact lookup on the normalised username
+    IndexModel(
+        [("submitted_by_key", ASCENDING), ("created_at", DESCENDING)],
+        name="submitted_by_key_created_at"
+    ),
+    # /items/search with category / date filters (exact match on the normalised category)
+    IndexModel(
+        [("status", ASCENDING), ("category_key", ASCENDING), ("date", DESCENDING)],
+        name="status_category_date"
+    ),
+    # /items/search with a location filter
+    IndexModel([("status", ASCENDING), ("location_key", ASCENDING)], name="status_location"),
+    # Incremental index sync: items moderated since the last sync (pending items have no stamp)
+    IndexModel([("moderated_at", ASCENDING)], name="moderated_at", sparse=True),
+    # Archival: is an (deduplicated) image file still used by a hot item? Items without a photo
+    # store image_path: None, which sparse would still index, so only string paths are indexed
+    IndexModel(
+        [("image_path", ASCENDING)], name="image_path",
+        partialFilterExpression={"image_path": {"$type": "string"}}
+    ),
+]
+
+# Index options that change what an index covers; a difference means it must be rebuilt
+INDEX_OPTIONS = ("unique", "sparse", "partialFilterExpression")
+
+
+def _key_of(spec) -> list:
+    return [(field, direction) for field, direction in spec]
+
+
+def _options_of(info: dict) -> dict:
+    return {name: info[name] for name in INDEX_OPTIONS if info.get(name)}
+
+
+async def ensure_indexes(collection, declared: List[IndexModel] = ITEM_INDEXES) -> Dict[str, str]:
+    """Create missing indexes and rebuild ones whose keys or options changed. Safe to run on every startup.
+
+    Returns a name -> action map ("ok", "created" or "rebuilt").
+    """
+    existing = await collection.index_information()
+    actions: Dict[str, str] = {}
+    to_create: List[IndexModel] = []
+
+    for model in declared:
+        name = model.document["name"]
+        wanted = _key_of(model.document["key"].items())
+        current = existing.get(name)
+        if current is None:
+            actions[name] = "created"
+            to_create.append(model)
+        elif _key_of(current["key"]) != wanted or _options_of(current) != _options_of(model.document):
+            logger.warning(
+                f"🛠️ Index '{name}' changed from {current['key']} {_options_of(current)} "
+                f"to {wanted} {_options_of(model.document)}; rebuilding"
+            )
+            await collection.drop_index(name)
+            actions[name] = "rebuilt"
+            to_create.append(model)
+        else:
+            actions[name] = "ok"
+
+    if to_create:
+        await collection.create_indexes(to_create)
+    logger.info(f"📇 Index reconciliation for '{collection.name}': {actions}")
+    return actions
+
+
+async def index_report(collection, declared: List[IndexModel] = ITEM_INDEXES) -> dict:
+    """Describe declared vs. actual indexes, with usage counters when the server provides them."""
+    existing = await collection.index_information()
+    usage: Dict[str, int] = {}
+    try:
+        async for stat in collection.aggregate([{"$indexStats": {}}]):
+            usage[stat["name"]] = stat.get("accesses", {}).get("ops", 0)
+    except Exception as e:
+        logger.debug(f"$indexStats unavailable: {e}")
+
+    declared_names = {model.document["name"] for model in declared}
+    indexes = []
+    for name, info in existing.items():
+        indexes.append({
+            "name": name,
+            "key": [[field, direction] for field, direction in info["key"]],
+            "managed": name in declared_names,
+            "ops": usage.get(name),
+        })
+    return {
+        "collection": collection.name,
+        "indexes": indexes,
+        "missing": sorted(declared_names - set(existing)),
+    }
@@ -1,8 +1,8 @@
-from fastapi_app.db.database import Base, engine
+from fastapi_app.db.database import Base, create_sync_engine
 from fastapi_app.models.user_model import User
 
 def create_tables():
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=create_sync_engine())
 
 if __name__ == "__main__":
     create_tables()
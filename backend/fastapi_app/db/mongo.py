@@ -1,9 +1,77 @@
-from motor.motor_asyncio import AsyncIOMotorClient
-import os
-from dotenv import load_dotenv
+import logging
+import time
 
-load_dotenv()
+from fastapi_app.config import (
+    MONGO_URI, MONGO_DB_NAME, MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE, MONGO_MAX_IDLE_TIME_MS,
+    MONGO_CONNECT_TIMEOUT_MS, MONGO_SERVER_SELECTION_TIMEOUT_MS, MONGO_SOCKET_TIMEOUT_MS,
+    MONGO_WAIT_QUEUE_TIMEOUT_MS
+)
+from fastapi_app.metrics.instrumentation import MongoCommandTimer
 
-MONGO_DB_URL = os.getenv('MONGO_URI', 'mongodb://localhost:27017')
-client = AsyncIOMotorClient(MONGO_DB_URL)
-db = client["lost_and_found"]
+logger = logging.getLogger(__name__)
+
+
+class MongoConnection:
+    """Owns the Motor client. It is created in the app lifespan (so it binds to the
+    serving event loop and is closed on shutdown or reload), never at import."""
+
+    def __init__(self, url: str = MONGO_URI, name: str = MONGO_DB_NAME):
+        self.url = url
+        self.name = name
+        self.client = None
+        self.database = None
+
+    def attach(self, database) -> None:
+        """Use an existing database object (e.g. a mongomock stand-in) instead of connecting."""
+        self.database = database
+
+    async def connect(self) -> None:
+        if self.database is not None:
+            return
+        from motor.motor_asyncio import AsyncIOMotorClient
+        self.client = AsyncIOMotorClient(
+            self.url,
+            maxPoolSize=MONGO_MAX_POOL_SIZE,
+            minPoolSize=MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+            connectTimeoutMS=MONGO_CONNECT_TIMEOUT_MS,
+            serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+            socketTimeoutMS=MONGO_SOCKET_TIMEOUT_MS,
+            waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            event_listeners=[MongoCommandTimer()],
+        )
+        self.database = self.client[self.name]
+        # Warm-up: server selection and the first connection happen here, not on the first request
+        started = time.perf_counter()
+        await self.client.admin.command("ping")
+        logger.info(f"🍃 MongoDB connected in {(time.perf_counter() - started) * 1000:.0f} ms "
+                    f"(pool {MONGO_MIN_POOL_SIZE}-{MONGO_MAX_POOL_SIZE})")
+
+    def close(self) -> None:
+        # An attached database is not ours to close
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+            self.database = None
+
+
+mongo_connection = MongoConnection()
+
+
+class _Database:
+    """Module-level handle to the lifespan-managed database, so `from fastapi_app.db.mongo
+    import db` keeps working at import time; attribute access needs a connection."""
+
+    def _target(self):
+        if mongo_connection.database is None:
+            raise RuntimeError("MongoDB is not connected; the client is created in the app lifespan")
+        return mongo_connection.database
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+    def __getitem__(self, name):
+        return self._target()[name]
+
+
+db = _Database()
@@ -0,0 +1,269 @@
+import asyncio
+import base64
+import json
+from collections import Counter
+from datetime import datetime
+from typing import AsyncIterator, Callable, List, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from fastapi_app.schemas.item_serializer import dumps
+
+# Newest first; _id breaks ties between items created in the same instant
+SORT_ORDER = [("created_at", -1), ("_id", -1)]
+
+
+class InvalidCursor(ValueError):
+    """Raised when an `after` cursor cannot be decoded."""
+
+
+def encode_cursor(item: dict) -> str:
+    """Build an opaque cursor pointing just past `item`."""
+    created_at = item.get("created_at")
+    payload = {
+        "c": created_at.isoformat() if isinstance(created_at, datetime) else None,
+        "i": str(item["_id"]),
+    }
+    return _encode_payload(payload)
+
+
+def _decode_payload(cursor: str) -> dict:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+
+def _encode_payload(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Turn a cursor back into a Mongo filter selecting the items after it."""
+    try:
+        payload = _decode_payload(cursor)
+        item_id = ObjectId(payload["i"])
+        created_at = datetime.fromisoformat(payload["c"]) if payload.get("c") else None
+    except (ValueError, KeyError, TypeError, InvalidId) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor}") from e
+
+    if created_at is None:
+        # Legacy documents without created_at sort last; page through them by _id
+        return {"created_at": None, "_id": {"$lt": item_id}}
+    return {
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": item_id}},
+            {"created_at": None},
+        ]
+    }
+
+
+def _apply_cursor(query: dict, after: Optional[str]) -> dict:
+    if not after:
+        return query
+    return {"$and": [query, decode_cursor(after)]}
+
+
+def _as_list(collection) -> list:
+    """The read helpers accept one collection or a list of them read as one (e.g. hot + archive)."""
+    return list(collection) if isinstance(collection, (list, tuple)) else [collection]
+
+
+def _sort_key(doc: dict) -> tuple:
+    # Python equivalent of SORT_ORDER (descending when reversed; missing created_at sorts last)
+    created_at = doc.get("created_at")
+    return (created_at is not None, created_at or datetime.min, doc["_id"])
+
+
+async def paginate(collection, query: dict, limit: int, after: Optional[str] = None,
+                   formatter: Callable[[dict], dict] = lambda it: it,
+                   projection: Optional[dict] = None) -> dict:
+    """Fetch one keyset page of `query`, returning items plus the cursor for the next page."""
+    collections = _as_list(collection)
+    # Ask for one extra document so we know whether another page exists
+    pages = await asyncio.gather(*(
+        coll.find(_apply_cursor(query, after), projection)
+        .sort(SORT_ORDER)
+        .limit(limit + 1)
+        .to_list(length=limit + 1)
+        for coll in collections
+    ))
+    docs = pages[0]
+    if len(pages) > 1:
+        # Same keyset in every collection, so merging the per-collection pages is exact;
+        # an item caught mid-move between collections is only listed once
+        merged = {doc["_id"]: doc for page in pages for doc in page}
+        docs = sorted(merged.values(), key=_sort_key, reverse=True)[:limit + 1]
+    has_more = len(docs) > limit
+    docs = docs[:limit]
+    next_cursor = encode_cursor(docs[-1]) if has_more and docs else None
+    return {"items": [formatter(doc) for doc in docs], "next_cursor": next_cursor}
+
+
+async def stream_ndjson(collection, query: dict, after: Optional[str] = None,
+                        formatter: Callable[[dict], dict] = lambda it: it,
+                        projection: Optional[dict] = None,
+                        batch_size: int = 100) -> AsyncIterator[bytes]:
+    """Yield every matching document as one JSON line, straight off the Motor cursor."""
+    collections = _as_list(collection)
+    if len(collections) > 1:
+        # Several collections: walk merged keyset pages instead of a single cursor
+        while True:
+            page = await paginate(collections, query, batch_size, after, formatter, projection)
+            for item in page["items"]:
+                yield dumps(item) + b"\n"
+            after = page["next_cursor"]
+            if not after:
+                return
+    cursor = collection.find(_apply_cursor(query, after), projection).sort(SORT_ORDER)
+    async for doc in cursor:
+        yield dumps(formatter(doc)) + b"\n"
+
+
+def decode_offset_cursor(cursor: str) -> int:
+    """Decode the position cursor used by relevance-ranked results."""
+    try:
+        offset = int(_decode_payload(cursor)["o"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor}") from e
+    if offset < 0:
+        raise InvalidCursor(f"Invalid cursor: {cursor}")
+    return offset
+
+
+async def _filter_ranked(collection, ranked_ids: List[ObjectId], query: dict) -> List[ObjectId]:
+    # One _id-indexed lookup applies the remaining filters; rank order is kept from ranked_ids
+    matching = set()
+    for coll in _as_list(collection):
+        matching.update([
+            doc["_id"] async for doc in coll.find({"$and": [query, {"_id": {"$in": ranked_ids}}]}, {"_id": 1})
+        ])
+    return [item_id for item_id in ranked_ids if item_id in matching]
+
+
+async def _fetch_ordered(collection, ids: List[ObjectId], projection: Optional[dict] = None) -> List[dict]:
+    by_id = {}
+    for coll in _as_list(collection):
+        for doc in await coll.find({"_id": {"$in": ids}}, projection).to_list(length=len(ids)):
+            by_id.setdefault(doc["_id"], doc)
+    return [by_id[item_id] for item_id in ids if item_id in by_id]
+
+
+async def paginate_ranked(collection, ranked_ids: List[ObjectId], query: dict, limit: int,
+                          after: Optional[str] = None,
+                          formatter: Callable[[dict], dict] = lambda it: it,
+                          projection: Optional[dict] = None) -> dict:
+    """Like `paginate`, but keeps the order of `ranked_ids` (e.g. search relevance)."""
+    offset = decode_offset_cursor(after) if after else 0
+    ordered = await _filter_ranked(collection, ranked_ids, query) if ranked_ids else []
+    page_ids = ordered[offset:offset + limit]
+    docs = await _fetch_ordered(collection, page_ids, projection) if page_ids else []
+    next_offset = offset + limit
+    next_cursor = _encode_payload({"o": next_offset}) if next_offset < len(ordered) else None
+    return {"items": [formatter(doc) for doc in docs], "next_cursor": next_cursor}
+
+
+async def stream_ranked_ndjson(collection, ranked_ids: List[ObjectId], query: dict,
+                               after: Optional[str] = None,
+                               formatter: Callable[[dict], dict] = lambda it: it,
+                               projection: Optional[dict] = None,
+                               batch_size: int = 100) -> AsyncIterator[bytes]:
+    """NDJSON counterpart of `paginate_ranked`, fetching documents a batch at a time."""
+    offset = decode_offset_cursor(after) if after else 0
+    ordered = await _filter_ranked(collection, ranked_ids, query) if ranked_ids else []
+    for start in range(offset, len(ordered), batch_size):
+        for doc in await _fetch_ordered(collection, ordered[start:start + batch_size], projection):
+            yield dumps(formatter(doc)) + b"\n"
+
+
+# Faceted search: counts per category / location / week of the item date
+FACET_LIMIT = 20
+WEEK_LIMIT = 52
+_EPOCH_MONDAY = datetime(1970, 1, 5)
+_WEEK_MS = 7 * 24 * 3600 * 1000
+
+
+def _count_by(field: str) -> list:
+    return [
+        {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+        {"$sort": {"count": -1, "_id": 1}},
+        {"$limit": FACET_LIMIT},
+    ]
+
+
+def facet_stages() -> dict:
+    """$facet sub-pipelines for the counts shown next to search results."""
+    return {
+        "category": _count_by("category"),
+        "location": _count_by("location"),
+        # Week buckets start on Monday: date - ((date - a Monday) mod one week)
+        "week": [
+            {"$match": {"date": {"$type": "date"}}},
+            {"$group": {
+                "_id": {"$subtract": ["$date", {"$mod": [{"$subtract": ["$date", _EPOCH_MONDAY]}, _WEEK_MS]}]},
+                "count": {"$sum": 1},
+            }},
+            {"$sort": {"_id": -1}},
+            {"$limit": WEEK_LIMIT},
+        ],
+        "total": [{"$count": "count"}],
+    }
+
+
+def _merge_facets(results: List[dict]) -> dict:
+    """Combine per-collection facet output into {"category": [{value, count}], ..., "total": n}."""
+    merged = {}
+    for name in ("category", "location"):
+        counts = Counter()
+        for result in results:
+            counts.update({row["_id"]: row["count"] for row in result[name] if row["_id"] is not None})
+        merged[name] = [{"value": value, "count": n} for value, n in counts.most_common(FACET_LIMIT)]
+    weeks = Counter()
+    for result in results:
+        weeks.update({row["_id"]: row["count"] for row in result["week"]})
+    merged["week"] = [
+        {"week_of": week.date().isoformat(), "count": weeks[week]}
+        for week in sorted(weeks, reverse=True)[:WEEK_LIMIT]
+    ]
+    merged["total"] = sum(result["total"][0]["count"] if result["total"] else 0 for result in results)
+    return merged
+
+
+async def facet_counts(collection, query: dict) -> dict:
+    """Facet counts for `query` (one aggregation per collection), without a page of results."""
+    results = await asyncio.gather(*(
+        coll.aggregate([{"$match": query}, {"$facet": facet_stages()}]).to_list(length=1)
+        for coll in _as_list(collection)
+    ))
+    return _merge_facets([rows[0] for rows in results])
+
+
+async def paginate_faceted(collection, query: dict, limit: int, after: Optional[str] = None,
+                           formatter: Callable[[dict], dict] = lambda it: it,
+                           projection: Optional[dict] = None) -> dict:
+    """`paginate` plus facet counts, both from a single $facet aggregation per collection.
+
+    The counts cover every match of `query`; only the page honours the `after` cursor.
+    """
+    page_stages = [{"$sort": dict(SORT_ORDER)}, {"$limit": limit + 1}]
+    if after:
+        page_stages.insert(0, {"$match": decode_cursor(after)})
+    if projection:
+        page_stages.append({"$project": projection})
+    results = await asyncio.gather(*(
+        coll.aggregate([{"$match": query}, {"$facet": {"page": page_stages, **facet_stages()}}]).to_list(length=1)
+        for coll in _as_list(collection)
+    ))
+    results = [rows[0] for rows in results]
+
+    merged = {doc["_id"]: doc for result in results for doc in result["page"]}
+    docs = sorted(merged.values(), key=_sort_key, reverse=True)[:limit + 1]
+    has_more = len(docs) > limit
+    docs = docs[:limit]
+    next_cursor = encode_cursor(docs[-1]) if has_more and docs else None
+    return {
+        "items": [formatter(doc) for doc in docs],
+        "next_cursor": next_cursor,
+        "facets": _merge_facets(results),
+    }
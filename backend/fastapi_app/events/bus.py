@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional, Set
+
+from fastapi_app.config import EVENT_BUFFER_SIZE, EVENTS_FROM_CHANGE_STREAM
+
+logger = logging.getLogger(__name__)
+
+# Events anyone may see; everything else (e.g. new pending submissions) is admin-only
+PUBLIC_EVENTS = {"item.approved", "item.withdrawn"}
+
+
+class Subscription:
+    """One connected client. Its buffer is bounded: when a slow client falls
+    behind, the oldest events are dropped and the client is told to resync."""
+
+    def __init__(self, admin: bool, buffer_size: int = EVENT_BUFFER_SIZE):
+        self.admin = admin
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self.lagged = False
+
+    def offer(self, event: dict) -> None:
+        if not self.admin and event["event"] not in PUBLIC_EVENTS:
+            return
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.lagged = True
+        self.queue.put_nowait(event)
+
+    async def next(self, timeout: float) -> Optional[dict]:
+        """Wait for the next event; None on timeout. A resync marker comes first after overflow."""
+        if self.lagged:
+            self.lagged = False
+            # Anything still buffered is superseded by the resync
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            return {"event": "resync", "data": {}}
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBus:
+    """In-process fan-out of item lifecycle events to connected clients."""
+
+    def __init__(self):
+        self._subscribers: Set[Subscription] = set()
+        self.published = 0
+
+    def subscribe(self, admin: bool = False) -> Subscription:
+        sub = Subscription(admin)
+        self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        self._subscribers.discard(sub)
+
+    def publish(self, event: str, item: dict) -> None:
+        payload = {
+            "event": event,
+            "data": {
+                "id": str(item["_id"]),
+                "title": item.get("title"),
+                "type": item.get("type"),
+                "category": item.get("category"),
+                "status": item.get("status"),
+                "at": datetime.utcnow().isoformat(),
+            },
+        }
+        self.published += 1
+        for sub in list(self._subscribers):
+            sub.offer(payload)
+
+    def stats(self) -> dict:
+        return {"subscribers": len(self._subscribers), "published": self.published}
+
+
+event_bus = EventBus()
+
+
+def emit_item_event(event: str, item: dict) -> None:
+    """Publish from a route. When the change stream feeds the bus it already sees every write."""
+    if not EVENTS_FROM_CHANGE_STREAM:
+        event_bus.publish(event, item)
+
+
+async def watch_item_changes(collection) -> None:
+    """Publish item events from a MongoDB change stream so every worker sees every write."""
+    pipeline = [{"$match": {"operationType": {"$in": ["insert", "update"]}}}]
+    async with collection.watch(pipeline, full_document="updateLookup") as stream:
+        logger.info("📡 Item change stream connected")
+        async for change in stream:
+            item = change.get("fullDocument")
+            if not item:
+                continue
+            if change["operationType"] == "insert":
+                event_bus.publish("item.submitted", item)
+                continue
+            updated = change.get("updateDescription", {}).get("updatedFields", {})
+            if updated.get("status") == "approved":
+                event_bus.publish("item.approved", item)
+            elif updated.get("status") == "rejected":
+                # No pre-image here; an approved_at stamp means the item had been public
+                event_bus.publish("item.withdrawn" if item.get("approved_at") else "item.rejected", item)
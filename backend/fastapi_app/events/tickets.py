@@ -0,0 +1,35 @@
+import secrets
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from pymongo import ASCENDING, IndexModel
+
+from fastapi_app.config import EVENT_TICKET_TTL_SECONDS
+
+# EventSource cannot send an Authorization header, and the API token must not
+# travel in a URL (it ends up in access logs and browser history). Instead an
+# authenticated client trades its token for a ticket: random, single-use and
+# short-lived, valid only for opening the event stream. Tickets are kept in
+# MongoDB so the stream can be opened on any worker.
+TICKETS_COLLECTION = "event_tickets"
+
+TICKET_INDEXES: List[IndexModel] = [
+    # MongoDB drops tickets that were never redeemed once they expire
+    IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+]
+
+
+async def issue_ticket(collection, principal: dict, ttl: int = EVENT_TICKET_TTL_SECONDS) -> str:
+    ticket = secrets.token_urlsafe(32)
+    await collection.insert_one({
+        "_id": ticket,
+        "username": principal["username"],
+        "role": principal.get("role"),
+        "expires_at": datetime.utcnow() + timedelta(seconds=ttl),
+    })
+    return ticket
+
+
+async def redeem_ticket(collection, ticket: str) -> Optional[dict]:
+    """The ticket's holder, or None if it is unknown, used or expired. A ticket works once."""
+    return await collection.find_one_and_delete({"_id": ticket, "expires_at": {"$gt": datetime.utcnow()}})
@@ -0,0 +1,186 @@
+import asyncio
+import codecs
+import csv
+import logging
+import zipfile
+from datetime import datetime
+from itertools import islice
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
+
+import orjson
+from pydantic import ValidationError
+from pymongo.errors import BulkWriteError
+from starlette.concurrency import run_in_threadpool
+
+from fastapi_app.config import IMPORT_BATCH_SIZE, IMPORT_IMAGE_CONCURRENCY
+from fastapi_app.db.backfill import submitted_by_key, filter_keys
+from fastapi_app.schemas.item_schema import ItemCreate
+from fastapi_app.storage.uploads import store_archive_member
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("csv", "ndjson")
+# (row number, parsed row or None, parse error or None)
+RawRow = Tuple[int, Optional[dict], Optional[str]]
+
+
+def detect_format(filename: str, declared: Optional[str]) -> Optional[str]:
+    if declared:
+        return declared.lower() if declared.lower() in FORMATS else None
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    return None
+
+
+def iter_rows(fileobj, fmt: str) -> Iterator[RawRow]:
+    """Lazily parse an uploaded CSV (with a header row) or NDJSON file, one row at a time."""
+    if fmt == "csv":
+        reader = csv.DictReader(codecs.iterdecode(fileobj, "utf-8-sig"))
+        for number, row in enumerate(reader, 1):
+            yield number, {k: v for k, v in row.items() if k is not None}, None
+        return
+    number = 0
+    for line in fileobj:
+        if number == 0:
+            line = line.removeprefix(codecs.BOM_UTF8)
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            row = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            yield number, None, f"invalid JSON: {e}"
+            continue
+        if not isinstance(row, dict):
+            yield number, None, "expected a JSON object"
+            continue
+        yield number, row, None
+
+
+def validation_errors(error: ValidationError) -> List[str]:
+    return [f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in error.errors()]
+
+
+class ItemImporter:
+    """Streams rows into `collection` in batches of `batch_size`, copying any
+    referenced images out of `archive` with at most `image_concurrency`
+    writes in flight. Memory is bounded by one batch, whatever the upload size.
+    """
+
+    def __init__(self, collection, upload_folder: str, submitted_by: str,
+                 archive: Optional[zipfile.ZipFile] = None,
+                 batch_size: int = IMPORT_BATCH_SIZE, image_concurrency: int = IMPORT_IMAGE_CONCURRENCY):
+        self.collection = collection
+        self.upload_folder = upload_folder
+        self.submitted_by = submitted_by
+        self.archive = archive
+        self.batch_size = batch_size
+        self.image_slots = asyncio.Semaphore(image_concurrency)
+        self.totals = {"inserted": 0, "invalid": 0, "failed": 0}
+        self.inserted: List[dict] = []  # documents inserted by the last batch
+
+    def build_item(self, item: ItemCreate) -> dict:
+        doc = {
+            "title": item.title.strip(),
+            "description": item.description.strip(),
+            "category": item.category.strip(),
+            "location": item.location.strip(),
+            "type": item.type.strip(),
+            "date": item.date,
+            "status": "pending",
+            "created_at": datetime.utcnow(),
+            "image_path": None,
+            "image_sha256": None,
+            "submitted_by": self.submitted_by.strip(),
+            "submitted_by_key": submitted_by_key(self.submitted_by)
+        }
+        doc.update(filter_keys(doc))
+        return doc
+
+    async def store_image(self, name: str, doc: dict) -> Optional[str]:
+        """Copy one archive member into the upload folder; returns an error message on failure."""
+        if self.archive is None:
+            return f"image '{name}' given but no archive uploaded"
+        async with self.image_slots:
+            try:
+                stored = await run_in_threadpool(store_archive_member, self.archive, name, self.upload_folder)
+            except KeyError:
+                return f"image '{name}' not found in archive"
+            except (ValueError, zipfile.BadZipFile, OSError) as e:
+                return f"image '{name}': {e}"
+        doc["image_path"], doc["image_sha256"] = stored.path, stored.sha256
+        return None
+
+    async def import_batch(self, batch: List[RawRow]) -> List[dict]:
+        report = {}
+        pending = []  # (row number, doc, image name)
+        for number, raw, error in batch:
+            if error:
+                report[number] = {"row": number, "status": "invalid", "errors": [error]}
+                continue
+            image = raw.get("image")
+            if image is not None and not isinstance(image, str):
+                report[number] = {"row": number, "status": "invalid", "errors": ["image: must be a file name"]}
+                continue
+            try:
+                item = ItemCreate(**raw)
+            except ValidationError as e:
+                report[number] = {"row": number, "status": "invalid", "errors": validation_errors(e)}
+                continue
+            pending.append((number, self.build_item(item), (image or "").strip()))
+
+        image_errors = await asyncio.gather(*(
+            self.store_image(image, doc) for _, doc, image in pending if image
+        ))
+        errors = iter(image_errors)
+        to_insert = []
+        for number, doc, image in pending:
+            error = next(errors) if image else None
+            if error:
+                report[number] = {"row": number, "status": "failed", "errors": [error]}
+            else:
+                to_insert.append((number, doc))
+
+        failed_at = {}
+        if to_insert:
+            try:
+                await self.collection.insert_many([doc for _, doc in to_insert], ordered=False)
+            except BulkWriteError as e:
+                failed_at = {err["index"]: err.get("errmsg", "write failed") for err in e.details["writeErrors"]}
+
+        for index, (number, doc) in enumerate(to_insert):
+            if index in failed_at:
+                report[number] = {"row": number, "status": "failed", "errors": [failed_at[index]]}
+            else:
+                report[number] = {"row": number, "status": "inserted", "id": str(doc["_id"])}
+                self.inserted.append(doc)
+
+        for entry in report.values():
+            self.totals[entry["status"]] += 1
+        return [report[number] for number, _, _ in batch]
+
+    async def run(self, rows: Iterator[RawRow]) -> AsyncIterator[List[dict]]:
+        """Yield the report for each batch as soon as it has been written."""
+        while True:
+            self.inserted = []
+            try:
+                batch = await run_in_threadpool(lambda: list(islice(rows, self.batch_size)))
+            except (UnicodeDecodeError, csv.Error) as e:
+                # Rows already reported stay imported; the rest of the file is unreadable
+                yield [{"status": "aborted", "errors": [f"unreadable input: {e}"]}]
+                break
+            if not batch:
+                break
+            try:
+                batch_report = await self.import_batch(batch)
+            except Exception as e:
+                # One bad batch must not end the stream: report its rows and carry on with the next
+                logger.error(f"Import batch starting at row {batch[0][0]} failed: {e}")
+                self.inserted = []
+                batch_report = [{"row": number, "status": "failed", "errors": ["batch failed"]} for number, _, _ in batch]
+                self.totals["failed"] += len(batch)
+            yield batch_report
+        logger.info(f"📥 Import by {self.submitted_by}: {self.totals}")
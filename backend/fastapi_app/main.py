@@ -1,11 +1,97 @@
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+import asyncio
+import logging
 import os
-from fastapi_app.routes import auth, items
+from fastapi_app.routes import auth, items, metrics
+from fastapi_app.db.mongo import db, mongo_connection
+from fastapi_app.db.database import users_db
+from fastapi_app.db.indexes import ensure_indexes
+from fastapi_app.db.backfill import backfill_keys
+from fastapi_app.db.archive import Archiver, ARCHIVE_COLLECTION, ARCHIVE_INDEXES
+from fastapi_app.matching.image_hash import backfill_image_hashes
+from fastapi_app.tasks.index_sync import index_sync, sync_indexes_forever
+from fastapi_app.stats.counters import item_stats
+from fastapi_app.auth.password_pool import password_pool
+from fastapi_app.storage.renditions import image_queue
+from fastapi_app.events.bus import watch_item_changes
+from fastapi_app.events.tickets import TICKETS_COLLECTION, TICKET_INDEXES
+from fastapi_app.config import EVENTS_FROM_CHANGE_STREAM, STATS_RECONCILE_SECONDS, INDEX_RESYNC_SECONDS, INDEX_REBUILD_SECONDS
+from fastapi_app.config import ARCHIVE_ENABLED, ARCHIVE_INTERVAL_SECONDS
+from fastapi_app.metrics.instrumentation import MetricsMiddleware, instrument_sqlalchemy
+from fastapi_app.admission.middleware import AdmissionMiddleware
+from fastapi_app.storage.uploads import BodySizeLimitMiddleware
+from fastapi_app.web.assets import static_assets
+from fastapi_app.cache.response_cache import response_cache, GENERATIONS_COLLECTION
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # ✅ Open (and ping) both database clients here, on the serving event loop, never at import
+    await asyncio.gather(mongo_connection.connect(), users_db.connect())
+    instrument_sqlalchemy(users_db.engine.sync_engine)
+    os.makedirs(items.UPLOAD_FOLDER, exist_ok=True)
+    logger.info(f"📂 Storage Config: Uploads will be saved to: {items.UPLOAD_FOLDER}")
+    # ✅ Load pages and pre-compressed CSS/JS into memory
+    static_assets.load(frontend_path)
+    # ✅ Make sure the hot item queries are index-backed
+    await ensure_indexes(db.items)
+    await ensure_indexes(db[ARCHIVE_COLLECTION], ARCHIVE_INDEXES)
+    await ensure_indexes(db[TICKETS_COLLECTION], TICKET_INDEXES)
+    # ✅ Keep response cache generations in MongoDB so invalidations reach every worker
+    response_cache.attach(db[GENERATIONS_COLLECTION])
+    # ✅ Build the in-memory indexes before serving traffic; they are independent, so load them together:
+    #    keyword search, category/location typeahead, lost <-> found candidates,
+    #    perceptual hashes of approved photos, and the item counters
+    await asyncio.gather(
+        index_sync.rebuild(db.items, db[ARCHIVE_COLLECTION]),
+        item_stats.startup(db.items, db[ARCHIVE_COLLECTION])
+    )
+    # ✅ Apply items moderated or archived through other workers, with an occasional full rebuild
+    resync_task = asyncio.create_task(
+        sync_indexes_forever(db.items, db[ARCHIVE_COLLECTION], INDEX_RESYNC_SECONDS, INDEX_REBUILD_SECONDS)
+    ) if INDEX_RESYNC_SECONDS > 0 else None
+    hash_backfill_task = asyncio.create_task(backfill_image_hashes(db.items, items.UPLOAD_FOLDER))
+    # ✅ Re-check the item counters periodically against the collection
+    stats_task = asyncio.create_task(
+        item_stats.reconcile_forever(db.items, STATS_RECONCILE_SECONDS, db[ARCHIVE_COLLECTION])
+    )
+    # ✅ One-shot background backfill of submitted_by_key and the search filter keys for older items
+    backfill_task = asyncio.create_task(backfill_keys(db.items, db[ARCHIVE_COLLECTION]))
+    # ✅ Periodically move old resolved items to the archive collection
+    archive_task = None
+    if ARCHIVE_ENABLED:
+        archiver = Archiver(db.items, db[ARCHIVE_COLLECTION], items.UPLOAD_FOLDER)
+        archive_task = asyncio.create_task(archiver.run_forever(ARCHIVE_INTERVAL_SECONDS, items.items_archived))
+    # ✅ Workers that build thumbnails for uploaded photos
+    image_queue.start()
+    # ✅ Optional: drive live events from the MongoDB change stream
+    change_stream_task = asyncio.create_task(watch_item_changes(db.items)) if EVENTS_FROM_CHANGE_STREAM else None
+    yield
+    # ✅ Stop background work and wait for it to unwind before the clients it uses are closed
+    background_tasks = [
+        task for task in (change_stream_task, resync_task, backfill_task, hash_backfill_task, stats_task, archive_task)
+        if task
+    ]
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await image_queue.stop()
+    await users_db.close()
+    mongo_connection.close()
+    password_pool.shutdown()
+
+app = FastAPI(lifespan=lifespan)
+
+# ✅ Cap upload request bodies while they stream in (413), before multipart parsing spools them
+app.add_middleware(BodySizeLimitMiddleware)
+# ✅ Shed excess load early: per-client rate limits (429) and per-route concurrency caps (503)
+app.add_middleware(AdmissionMiddleware)
+# ✅ Per-route latency and DB-call metrics (exposed at /metrics)
+app.add_middleware(MetricsMiddleware)
 
 # Allow frontend access
 app.add_middleware(
@@ -19,28 +105,37 @@ app.add_middleware(
 # ✅ REGISTER API ROUTES FIRST (before static files)
 app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 app.include_router(items.router, prefix="/items", tags=["Items"])
+app.include_router(metrics.router, tags=["Observability"])
 
 # ✅ Path setup
 root_path = os.path.join(os.path.dirname(__file__), "..", "..")
 frontend_path = os.path.join(root_path, "frontend")
 uploads_path = os.path.join(root_path, "uploads")
 
-# ✅ Serve specific static directories (NOT root)
-app.mount("/css", StaticFiles(directory=os.path.join(frontend_path, "css")), name="css")
-app.mount("/js", StaticFiles(directory=os.path.join(frontend_path, "js")), name="js")
-app.mount("/assets", StaticFiles(directory=os.path.join(frontend_path, "assets")), name="assets")
-app.mount("/images", StaticFiles(directory=uploads_path), name="images")
-
-# ✅ Serve HTML pages with explicit routes
-@app.get("/", response_class=HTMLResponse)
-def serve_login():
-    with open(os.path.join(frontend_path, "index.html")) as f:
-        return f.read()
-
-@app.get("/signup", response_class=HTMLResponse)
-def serve_signup():
-    with open(os.path.join(frontend_path, "signup.html")) as f:
-        return f.read()
+# ✅ CSS/JS/assets from memory: pre-compressed, fingerprinted URLs cached as immutable
+@app.api_route("/css/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+@app.api_route("/js/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+@app.api_route("/assets/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def serve_asset(request: Request, path: str):
+    return static_assets.asset_response(request)
+
+# The uploads folder is created in the lifespan, so don't require it at import
+app.mount("/images", StaticFiles(directory=uploads_path, check_dir=False), name="images")
+
+# ✅ Serve HTML pages from memory (read once at startup), revalidated by ETag
+@app.get("/", include_in_schema=False)
+async def serve_login(request: Request):
+    return static_assets.page_response(request, "/")
+
+@app.get("/signup", include_in_schema=False)
+async def serve_signup(request: Request):
+    return static_assets.page_response(request, "/signup")
+
+@app.get("/static/pages/{page}", include_in_schema=False)
+async def serve_dashboard(request: Request, page: str):
+    if request.url.path not in static_assets.pages:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return static_assets.page_response(request, request.url.path)
 
 # ✅ Mount static files at /static instead of root to avoid conflicts
 app.mount("/static", StaticFiles(directory=frontend_path, html=True), name="static_files")
\ No newline at end of file
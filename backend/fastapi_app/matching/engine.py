@@ -0,0 +1,186 @@
+import heapq
+import logging
+import math
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, Hashable, List, NamedTuple, Optional, Set, Tuple
+
+from fastapi_app.config import MATCH_DATE_WINDOW_DAYS, MATCH_MIN_SCORE, MATCH_MAX_RESULTS, MATCH_MAX_POSTING
+from fastapi_app.search.inverted_index import tokenize
+
+logger = logging.getLogger(__name__)
+
+OPPOSITE_TYPE = {"lost": "found", "found": "lost"}
+
+# How much each signal contributes to the final score (sums to 1)
+TEXT_WEIGHT = 0.6
+LOCATION_WEIGHT = 0.25
+DATE_WEIGHT = 0.15
+
+# Projection needed to build a candidate
+MATCH_FIELDS = {"type": 1, "category": 1, "location": 1, "date": 1, "title": 1, "description": 1}
+
+
+def category_key(category: Optional[str]) -> str:
+    return " ".join((category or "").casefold().split())
+
+
+class Candidate(NamedTuple):
+    id: Hashable
+    type: str
+    block: str
+    date: Optional[datetime]
+    bucket: Optional[int]   # date // window; None when the date is unknown
+    terms: Counter          # title/description term frequencies
+    location: frozenset     # location tokens
+
+
+def make_candidate(item: dict, window_days: int = MATCH_DATE_WINDOW_DAYS) -> Optional[Candidate]:
+    item_type = (item.get("type") or "").strip().lower()
+    if item_type not in OPPOSITE_TYPE:
+        return None
+    terms = Counter(tokenize(item.get("title")) + tokenize(item.get("description")))
+    date = item.get("date") if isinstance(item.get("date"), datetime) else None
+    return Candidate(
+        id=item["_id"],
+        type=item_type,
+        block=category_key(item.get("category")),
+        date=date,
+        bucket=date.toordinal() // max(1, window_days) if date else None,
+        terms=terms,
+        location=frozenset(tokenize(item.get("location"))),
+    )
+
+
+class MatchIndex:
+    """Incrementally maintained candidate structure for lost <-> found matching.
+
+    Items are blocked by (type, normalised category, date bucket), buckets
+    being one date window wide, so a query only probes its own bucket, the two
+    neighbours and undated items. Inside a block, a token -> item postings map
+    finds the candidates sharing at least one word; postings longer than
+    `max_posting` (very common words) are not used to find candidates, so the
+    work per query stays bounded however large a category grows.
+    Text similarity is TF-IDF cosine with document frequencies kept current
+    as items come and go.
+    """
+
+    def __init__(self, date_window_days: int = MATCH_DATE_WINDOW_DAYS, max_posting: int = MATCH_MAX_POSTING):
+        self.date_window_days = date_window_days
+        self.max_posting = max_posting
+        self._items: Dict[Hashable, Candidate] = {}
+        self._postings: Dict[Tuple[str, str, Optional[int]], Dict[str, Set[Hashable]]] = \
+            defaultdict(lambda: defaultdict(set))
+        self._df: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item_id: Hashable) -> bool:
+        return item_id in self._items
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._postings.clear()
+        self._df.clear()
+
+    def add(self, item: dict) -> None:
+        candidate = make_candidate(item, self.date_window_days)
+        if candidate is None:
+            return
+        self.remove(candidate.id)
+        self._items[candidate.id] = candidate
+        postings = self._postings[(candidate.type, candidate.block, candidate.bucket)]
+        for term in set(candidate.terms) | candidate.location:
+            postings[term].add(candidate.id)
+        self._df.update(set(candidate.terms))
+
+    def remove(self, item_id: Hashable) -> None:
+        candidate = self._items.pop(item_id, None)
+        if candidate is None:
+            return
+        key = (candidate.type, candidate.block, candidate.bucket)
+        postings = self._postings[key]
+        for term in set(candidate.terms) | candidate.location:
+            ids = postings.get(term)
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del postings[term]
+        if not postings:
+            del self._postings[key]
+        for term in set(candidate.terms):
+            self._df[term] -= 1
+            if self._df[term] <= 0:
+                del self._df[term]
+
+    def _weights(self, terms: Counter) -> Tuple[Dict[str, float], float]:
+        n = len(self._items) + 1
+        weights = {t: tf * math.log(1 + n / (self._df.get(t, 0) + 1)) for t, tf in terms.items()}
+        return weights, math.sqrt(sum(w * w for w in weights.values())) or 1.0
+
+    def _score(self, probe: Candidate, probe_weights, probe_norm, other: Candidate) -> Optional[dict]:
+        date_score = 0.5  # unknown dates neither help nor rule out a match
+        if probe.date and other.date:
+            days = abs((probe.date - other.date).days)
+            if days > self.date_window_days:
+                return None
+            date_score = 1 - days / (self.date_window_days + 1)
+
+        other_weights, other_norm = self._weights(other.terms)
+        dot = sum(w * other_weights.get(t, 0.0) for t, w in probe_weights.items())
+        text_score = dot / (probe_norm * other_norm)
+
+        union = probe.location | other.location
+        location_score = len(probe.location & other.location) / len(union) if union else 0.0
+
+        score = TEXT_WEIGHT * text_score + LOCATION_WEIGHT * location_score + DATE_WEIGHT * date_score
+        return {
+            "score": round(score, 4),
+            "text": round(text_score, 4),
+            "location": round(location_score, 4),
+            "date": round(date_score, 4),
+        }
+
+    def _probe_blocks(self, probe: Candidate) -> List[Dict[str, Set[Hashable]]]:
+        """Postings of the opposite type in the probe's category that can lie inside the date window."""
+        opposite = OPPOSITE_TYPE[probe.type]
+        if probe.bucket is None:
+            # Unknown date: every bucket of the category is in range
+            return [p for (t, block, _), p in self._postings.items() if t == opposite and block == probe.block]
+        buckets = (probe.bucket - 1, probe.bucket, probe.bucket + 1, None)
+        keys = [(opposite, probe.block, bucket) for bucket in buckets]
+        return [self._postings[key] for key in keys if key in self._postings]
+
+    def match(self, item: dict, limit: int = MATCH_MAX_RESULTS, min_score: float = MATCH_MIN_SCORE) -> List[dict]:
+        """Best counterparts of `item` (indexed or not) among the opposite type, best first."""
+        probe = self._items.get(item["_id"]) or make_candidate(item, self.date_window_days)
+        if probe is None:
+            return []
+        candidate_ids: Set[Hashable] = set()
+        for postings in self._probe_blocks(probe):
+            for term in set(probe.terms) | probe.location:
+                ids = postings.get(term)
+                if ids and len(ids) <= self.max_posting:
+                    candidate_ids |= ids
+
+        probe_weights, probe_norm = self._weights(probe.terms)
+        scored = []
+        for candidate_id in candidate_ids:
+            breakdown = self._score(probe, probe_weights, probe_norm, self._items[candidate_id])
+            if breakdown and breakdown["score"] >= min_score:
+                scored.append((breakdown["score"], candidate_id, breakdown))
+        return [
+            {"id": candidate_id, **breakdown}
+            for _, candidate_id, breakdown in heapq.nlargest(limit, scored, key=lambda s: s[0])
+        ]
+
+    async def startup(self, collection) -> None:
+        fresh = MatchIndex(self.date_window_days)
+        async for item in collection.find({"status": "approved"}, MATCH_FIELDS):
+            fresh.add(item)
+        self._items, self._postings, self._df = fresh._items, fresh._postings, fresh._df
+        logger.info(f"🧩 Match index built with {len(self)} approved items")
+
+
+match_index = MatchIndex()
@@ -0,0 +1,167 @@
+import logging
+import os
+from typing import Hashable, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageOps
+from starlette.concurrency import run_in_threadpool
+
+from fastapi_app.config import IMAGE_SIMILARITY_MAX_DISTANCE, IMAGE_SIMILARITY_MAX_RESULTS
+
+logger = logging.getLogger(__name__)
+
+HASH_BITS = 64
+MAX_DISTANCE = 2 * HASH_BITS  # pHash + dHash Hamming distances
+
+# pHash: 32x32 greyscale -> 2-D DCT -> top-left 8x8 low frequencies vs their median
+_PHASH_SIZE = 32
+_k = np.arange(_PHASH_SIZE)
+_DCT = np.cos(np.pi * (2 * _k[None, :] + 1) * _k[:, None] / (2 * _PHASH_SIZE))
+
+if hasattr(np, "bitwise_count"):
+    def _popcount(values: np.ndarray) -> np.ndarray:
+        return np.bitwise_count(values)
+else:  # numpy < 2.0
+    _POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(values: np.ndarray) -> np.ndarray:
+        return _POPCOUNT8[values.view(np.uint8)].reshape(*values.shape, 8).sum(axis=-1)
+
+
+def _bits_to_int(bits: np.ndarray) -> int:
+    return int.from_bytes(np.packbits(bits.astype(np.uint8).ravel()).tobytes(), "big")
+
+
+def phash(image: Image.Image) -> int:
+    pixels = np.asarray(image.convert("L").resize((_PHASH_SIZE, _PHASH_SIZE), Image.LANCZOS), dtype=np.float64)
+    low = (_DCT @ pixels @ _DCT.T)[:8, :8].ravel()
+    # The DC term only reflects overall brightness
+    return _bits_to_int(low > np.median(low[1:]))
+
+
+def dhash(image: Image.Image) -> int:
+    pixels = np.asarray(image.convert("L").resize((9, 8), Image.LANCZOS), dtype=np.int16)
+    return _bits_to_int(pixels[:, 1:] > pixels[:, :-1])
+
+
+def compute_hashes(upload_folder: str, image_path: str) -> Tuple[int, int]:
+    """(pHash, dHash) of a stored image (blocking, CPU-bound)."""
+    with Image.open(os.path.join(upload_folder, image_path)) as original:
+        original.draft("L", (128, 128))  # JPEG: decode at reduced size, the hashes only need 32x32
+        image = ImageOps.exif_transpose(original)
+        return phash(image), dhash(image)
+
+
+def to_hex(value: int) -> str:
+    return f"{value:016x}"
+
+
+def item_hashes(item: dict) -> Optional[Tuple[int, int]]:
+    if not item.get("image_phash") or not item.get("image_dhash"):
+        return None
+    return int(item["image_phash"], 16), int(item["image_dhash"], 16)
+
+
+class ImageHashIndex:
+    """Perceptual hashes of approved items' photos in one contiguous uint64 array.
+
+    A query XORs its two hashes against every row and popcounts the result,
+    so a top-k scan over 100k images is a few vectorised passes over 1.6 MB.
+    Rows are removed by moving the last row into the gap.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.hashes = np.zeros((capacity, 2), dtype=np.uint64)
+        self.ids: List[Hashable] = []
+        self.rows = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, item_id: Hashable, hashes: Tuple[int, int]) -> None:
+        row = self.rows.get(item_id)
+        if row is None:
+            row = len(self.ids)
+            if row == len(self.hashes):
+                self.hashes = np.concatenate([self.hashes, np.zeros_like(self.hashes)])
+            self.ids.append(item_id)
+            self.rows[item_id] = row
+        self.hashes[row] = hashes
+
+    def remove(self, item_id: Hashable) -> None:
+        row = self.rows.pop(item_id, None)
+        if row is None:
+            return
+        last = len(self.ids) - 1
+        if row != last:
+            self.hashes[row] = self.hashes[last]
+            self.ids[row] = self.ids[last]
+            self.rows[self.ids[row]] = row
+        self.ids.pop()
+
+    def search(self, hashes: Tuple[int, int], limit: int = IMAGE_SIMILARITY_MAX_RESULTS,
+               max_distance: int = IMAGE_SIMILARITY_MAX_DISTANCE,
+               exclude: Optional[Hashable] = None) -> List[Tuple[Hashable, int]]:
+        """Closest images as (item id, distance), nearest first, within `max_distance` of 128 bits."""
+        n = len(self.ids)
+        if n == 0:
+            return []
+        query = np.array(hashes, dtype=np.uint64)
+        distances = _popcount(self.hashes[:n] ^ query).sum(axis=1, dtype=np.int32)
+        if exclude in self.rows:
+            distances[self.rows[exclude]] = MAX_DISTANCE + 1
+        candidates = np.flatnonzero(distances <= max_distance)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(distances[candidates], limit - 1)[:limit]]
+        candidates = candidates[np.argsort(distances[candidates], kind="stable")]
+        return [(self.ids[row], int(distances[row])) for row in candidates]
+
+    async def startup(self, collection) -> None:
+        fresh = ImageHashIndex()
+        async for item in collection.find(
+            {"status": "approved", "image_phash": {"$ne": None}}, {"image_phash": 1, "image_dhash": 1}
+        ):
+            hashes = item_hashes(item)
+            if hashes:
+                fresh.add(item["_id"], hashes)
+        self.hashes, self.ids, self.rows = fresh.hashes, fresh.ids, fresh.rows
+        logger.info(f"🖼️ Image similarity index loaded with {len(self)} photos")
+
+
+image_hash_index = ImageHashIndex()
+
+# Stored as image_phash when a photo could not be hashed, so it is not retried (or reported pending) forever
+HASH_FAILED = ""
+
+
+async def hash_item_image(collection, item_id, upload_folder: str, image_path: str) -> None:
+    """Background job: hash an item's photo, store it, and index it if the item is already public."""
+    p, d = await run_in_threadpool(compute_hashes, upload_folder, image_path)
+    item = await collection.find_one_and_update(
+        {"_id": item_id},
+        {"$set": {"image_phash": to_hex(p), "image_dhash": to_hex(d)}},
+        projection={"status": 1}
+    )
+    if item and item.get("status") == "approved":
+        image_hash_index.add(item_id, (p, d))
+
+
+async def backfill_image_hashes(collection, upload_folder: str, batch_size: int = 100) -> int:
+    """Hash photos of items stored before hashing existed, one at a time in the background."""
+    hashed = 0
+    query = {"image_path": {"$ne": None}, "image_phash": None}
+    while True:
+        items = await collection.find(query, {"image_path": 1}).limit(batch_size).to_list(length=batch_size)
+        if not items:
+            break
+        for item in items:
+            try:
+                await hash_item_image(collection, item["_id"], upload_folder, item["image_path"])
+                hashed += 1
+            except Exception as e:
+                # Mark unreadable images so the backfill doesn't retry them forever
+                logger.warning(f"Could not hash image of item {item['_id']}: {e}")
+                await collection.update_one({"_id": item["_id"]}, {"$set": {"image_phash": HASH_FAILED}})
+    if hashed:
+        logger.info(f"🖼️ Backfilled perceptual hashes for {hashed} images")
+    return hashed
@@ -0,0 +1,131 @@
+import contextvars
+import logging
+import time
+from typing import Optional
+
+from pymongo import monitoring
+from sqlalchemy import event
+
+from fastapi_app.metrics.registry import registry
+
+logger = logging.getLogger(__name__)
+
+REQUEST_LATENCY = registry.histogram(
+    "http_request_duration_seconds", "Request latency by route template"
+)
+REQUESTS = registry.counter("http_requests_total", "Requests by route template and status")
+DB_CALLS_PER_REQUEST = registry.histogram(
+    "db_calls_per_request", "Database calls issued while serving one request",
+    buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100)
+)
+DB_TIME_PER_REQUEST = registry.histogram(
+    "db_time_per_request_seconds", "Time spent in database calls while serving one request"
+)
+DB_COMMAND_LATENCY = registry.histogram("db_command_duration_seconds", "Latency of individual DB commands")
+
+
+class RequestStats:
+    __slots__ = ("db_calls", "db_seconds")
+
+    def __init__(self):
+        self.db_calls = 0
+        self.db_seconds = 0.0
+
+
+# Set by the middleware; Motor copies the context into its executor threads and
+# SQLAlchemy's async greenlets share it, so DB hooks can attribute calls to the request.
+current_request_stats: contextvars.ContextVar[Optional[RequestStats]] = contextvars.ContextVar(
+    "current_request_stats", default=None
+)
+
+
+def record_db_call(db: str, command: str, seconds: float) -> None:
+    DB_COMMAND_LATENCY.observe(seconds, db=db, command=command)
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.db_calls += 1
+        stats.db_seconds += seconds
+
+
+class MongoCommandTimer(monitoring.CommandListener):
+    """pymongo command listener feeding the DB metrics. Pass it to the Motor client."""
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        record_db_call("mongo", event.command_name, event.duration_micros / 1e6)
+
+    def failed(self, event):
+        record_db_call("mongo", event.command_name, event.duration_micros / 1e6)
+
+
+def instrument_sqlalchemy(sync_engine) -> None:
+    """Time every statement executed on `sync_engine` (pass async_engine.sync_engine for async)."""
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start"].pop()
+        command = statement.lstrip().split(" ", 1)[0].lower()
+        record_db_call("sql", command, time.perf_counter() - started)
+
+
+def route_template(scope) -> str:
+    """Full route template for a served request, e.g. "/items/{item_id}", or "unmatched".
+
+    Depending on the FastAPI version, the matched route's own path may or may not
+    include the include_router prefix, so the prefix is recovered from the raw path.
+    """
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    template = getattr(route, "path_format", None) or getattr(route, "path", None)
+    if not template:
+        return "unmatched"
+    try:
+        rendered = template.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return template
+    path = scope.get("path", "")
+    if path.endswith(rendered):
+        return path[:len(path) - len(rendered)] + template
+    return template
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, status and DB usage per route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_request_stats.reset(token)
+            # Label by template ("/items/{item_id}"), never the raw path, to keep cardinality bounded
+            route = route_template(scope)
+            method = scope["method"]
+            REQUEST_LATENCY.observe(elapsed, method=method, route=route)
+            REQUESTS.inc(method=method, route=route, status=status_code)
+            DB_CALLS_PER_REQUEST.observe(stats.db_calls, method=method, route=route)
+            DB_TIME_PER_REQUEST.observe(stats.db_seconds, method=method, route=route)
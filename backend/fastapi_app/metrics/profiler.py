@@ -0,0 +1,36 @@
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter
+
+from fastapi_app.config import PROFILER_INTERVAL_MS
+
+
+def _collapse(frame) -> str:
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append(f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(stack))
+
+
+def sample_thread(thread_id: int, seconds: float, interval_ms: int = PROFILER_INTERVAL_MS) -> Counter:
+    """Sample `thread_id`'s stack every `interval_ms` for `seconds`; returns collapsed-stack counts."""
+    samples: Counter = Counter()
+    deadline = time.monotonic() + seconds
+    interval = interval_ms / 1000
+    while time.monotonic() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        if frame is not None:
+            samples[_collapse(frame)] += 1
+        time.sleep(interval)
+    return samples
+
+
+async def profile_event_loop(seconds: float) -> str:
+    """Profile the event-loop thread from a helper thread; output is flamegraph.pl "collapsed" format."""
+    loop_thread = threading.get_ident()
+    samples = await asyncio.to_thread(sample_thread, loop_thread, seconds)
+    return "\n".join(f"{stack} {count}" for stack, count in samples.most_common()) + "\n"
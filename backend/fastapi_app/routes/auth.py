@@ -1,14 +1,14 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from passlib.context import CryptContext
 from pydantic import BaseModel, Field
 from fastapi_app.models.user_model import User
-from fastapi_app.auth.dependencies import get_db, get_current_user
-from fastapi_app.auth.jwt_handler import create_access_token, hash_password
-from sqlalchemy.orm import Session
+from fastapi_app.auth.dependencies import get_db, get_current_user, get_admin_user, get_user_by_username
+from fastapi_app.auth.jwt_handler import create_access_token
+from fastapi_app.auth.password_pool import password_pool
+from fastapi_app.auth.principal_cache import invalidate_principal
+from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 router = APIRouter()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # Set up logging for debugging
 logging.basicConfig(level=logging.INFO)
@@ -25,11 +25,11 @@ class UserLogin(BaseModel):
     client_role: str = Field(..., description="Role: user or admin")
 
 @router.post("/signup")
-def signup(user_data: UserSignUp, db: Session = Depends(get_db)):
+async def signup(user_data: UserSignUp, db: AsyncSession = Depends(get_db)):
     try:
         logger.info(f"Signup attempt for username: {user_data.username}")
         
-        existing_user = db.query(User).filter(User.username == user_data.username).first()
+        existing_user = await get_user_by_username(db, user_data.username)
 
         if existing_user:
             logger.warning(f"Username already exists: {user_data.username}")
@@ -38,13 +38,15 @@ def signup(user_data: UserSignUp, db: Session = Depends(get_db)):
         # ✅ Always create as user
         new_user = User(
             username=user_data.username,
-            hashed_password=hash_password(user_data.password),
+            # bcrypt is CPU-bound; it runs on the bounded password pool
+            hashed_password=await password_pool.hash(user_data.password),
             role="user"
         )
 
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
+        # Drop anything cached for a previous account with this name
+        invalidate_principal(new_user.username)
         
         logger.info(f"User created successfully: {new_user.username}")
         return {"message": "User account created successfully", "username": new_user.username}
@@ -53,7 +55,7 @@ def signup(user_data: UserSignUp, db: Session = Depends(get_db)):
         raise
     except Exception as e:
         logger.error(f"Signup error: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Internal server error during signup")
 
 @router.get("/me")
@@ -64,13 +66,13 @@ async def get_me(current_user: dict = Depends(get_current_user)):
     }
 
 @router.post("/login")
-def login(login_data: UserLogin, db: Session = Depends(get_db)):
+async def login(login_data: UserLogin, db: AsyncSession = Depends(get_db)):
     try:
         logger.info(f"Login attempt for username: {login_data.username}")
         logger.info(f"Requested role: {login_data.client_role}")
 
         # ✅ Find user and verify password
-        user = db.query(User).filter(User.username == login_data.username).first()
+        user = await get_user_by_username(db, login_data.username)
 
         if not user:
             logger.warning(f"User not found: {login_data.username}")
@@ -79,7 +81,7 @@ def login(login_data: UserLogin, db: Session = Depends(get_db)):
                 detail="Invalid username or password"
             )
             
-        if not pwd_context.verify(login_data.password, user.hashed_password):
+        if not await password_pool.verify(login_data.password, user.hashed_password):
             logger.warning(f"Invalid password for user: {login_data.username}")
             raise HTTPException(
                 status_code=401,
@@ -123,4 +125,9 @@ def login(login_data: UserLogin, db: Session = Depends(get_db)):
         raise
     except Exception as e:
         logger.error(f"Login error: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error during login")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Internal server error during login")
+
+@router.get("/diag/password-pool")
+async def password_pool_metrics(current_user: dict = Depends(get_admin_user)):
+    """Diagnostic endpoint: bcrypt latency, queue wait and shed requests."""
+    return password_pool.metrics()
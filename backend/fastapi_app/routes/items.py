@@ -1,16 +1,41 @@
-from fastapi import APIRouter, File, UploadFile, Form, Depends, HTTPException, status, Query
+from fastapi import APIRouter, File, UploadFile, Form, Depends, HTTPException, status, Query, Request
 from fastapi_app.models.user_model import User
-from fastapi.responses import JSONResponse
-from datetime import datetime, time
-import shutil
-from typing import Optional
+from fastapi.responses import JSONResponse, StreamingResponse
+from datetime import datetime, time, timedelta
+from typing import List, Optional
 import os
+import zipfile
 from bson import ObjectId
-from bson.regex import Regex
-from ..schemas.item_schema import ItemBase, ItemCreate
+from bson.errors import InvalidId
+from pymongo import ReturnDocument, UpdateOne
+from ..schemas.item_schema import ItemBase, ItemCreate, BulkModerationRequest
 from ..db.fake_db import mock_items
-from fastapi_app.auth.dependencies import get_current_user
+from fastapi_app.auth.dependencies import get_current_user, get_admin_user
 from ..db.mongo import db
+from ..db.indexes import index_report
+from ..db.backfill import submitted_by_key, filter_keys, filter_key
+from ..db.archive import ARCHIVE_COLLECTION, search_archive
+from ..db.pagination import (
+    paginate, stream_ndjson, paginate_ranked, stream_ranked_ndjson, paginate_faceted, facet_counts,
+    decode_cursor, decode_offset_cursor, InvalidCursor
+)
+from ..search.engine import search_engine
+from ..search.suggest import suggest_index
+from ..storage.uploads import save_upload
+from ..storage.renditions import image_queue, generate_renditions
+from ..cache.response_cache import response_cache, APPROVED_LISTINGS
+from ..schemas.item_serializer import serialize_item, ITEM_PROJECTION, ORJSONResponse, dumps
+from ..events.bus import event_bus, emit_item_event
+from ..events.tickets import TICKETS_COLLECTION, issue_ticket, redeem_ticket
+from ..matching.engine import match_index, MATCH_FIELDS
+from ..matching.image_hash import image_hash_index, hash_item_image, item_hashes, HASH_FAILED
+from ..tasks.index_sync import index_sync
+from ..stats.counters import item_stats
+from ..ingest.importer import ItemImporter, detect_format, iter_rows
+from starlette.concurrency import run_in_threadpool
+from fastapi_app.config import EVENT_HEARTBEAT_SECONDS, EVENT_TICKET_TTL_SECONDS, MATCH_MAX_RESULTS
+from fastapi_app.config import IMAGE_SIMILARITY_MAX_DISTANCE, IMAGE_SIMILARITY_MAX_RESULTS
+from fastapi_app.config import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, SEARCH_MAX_CANDIDATES
 import logging
 import re
 
@@ -19,10 +44,8 @@ logger = logging.getLogger(__name__)
 
 # ✅ Consistent Path Setup
 BASE_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..")
+# Created by the app lifespan
 UPLOAD_FOLDER = os.path.abspath(os.path.join(BASE_DIR, "uploads"))
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-
-logger.info(f"📂 Storage Config: Uploads will be saved to: {UPLOAD_FOLDER}")
 
 @router.post("/submit")
 async def submit_item(
@@ -41,12 +64,11 @@ async def submit_item(
         raise HTTPException(status_code=400, detail="Date must be in YYYY-MM-DD format")
 
     filename = None
+    image_sha256 = None
     if file and file.filename:
-        filename = f"{datetime.utcnow().timestamp()}_{file.filename}"
-        file_path = os.path.join(UPLOAD_FOLDER, filename)
-        logger.info(f"📸 Saving uploaded image to: {file_path}")
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        stored = await save_upload(file, UPLOAD_FOLDER)
+        filename, image_sha256 = stored.path, stored.sha256
+        logger.info(f"📸 Saved uploaded image ({stored.size} bytes) to: {os.path.join(UPLOAD_FOLDER, filename)}")
     else:
         logger.info("ℹ️ No file provided in submission")
 
@@ -60,28 +82,108 @@ async def submit_item(
         "status": "pending",
         "created_at": datetime.utcnow(),
         "image_path": filename,
-        "submitted_by": current_user["username"].strip()
+        "image_sha256": image_sha256,
+        "submitted_by": current_user["username"].strip(),
+        "submitted_by_key": submitted_by_key(current_user["username"])
     }
+    item_dict.update(filter_keys(item_dict))
 
     result = await db.items.insert_one(item_dict)
     if result.inserted_id:
+        item_stats.item_added(item_dict)
+        emit_item_event("item.submitted", item_dict)
+        if filename:
+            # Thumbnails and hashes are best-effort: the original is served until they exist
+            image_queue.submit(generate_renditions, db.items, result.inserted_id, UPLOAD_FOLDER, filename)
+            image_queue.submit(hash_item_image, db.items, result.inserted_id, UPLOAD_FOLDER, filename)
         return {"message": "Item submitted successfully", "id": str(result.inserted_id)}
 
     raise HTTPException(status_code=500, detail="Failed to submit item")
 
-def format_item(item):
-    """Helper to format MongoDB item for JSON response."""
-    item["id"] = str(item.get("_id"))
-    item["_id"] = str(item.get("_id"))
-    if item.get("date") and isinstance(item["date"], datetime):
-        item["date"] = item["date"].isoformat()
-    if item.get("created_at") and isinstance(item["created_at"], datetime):
-        item["created_at"] = item["created_at"].isoformat()
-    if item.get("approved_at") and isinstance(item["approved_at"], datetime):
-        item["approved_at"] = item["approved_at"].isoformat()
-    if item.get("rejected_at") and isinstance(item["rejected_at"], datetime):
-        item["rejected_at"] = item["rejected_at"].isoformat()
-    return item
+@router.post("/import")
+async def import_items(
+    file: UploadFile = File(...),
+    images: Optional[UploadFile] = File(None),
+    format: Optional[str] = Form(None),  # 'csv' or 'ndjson'; inferred from the file name if omitted
+    current_user: dict = Depends(get_admin_user)
+):
+    """Bulk-create pending items from a CSV/NDJSON file plus an optional zip of images.
+
+    Rows carry the `ItemCreate` fields and an optional `image` naming a file in
+    the archive. The response is an NDJSON report, one line per row as each
+    batch is written, followed by a summary line.
+    """
+    try:
+        fmt = detect_format(file.filename, format)
+        if fmt is None:
+            raise HTTPException(status_code=400, detail="Upload a .csv or .ndjson file (or pass format=csv|ndjson)")
+        archive = None
+        if images and images.filename:
+            try:
+                archive = await run_in_threadpool(zipfile.ZipFile, images.file)
+            except zipfile.BadZipFile:
+                raise HTTPException(status_code=400, detail="Images must be uploaded as a zip archive")
+
+        importer = ItemImporter(db.items, UPLOAD_FOLDER, current_user["username"], archive)
+
+        async def report():
+            # The response has already started, so errors become report lines and the summary always follows
+            try:
+                async for batch_report in importer.run(iter_rows(file.file, fmt)):
+                    for doc in importer.inserted:
+                        item_stats.item_added(doc)
+                        emit_item_event("item.submitted", doc)
+                        if doc["image_path"]:
+                            image_queue.submit(generate_renditions, db.items, doc["_id"], UPLOAD_FOLDER, doc["image_path"])
+                            image_queue.submit(hash_item_image, db.items, doc["_id"], UPLOAD_FOLDER, doc["image_path"])
+                    yield b"".join(dumps(entry) + b"\n" for entry in batch_report)
+            except Exception as e:
+                logger.error(f"Error importing items: {str(e)}")
+                yield dumps({"status": "aborted", "errors": ["import failed"]}) + b"\n"
+            yield dumps({"summary": importer.totals}) + b"\n"
+
+        return StreamingResponse(report(), media_type="application/x-ndjson")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error importing items: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error importing items")
+
+async def list_items(query: dict, limit: int, after: Optional[str], stream: bool,
+                     ranked_ids: Optional[List[ObjectId]] = None, include_archived: bool = False):
+    """Return a page of matching items, or the full result set as NDJSON when `stream` is set.
+
+    Plain listings are keyset-paginated newest first; when `ranked_ids` is given
+    (keyword search) the results keep that relevance order instead. With
+    `include_archived` the archive collection is read alongside the hot one.
+    """
+    source = [db.items, db[ARCHIVE_COLLECTION]] if include_archived else db.items
+    try:
+        if after:
+            decode_cursor(after) if ranked_ids is None else decode_offset_cursor(after)
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+    if ranked_ids is not None:
+        if stream:
+            return StreamingResponse(
+                stream_ranked_ndjson(
+                    source, ranked_ids, query, after=after, formatter=serialize_item, projection=ITEM_PROJECTION
+                ),
+                media_type="application/x-ndjson"
+            )
+        return await paginate_ranked(
+            source, ranked_ids, query, limit, after=after, formatter=serialize_item, projection=ITEM_PROJECTION
+        )
+
+    if stream:
+        return StreamingResponse(
+            stream_ndjson(source, query, after=after, formatter=serialize_item, projection=ITEM_PROJECTION),
+            media_type="application/x-ndjson"
+        )
+    return await paginate(
+        source, query, limit, after=after, formatter=serialize_item, projection=ITEM_PROJECTION
+    )
 
 @router.get("/my-items")
 async def get_my_items(current_user: dict = Depends(get_current_user)):
@@ -92,70 +194,177 @@ async def get_my_items(current_user: dict = Depends(get_current_user)):
         
         logger.info(f"🔍 [RETRIEVAL] Fetching items for user: '{trimmed_username}' (Raw: '{raw_username}')")
         
-        # Search for items where submitted_by matches exactly OR has minor whitespace/casing differences
-        # We use a regex that handles leading/trailing spaces and is case-insensitive
+        # Exact, index-backed match on the normalised username (trimmed + case-folded).
+        # Items not yet backfilled have no key; the second branch picks those up via
+        # the same index (null match) and only regex-checks that small remainder.
         escaped_name = re.escape(trimmed_username)
         query = {
-            "submitted_by": {"$regex": f"^\\s*{escaped_name}\\s*$", "$options": "i"}
+            "$or": [
+                {"submitted_by_key": submitted_by_key(raw_username)},
+                {
+                    "submitted_by_key": None,
+                    "submitted_by": {"$regex": f"^\\s*{escaped_name}\\s*$", "$options": "i"}
+                },
+            ]
         }
         
-        items = await db.items.find(query).to_list(length=100)
+        # Archived items are still the user's, so read the archive alongside the hot collection
+        page = await paginate([db.items, db[ARCHIVE_COLLECTION]], query, 100, projection=ITEM_PROJECTION)
+        items = page["items"]
         logger.info(f"📊 [RETRIEVAL] Found {len(items)} items for user '{trimmed_username}'")
         
         formatted = []
         for it in items:
             try:
-                formatted.append(format_item(it))
+                formatted.append(serialize_item(it))
             except Exception as e:
                 logger.error(f"❌ [FORMAT ERROR]: {e}")
-        return formatted
+        return ORJSONResponse(formatted)
     except Exception as e:
         logger.error(f"❌ [SYSTEM ERROR] In get_my_items: {e}")
         return []
 
 @router.get("/diag/users")
 async def diag_users():
-    """Diagnostic endpoint to see what usernames are in the DB."""
+    """Diagnostic endpoint to see what usernames are in the DB (served from the maintained counters)."""
     try:
-        all_users = await db.items.distinct("submitted_by")
-        # Also get a count of all items
-        total = await db.items.count_documents({})
         return {
-            "submitted_by_values": all_users,
-            "total_items_in_db": total
+            "submitted_by_values": item_stats.submitters,
+            "total_items_in_db": item_stats.total
         }
     except Exception as e:
         return {"error": str(e)}
 
+@router.get("/suggest")
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=100),
+    field: Optional[str] = Query(None, pattern="^(category|location)$"),
+    limit: int = Query(8, ge=1, le=20)
+):
+    """Typeahead for category/location values of approved items, most used first; served from memory."""
+    return ORJSONResponse(suggest_index.suggest(q, field, limit))
+
+@router.get("/stats")
+async def get_stats():
+    """Item counts by status, type and category; read from memory, no collection scan.
+
+    Counts are approximate and per worker (corrected every STATS_RECONCILE_SECONDS) and cover
+    live items only; archived items are counted separately as `archived_items`.
+    """
+    return ORJSONResponse(item_stats.snapshot())
+
+@router.get("/diag/indexes")
+async def diag_indexes(current_user: dict = Depends(get_admin_user)):
+    """Diagnostic endpoint listing the items collection indexes and whether any are missing."""
+    try:
+        return await index_report(db.items)
+    except Exception as e:
+        return {"error": str(e)}
+
+@router.post("/events/ticket")
+async def create_event_ticket(current_user: dict = Depends(get_current_user)):
+    """Trade the bearer token for a single-use, short-lived ticket that opens /items/events."""
+    try:
+        ticket = await issue_ticket(db[TICKETS_COLLECTION], current_user)
+        return {"ticket": ticket, "expires_in": EVENT_TICKET_TTL_SECONDS}
+    except Exception as e:
+        logger.error(f"Error issuing event ticket: {str(e)}")
+        raise HTTPException(status_code=500, detail="Could not issue event ticket")
+
+@router.get("/events")
+async def item_events(request: Request, ticket: Optional[str] = Query(None)):
+    """Server-sent events for item lifecycle changes.
+
+    EventSource cannot send headers, so admins first POST /items/events/ticket
+    and pass the ticket as `?ticket=` to also receive pending-queue events (the
+    API token itself is never accepted in the URL); everyone else gets public
+    events only.
+    """
+    admin = False
+    if ticket:
+        holder = await redeem_ticket(db[TICKETS_COLLECTION], ticket)
+        if holder is None:
+            raise HTTPException(status_code=401, detail="Invalid or expired ticket")
+        admin = holder.get("role") == "admin"
+
+    async def event_stream():
+        sub = event_bus.subscribe(admin=admin)
+        try:
+            yield b"retry: 5000\n\n"
+            while not await request.is_disconnected():
+                event = await sub.next(timeout=EVENT_HEARTBEAT_SECONDS)
+                if event is None:
+                    # Comment line keeps proxies from closing an idle connection
+                    yield b": keep-alive\n\n"
+                    continue
+                yield b"event: " + event["event"].encode() + b"\ndata: " + dumps(event["data"]) + b"\n\n"
+        finally:
+            event_bus.unsubscribe(sub)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/pending")
-async def get_pending_items(current_user: dict = Depends(get_current_user)):
+async def get_pending_items(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None),
+    stream: bool = Query(False),
+    current_user: dict = Depends(get_current_user)
+):
     try:
         if current_user.get("role") != "admin":
             raise HTTPException(status_code=403, detail="Admin access required")
         
-        pending_items = await db.items.find({"status": "pending"}).to_list(length=100)
-        return [format_item(item) for item in pending_items]
+        page = await list_items({"status": "pending"}, limit, after, stream)
+        return page if stream else ORJSONResponse(page)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Unexpected error in get_pending_items: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error while fetching pending items")
 
+async def items_archived(docs: List[dict]) -> None:
+    """The archival job moved `docs` out of the hot collection."""
+    listed = False
+    for doc in docs:
+        item_stats.item_archived(doc)
+        if doc.get("status") == "approved":
+            index_sync.item_unlisted(doc)
+            listed = True
+    if listed:
+        await response_cache.invalidate(APPROVED_LISTINGS)
+
+def moderation_update(action: str, admin_username: str) -> dict:
+    """The $set applied when an admin approves or rejects an item."""
+    # moderated_at is what other workers' index syncs look for
+    now = datetime.utcnow()
+    if action == "approve":
+        return {"status": "approved", "approved_by": admin_username, "approved_at": now, "moderated_at": now}
+    return {"status": "rejected", "rejected_by": admin_username, "rejected_at": now, "moderated_at": now}
+
 @router.post("/approve/{item_id}")
 async def approve_item(item_id: str, current_user: dict = Depends(get_current_user)):
     try:
         if current_user.get("role") != "admin":
             raise HTTPException(status_code=403, detail="Admin access required")
         
-        result = await db.items.update_one(
+        update = moderation_update("approve", current_user["username"])
+        previous = await db.items.find_one_and_update(
             {"_id": ObjectId(item_id)},
-            {
-                "$set": {
-                    "status": "approved", 
-                    "approved_by": current_user["username"], 
-                    "approved_at": datetime.utcnow()
-                }
-            }
+            {"$set": update},
+            return_document=ReturnDocument.BEFORE
         )
-        if result.modified_count == 1:
+        if previous:
+            item = {**previous, **update}
+            item_stats.status_changed(previous.get("status"), "approved")
+            # Re-approving an approved item must not index it twice
+            if previous.get("status") != "approved":
+                index_sync.item_listed(item)
+            await response_cache.invalidate(APPROVED_LISTINGS)
+            emit_item_event("item.approved", item)
             return {"message": "Item approved successfully"}
         raise HTTPException(status_code=404, detail="Item not found")
     except Exception as e:
@@ -168,72 +377,300 @@ async def reject_item(item_id: str, current_user: dict = Depends(get_current_use
         if current_user.get("role") != "admin":
             raise HTTPException(status_code=403, detail="Admin access required")
         
-        result = await db.items.update_one(
+        previous = await db.items.find_one_and_update(
             {"_id": ObjectId(item_id)},
-            {
-                "$set": {
-                    "status": "rejected", 
-                    "rejected_by": current_user["username"], 
-                    "rejected_at": datetime.utcnow()
-                }
-            }
+            {"$set": moderation_update("reject", current_user["username"])},
+            projection={"status": 1, "title": 1, "type": 1, "category": 1, "location": 1},
+            return_document=ReturnDocument.BEFORE
         )
-        if result.modified_count == 1:
+        if previous:
+            item_stats.status_changed(previous.get("status"), "rejected")
+            # Rejecting a pending item doesn't change what the public listings show
+            was_public = previous.get("status") == "approved"
+            if was_public:
+                index_sync.item_unlisted(previous)
+                await response_cache.invalidate(APPROVED_LISTINGS)
+            emit_item_event("item.withdrawn" if was_public else "item.rejected", {**previous, "status": "rejected"})
             return {"message": "Item rejected successfully"}
         raise HTTPException(status_code=404, detail="Item not found")
     except Exception as e:
         logger.error(f"Error rejecting item {item_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Error rejecting item")
 
+@router.post("/moderate/bulk")
+async def moderate_bulk(request_data: BulkModerationRequest, current_user: dict = Depends(get_admin_user)):
+    """Approve/reject many items in one bulk_write; returns a result per requested id.
+
+    If an id is listed more than once, its last action is applied and earlier entries report "superseded".
+    """
+    try:
+        results = []
+        valid = []  # (ObjectId, action), last action wins for duplicate ids
+        last_entry = {}  # ObjectId -> its result; earlier entries for the same id are superseded
+        for entry in request_data.actions:
+            try:
+                oid = ObjectId(entry.id)
+            except (InvalidId, TypeError):
+                results.append({"id": entry.id, "action": entry.action, "result": "invalid_id"})
+                continue
+            if oid in last_entry:
+                last_entry[oid]["result"] = "superseded"
+            valid.append((oid, entry.action))
+            last_entry[oid] = {"id": entry.id, "action": entry.action, "result": "ok"}
+            results.append(last_entry[oid])
+
+        final_action = dict(valid)
+        previous = {}
+        if final_action:
+            async for doc in db.items.find(
+                {"_id": {"$in": list(final_action)}}, {"status": 1, "title": 1, "type": 1, "category": 1, "location": 1}
+            ):
+                previous[doc["_id"]] = doc
+
+        operations = [
+            UpdateOne({"_id": oid}, {"$set": moderation_update(action, current_user["username"])})
+            for oid, action in final_action.items() if oid in previous
+        ]
+        if operations:
+            await db.items.bulk_write(operations, ordered=False)
+            for oid, action in final_action.items():
+                if oid in previous:
+                    new_status = "approved" if action == "approve" else "rejected"
+                    item_stats.status_changed(previous[oid].get("status"), new_status)
+
+        for result in results:
+            if result["result"] == "ok" and ObjectId(result["id"]) not in previous:
+                result["result"] = "not_found"
+
+        # Keep the search index and listing cache in step, as the single-item routes do
+        approved_ids = [oid for oid, action in final_action.items() if action == "approve" and oid in previous]
+        unlisted_ids = [
+            oid for oid, action in final_action.items()
+            if action == "reject" and oid in previous and previous[oid].get("status") == "approved"
+        ]
+        if approved_ids:
+            async for item in db.items.find({"_id": {"$in": approved_ids}}):
+                if previous[item["_id"]].get("status") != "approved":
+                    index_sync.item_listed(item)
+                emit_item_event("item.approved", item)
+        for oid in unlisted_ids:
+            index_sync.item_unlisted(previous[oid])
+        for oid, action in final_action.items():
+            if action == "reject" and oid in previous:
+                event = "item.withdrawn" if oid in unlisted_ids else "item.rejected"
+                emit_item_event(event, {**previous[oid], "status": "rejected"})
+        if approved_ids or unlisted_ids:
+            await response_cache.invalidate(APPROVED_LISTINGS)
+
+        logger.info(f"🧾 Bulk moderation by {current_user['username']}: {len(operations)} items updated")
+        return {
+            "updated": len(operations),
+            "results": results
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in bulk moderation: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error moderating items")
+
 @router.get("/approved")
-async def get_approved_items():
+async def get_approved_items(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None),
+    stream: bool = Query(False)
+):
     try:
-        approved_items = await db.items.find({"status": "approved"}).to_list(length=100)
-        return [format_item(item) for item in approved_items]
+        if stream:
+            return await list_items({"status": "approved"}, limit, after, stream)
+        return await response_cache.respond(
+            request, APPROVED_LISTINGS, {"route": "approved", "limit": limit, "after": after},
+            lambda: list_items({"status": "approved"}, limit, after, stream)
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching approved items: {str(e)}")
         raise HTTPException(status_code=500, detail="Error fetching approved items")
 
+def parse_day(value: str, name: str) -> datetime:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name} format. Use YYYY-MM-DD")
+
+async def build_search(category: Optional[List[str]], location: Optional[str], date: Optional[str],
+                       keyword: Optional[str], include_archived: bool = False,
+                       date_from: Optional[str] = None, date_to: Optional[str] = None,
+                       item_type: Optional[str] = None):
+    """Translate search parameters into a Mongo filter plus relevance-ranked ids for keyword searches."""
+    query = {"status": "approved"}
+    categories = [c.strip() for c in category or [] if c.strip()]
+    # Exact, index-backed matches on the normalised keys (see filter_key)
+    if len(categories) == 1:
+        query["category_key"] = filter_key(categories[0])
+    elif categories:
+        # Any of the given categories
+        query["category_key"] = {"$in": [filter_key(c) for c in categories]}
+    if location and location.strip(): query["location_key"] = filter_key(location)
+    if item_type: query["type"] = item_type
+    if date:
+        date_from = date_to = date
+    if date_from or date_to:
+        # Inclusive day range on the lost/found date
+        query["date"] = {}
+        if date_from:
+            query["date"]["$gte"] = parse_day(date_from, "date_from" if not date else "date")
+        if date_to:
+            query["date"]["$lt"] = parse_day(date_to, "date_to" if not date else "date") + timedelta(days=1)
+        if date_from and date_to and query["date"]["$gte"] >= query["date"]["$lt"]:
+            raise HTTPException(status_code=400, detail="date_from must not be after date_to")
+    
+    ranked_ids = None
+    if keyword:
+        ranked_ids = await search_engine.search(db.items, keyword, SEARCH_MAX_CANDIDATES)
+        if include_archived:
+            # Archived matches rank after every live one
+            ranked_ids += await search_archive(db[ARCHIVE_COLLECTION], keyword, query, SEARCH_MAX_CANDIDATES)
+    return query, ranked_ids
+
 @router.get("/search")
 async def search_items(
-    category: Optional[str] = Query(None),
+    request: Request,
+    category: Optional[List[str]] = Query(None),  # repeat for several: ?category=Keys&category=Wallets
     location: Optional[str] = Query(None),
     date: Optional[str] = Query(None),
-    keyword: Optional[str] = Query(None)
+    date_from: Optional[str] = Query(None),
+    date_to: Optional[str] = Query(None),
+    type: Optional[str] = Query(None, pattern="^(lost|found)$"),
+    keyword: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None),
+    stream: bool = Query(False),
+    include_archived: bool = Query(False),
+    facets: bool = Query(False)
 ):
+    """Search approved items. With `facets`, the page comes with per-category, per-location
+    and per-week counts over all matches, computed in the same aggregation."""
+    async def run_search():
+        query, ranked_ids = await build_search(
+            category, location, date, keyword, include_archived, date_from, date_to, type
+        )
+        if not facets:
+            return await list_items(query, limit, after, stream, ranked_ids=ranked_ids, include_archived=include_archived)
+
+        source = [db.items, db[ARCHIVE_COLLECTION]] if include_archived else db.items
+        try:
+            if ranked_ids is None:
+                return await paginate_faceted(
+                    source, query, limit, after=after, formatter=serialize_item, projection=ITEM_PROJECTION
+                )
+            # Relevance order can't be expressed in the pipeline: page by rank, count by filter
+            page = await list_items(query, limit, after, False, ranked_ids=ranked_ids, include_archived=include_archived)
+            page["facets"] = await facet_counts(source, {"$and": [query, {"_id": {"$in": ranked_ids}}]})
+            return page
+        except InvalidCursor:
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
     try:
-        query = {"status": "approved"}
-        if category: query["category"] = {"$regex": category, "$options": "i"}
-        if location: query["location"] = {"$regex": location, "$options": "i"}
-        if date:
-            try:
-                date_obj = datetime.strptime(date, "%Y-%m-%d")
-                query["date"] = {
-                    "$gte": datetime.combine(date_obj, datetime.min.time()),
-                    "$lt": datetime.combine(date_obj, datetime.max.time())
-                }
-            except ValueError:
-                raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
-        
-        if keyword:
-            query["$or"] = [
-                {"title": {"$regex": keyword, "$options": "i"}},
-                {"description": {"$regex": keyword, "$options": "i"}},
-            ]
-        
-        results = await db.items.find(query).to_list(length=100)
-        return [format_item(item) for item in results]
+        if stream:
+            if facets:
+                raise HTTPException(status_code=400, detail="facets cannot be combined with stream")
+            return await run_search()
+        params = {
+            "route": "search", "category": tuple(sorted(category)) if category else None, "location": location,
+            "date": date,
+            "date_from": date_from, "date_to": date_to, "type": type, "keyword": keyword,
+            "limit": limit, "after": after, "include_archived": include_archived, "facets": facets
+        }
+        return await response_cache.respond(
+            request, APPROVED_LISTINGS, params, run_search,
+            case_insensitive=("keyword",)
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in search: {str(e)}")
         raise HTTPException(status_code=500, detail="Error performing search")
 
+@router.get("/{item_id}/matches")
+async def get_item_matches(item_id: str, limit: int = Query(MATCH_MAX_RESULTS, ge=1, le=100)):
+    """Likely counterparts for an item: found reports for a lost item and vice versa."""
+    try:
+        item = await db.items.find_one({"_id": ObjectId(item_id)}, MATCH_FIELDS)
+        if not item:
+            raise HTTPException(status_code=404, detail="Item not found")
+
+        matches = match_index.match(item, limit=limit)
+        docs = await db.items.find(
+            {"_id": {"$in": [m["id"] for m in matches]}, "status": "approved"}, ITEM_PROJECTION
+        ).to_list(length=len(matches))
+        by_id = {doc["_id"]: doc for doc in docs}
+        return ORJSONResponse({
+            "item_id": item_id,
+            "matches": [
+                {**serialize_item(by_id[m["id"]]), "match": {k: v for k, v in m.items() if k != "id"}}
+                for m in matches if m["id"] in by_id
+            ]
+        })
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error matching item {item_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error finding matches")
+
+@router.get("/{item_id}/similar-images")
+async def get_similar_images(
+    item_id: str,
+    limit: int = Query(IMAGE_SIMILARITY_MAX_RESULTS, ge=1, le=100),
+    max_distance: int = Query(IMAGE_SIMILARITY_MAX_DISTANCE, ge=0, le=128)
+):
+    """Approved items whose photo looks like this item's (perceptual-hash Hamming distance)."""
+    try:
+        item = await db.items.find_one(
+            {"_id": ObjectId(item_id)}, {"image_path": 1, "image_phash": 1, "image_dhash": 1}
+        )
+        if not item:
+            raise HTTPException(status_code=404, detail="Item not found")
+        if not item.get("image_path"):
+            raise HTTPException(status_code=404, detail="Item has no photo")
+        if item.get("image_phash") == HASH_FAILED:
+            # Terminal: the photo could not be read, so there is nothing to compare
+            return ORJSONResponse({"item_id": item_id, "hash_failed": True, "matches": []})
+        hashes = item_hashes(item)
+        if hashes is None:
+            # Hashing runs in the background right after upload
+            return ORJSONResponse({"item_id": item_id, "hash_pending": True, "matches": []})
+
+        nearest = image_hash_index.search(hashes, limit=limit, max_distance=max_distance, exclude=item["_id"])
+        docs = await db.items.find(
+            {"_id": {"$in": [oid for oid, _ in nearest]}, "status": "approved"}, ITEM_PROJECTION
+        ).to_list(length=len(nearest))
+        by_id = {doc["_id"]: doc for doc in docs}
+        return ORJSONResponse({
+            "item_id": item_id,
+            "matches": [
+                {**serialize_item(by_id[oid]), "similarity": {"distance": distance}}
+                for oid, distance in nearest if oid in by_id
+            ]
+        })
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error finding similar images for {item_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error finding similar images")
+
 @router.get("/{item_id}")
 async def get_item_by_id(item_id: str):
     try:
-        item = await db.items.find_one({"_id": ObjectId(item_id)})
+        oid = ObjectId(item_id)
+        item = (
+            await db.items.find_one({"_id": oid}, ITEM_PROJECTION)
+            or await db[ARCHIVE_COLLECTION].find_one({"_id": oid}, ITEM_PROJECTION)
+        )
         if not item:
             raise HTTPException(status_code=404, detail="Item not found")
-        return format_item(item)
+        return ORJSONResponse(serialize_item(item))
     except Exception as e:
         logger.error(f"Error fetching item {item_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Error fetching item")
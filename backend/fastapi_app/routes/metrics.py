@@ -0,0 +1,66 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from fastapi_app.auth.dependencies import get_admin_user
+from fastapi_app.admission.middleware import admission
+from fastapi_app.auth.password_pool import password_pool
+from fastapi_app.auth.principal_cache import principal_cache
+from fastapi_app.cache.response_cache import response_cache
+from fastapi_app.config import PROFILER_ENABLED
+from fastapi_app.events.bus import event_bus
+from fastapi_app.metrics.profiler import profile_event_loop
+from fastapi_app.metrics.registry import registry, gauge_lines
+from fastapi_app.stats.counters import item_stats
+from fastapi_app.storage.renditions import image_queue
+
+router = APIRouter()
+
+
+def _subsystem_gauges():
+    """Point-in-time state of the in-process pools, queues and caches."""
+    pool = password_pool.metrics()
+    lines = gauge_lines("password_pool_in_flight", "bcrypt calls running or queued", {(): pool["in_flight"]})
+    lines += gauge_lines("password_pool_rejected", "bcrypt calls shed with 503", {(): pool["rejected_total"]})
+    for name, snapshot in (("hash_latency_seconds", pool["hash_latency_seconds"]),
+                           ("queue_wait_seconds", pool["queue_wait_seconds"])):
+        metric = f"password_pool_{name}"
+        lines += [f"# TYPE {metric} histogram"]
+        lines += [f'{metric}_bucket{{le="{le}"}} {count}' for le, count in snapshot["buckets"].items()]
+        lines += [f"{metric}_sum {snapshot['sum']}", f"{metric}_count {snapshot['count']}"]
+
+    images = image_queue.stats()
+    lines += gauge_lines("image_queue_jobs", "Thumbnail jobs by state", {
+        (("state", state),): images[state] for state in ("queued", "completed", "failed", "dropped")
+    })
+    for cache_name, cache in (("principal", principal_cache), ("response", response_cache.backend)):
+        stats = cache.stats()
+        lines += gauge_lines(f"{cache_name}_cache_entries", f"{cache_name} cache size", {(): stats.get("size", 0)})
+        lines += gauge_lines(f"{cache_name}_cache_hits", f"{cache_name} cache hits", {(): stats.get("hits", 0)})
+        lines += gauge_lines(f"{cache_name}_cache_misses", f"{cache_name} cache misses", {(): stats.get("misses", 0)})
+    lines += gauge_lines("items_by_status", "Live items per moderation status, as counted by this worker", {
+        (("status", status),): n for status, n in item_stats.snapshot()["by_status"].items()
+    })
+    lines += gauge_lines("admission_in_flight", "Requests in flight on concurrency-limited routes", {
+        (("route", route),): n for route, n in admission.stats()["in_flight"].items()
+    })
+    lines += gauge_lines("event_subscribers", "Connected live-update clients", {(): event_bus.stats()["subscribers"]})
+    return lines
+
+
+registry.add_collector(_subsystem_gauges)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus text exposition of request, DB and subsystem metrics."""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
+@router.get("/diag/profile", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(10, gt=0, le=60),
+    current_user: dict = Depends(get_admin_user)
+):
+    """Sample the event loop for `seconds` and return collapsed stacks (feed to flamegraph.pl)."""
+    if not PROFILER_ENABLED:
+        raise HTTPException(status_code=404, detail="Profiler is disabled; set PROFILER_ENABLED=true")
+    return PlainTextResponse(await profile_event_loop(seconds))
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Literal, Optional
 from datetime import datetime
+from fastapi_app.config import BULK_MODERATION_MAX
 
 class ItemBase(BaseModel):
     title: str
@@ -21,4 +22,13 @@ class ItemInDB(ItemBase):
     image_path: Optional[str] = None
     created_at: datetime = datetime.utcnow()
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ModerationAction(BaseModel):
+    id: str
+    action: Literal["approve", "reject"]
+
+
+class BulkModerationRequest(BaseModel):
+    actions: List[ModerationAction] = Field(..., min_length=1, max_length=BULK_MODERATION_MAX)
@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+
+# Fields the dashboards actually render; everything else (e.g. submitted_by_key,
+# image_sha256) stays in Mongo instead of crossing the wire twice.
+ITEM_PROJECTION = {
+    field: 1 for field in (
+        "title", "description", "category", "location", "type", "date", "status",
+        "created_at", "image_path", "image_renditions", "submitted_by",
+        "approved_by", "approved_at", "rejected_by", "rejected_at",
+        "archived_at", "image_store",
+    )
+}
+
+# Exact-type dispatch: one dict lookup per value instead of a chain of isinstance checks
+_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.isoformat,
+    ObjectId: str,
+}
+
+
+def serialize_item(doc: dict) -> dict:
+    """Convert a Mongo item into a JSON-ready dict in a single pass.
+
+    `_id` is exposed as both `id` and `_id` (the frontend reads `id`).
+    """
+    out = {}
+    for key, value in doc.items():
+        convert = _CONVERTERS.get(type(value))
+        out[key] = convert(value) if convert else value
+    out["id"] = out.get("_id")
+    return out
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson. Return it directly from a route to bypass jsonable_encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,91 @@
+import logging
+from typing import List
+
+from bson import ObjectId
+
+from fastapi_app.config import SEARCH_BACKEND
+from fastapi_app.search.inverted_index import FIELD_WEIGHTS, InvertedIndex
+
+logger = logging.getLogger(__name__)
+
+# Only the fields the index needs are pulled from Mongo when (re)building it
+INDEXED_FIELDS = {field: 1 for field in FIELD_WEIGHTS}
+
+
+class SearchBackend:
+    """Keyword search over approved items.
+
+    `search` returns item ids ranked best first; the caller applies any
+    remaining filters and pagination. The `index_item`/`remove_item` hooks are
+    called by the moderation routes as items enter and leave the approved set.
+    """
+
+    async def startup(self, collection) -> None:
+        pass
+
+    def index_item(self, item: dict) -> None:
+        pass
+
+    def remove_item(self, item_id: ObjectId) -> None:
+        pass
+
+    async def search(self, collection, keyword: str, limit: int) -> List[ObjectId]:
+        raise NotImplementedError
+
+
+class MemorySearchBackend(SearchBackend):
+    """Serves searches from an in-process inverted index built at startup."""
+
+    def __init__(self):
+        self.index = InvertedIndex()
+
+    async def startup(self, collection) -> None:
+        # Build aside and swap, so searches during a periodic rebuild see the old index, not a partial one
+        index = InvertedIndex()
+        async for item in collection.find({"status": "approved"}, INDEXED_FIELDS):
+            index.add(item["_id"], item)
+        self.index = index
+        logger.info(f"🔎 Search index built with {len(self.index)} approved items")
+
+    def index_item(self, item: dict) -> None:
+        self.index.add(item["_id"], item)
+
+    def remove_item(self, item_id: ObjectId) -> None:
+        self.index.remove(item_id)
+
+    async def search(self, collection, keyword: str, limit: int) -> List[ObjectId]:
+        return [doc_id for doc_id, _ in self.index.search(keyword, limit)]
+
+
+class MongoTextSearchBackend(SearchBackend):
+    """Delegates to a MongoDB text index; useful when several workers share one dataset."""
+
+    async def startup(self, collection) -> None:
+        await collection.create_index(
+            [(field, "text") for field in FIELD_WEIGHTS],
+            weights={field: int(weight * 10) for field, weight in FIELD_WEIGHTS.items()},
+            name="items_text"
+        )
+
+    async def search(self, collection, keyword: str, limit: int) -> List[ObjectId]:
+        cursor = collection.find(
+            {"$text": {"$search": keyword}, "status": "approved"},
+            {"_id": 1, "score": {"$meta": "textScore"}}
+        ).sort([("score", {"$meta": "textScore"})]).limit(limit)
+        return [doc["_id"] async for doc in cursor]
+
+
+SEARCH_BACKENDS = {
+    "memory": MemorySearchBackend,
+    "mongo": MongoTextSearchBackend,
+}
+
+
+def build_search_engine(name: str = SEARCH_BACKEND) -> SearchBackend:
+    try:
+        return SEARCH_BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown SEARCH_BACKEND '{name}', expected one of {sorted(SEARCH_BACKENDS)}")
+
+
+search_engine = build_search_engine()
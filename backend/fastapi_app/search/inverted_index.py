@@ -0,0 +1,119 @@
+import bisect
+import heapq
+import math
+import re
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = {"a", "an", "and", "at", "in", "is", "it", "of", "on", "or", "the", "to", "with"}
+
+# Matches in short, descriptive fields count for more than matches in free text
+FIELD_WEIGHTS = {"title": 3.0, "category": 2.0, "location": 1.5, "description": 1.0}
+
+# A prefix hit ("wal" -> "wallet") scores less than the whole word
+PREFIX_PENALTY = 0.5
+MAX_PREFIX_EXPANSIONS = 50
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower-case `text` and split it into indexable word tokens."""
+    if not text:
+        return []
+    return [tok for tok in TOKEN_RE.findall(text.lower()) if tok not in STOPWORDS]
+
+
+class InvertedIndex:
+    """In-memory token -> document postings with prefix lookup and TF-IDF style ranking.
+
+    Documents are dicts carrying the fields in FIELD_WEIGHTS; they are keyed by
+    any hashable id (the Mongo ObjectId in practice).
+    """
+
+    def __init__(self, field_weights: Dict[str, float] = FIELD_WEIGHTS):
+        self.field_weights = field_weights
+        self._postings: Dict[str, Dict[Hashable, float]] = defaultdict(dict)
+        self._doc_terms: Dict[Hashable, Set[str]] = {}
+        # Sorted vocabulary so prefix matching is a bisect, not a scan
+        self._vocab: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._doc_terms
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._vocab.clear()
+
+    def add(self, doc_id: Hashable, doc: dict) -> None:
+        """Index `doc`, replacing any previous version stored under `doc_id`."""
+        if doc_id in self._doc_terms:
+            self.remove(doc_id)
+
+        weights: Dict[str, float] = defaultdict(float)
+        for field, field_weight in self.field_weights.items():
+            for tok in tokenize(doc.get(field)):
+                weights[tok] += field_weight
+        if not weights:
+            return
+
+        for tok, weight in weights.items():
+            postings = self._postings[tok]
+            if not postings:
+                bisect.insort(self._vocab, tok)
+            postings[doc_id] = weight
+        self._doc_terms[doc_id] = set(weights)
+
+    def remove(self, doc_id: Hashable) -> None:
+        for tok in self._doc_terms.pop(doc_id, ()):
+            postings = self._postings.get(tok)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[tok]
+                pos = bisect.bisect_left(self._vocab, tok)
+                if pos < len(self._vocab) and self._vocab[pos] == tok:
+                    self._vocab.pop(pos)
+
+    def _expand(self, prefix: str) -> Iterable[str]:
+        """Yield vocabulary terms that start with `prefix` (bounded)."""
+        pos = bisect.bisect_left(self._vocab, prefix)
+        for tok in self._vocab[pos:pos + MAX_PREFIX_EXPANSIONS]:
+            if not tok.startswith(prefix):
+                break
+            yield tok
+
+    def _idf(self, tok: str) -> float:
+        return math.log(1 + len(self._doc_terms) / len(self._postings[tok]))
+
+    def search(self, query: str, limit: int = 100) -> List[Tuple[Hashable, float]]:
+        """Return up to `limit` (doc_id, score) pairs matching every query token, best first.
+
+        Each query token matches either as a whole word or as a prefix of one.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        scores: Optional[Dict[Hashable, float]] = None
+        # Rarest terms first keeps the running intersection small
+        for term in sorted(set(terms), key=lambda t: len(self._postings.get(t, ()))):
+            term_scores: Dict[Hashable, float] = defaultdict(float)
+            for tok in self._expand(term):
+                factor = 1.0 if tok == term else PREFIX_PENALTY
+                idf = self._idf(tok)
+                for doc_id, weight in self._postings[tok].items():
+                    if scores is None or doc_id in scores:
+                        term_scores[doc_id] = max(term_scores[doc_id], weight * idf * factor)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {doc_id: scores[doc_id] + s for doc_id, s in term_scores.items()}
+            if not scores:
+                return []
+
+        return heapq.nlargest(limit, scores.items(), key=lambda kv: (kv[1], kv[0]))
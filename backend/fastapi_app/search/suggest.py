@@ -0,0 +1,126 @@
+import heapq
+import logging
+import re
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SUGGEST_FIELDS = ("category", "location")
+
+# Common shorthand in free-typed locations, expanded so "Library 2nd flr" == "library 2nd floor"
+ABBREVIATIONS = {
+    "flr": "floor", "fl": "floor", "bldg": "building", "blk": "block", "rm": "room",
+    "lib": "library", "caf": "cafeteria",
+}
+WORD_RE = re.compile(r"[^\W_]+")
+
+
+def normalise(value: Optional[str], partial: bool = False) -> str:
+    """Case-fold, drop punctuation, collapse whitespace and expand abbreviations.
+
+    With `partial` (text still being typed) the last word is left as is.
+    """
+    words = WORD_RE.findall((value or "").casefold())
+    last = words.pop() if partial and words else None
+    words = [ABBREVIATIONS.get(word, word) for word in words]
+    return " ".join(words + ([last] if last else []))
+
+
+class PrefixIndex:
+    """Sorted-array prefix index over the normalised values of one field.
+
+    Every word start of a value is an entry ("library 2nd floor" is reachable
+    from "lib", "2nd" and "floor"); a prefix lookup is a bisect into the sorted
+    entries, then the matching values are ranked by how many items use them.
+    The most common original spelling is what gets suggested.
+    """
+
+    def __init__(self):
+        self.entries: List[Tuple[str, str]] = []  # (suffix starting at a word, normalised value)
+        self.counts: Counter = Counter()
+        self.spellings: Dict[str, Counter] = defaultdict(Counter)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    @staticmethod
+    def _suffixes(key: str) -> List[str]:
+        words = key.split(" ")
+        return [" ".join(words[i:]) for i in range(len(words))]
+
+    def add(self, value: Optional[str], n: int = 1) -> None:
+        key = normalise(value)
+        if not key:
+            return
+        if key not in self.counts:
+            for suffix in self._suffixes(key):
+                insort(self.entries, (suffix, key))
+        self.counts[key] += n
+        self.spellings[key][" ".join(value.split())] += n
+
+    def remove(self, value: Optional[str], n: int = 1) -> None:
+        key = normalise(value)
+        if key not in self.counts:
+            return
+        self.counts[key] -= n
+        spelling = " ".join(value.split())
+        self.spellings[key][spelling] -= n
+        if self.spellings[key][spelling] <= 0:
+            del self.spellings[key][spelling]
+        if self.counts[key] <= 0:
+            del self.counts[key], self.spellings[key]
+            for suffix in self._suffixes(key):
+                i = bisect_left(self.entries, (suffix, key))
+                if i < len(self.entries) and self.entries[i] == (suffix, key):
+                    del self.entries[i]
+
+    def suggest(self, prefix: str, limit: int) -> List[dict]:
+        matches = set()
+        # The word being typed may be an unfinished word or a complete abbreviation ("bldg")
+        for normalised in {normalise(prefix, partial=True), normalise(prefix)} - {""}:
+            for i in range(bisect_left(self.entries, (normalised,)), len(self.entries)):
+                suffix, key = self.entries[i]
+                if not suffix.startswith(normalised):
+                    break
+                matches.add(key)
+        best = heapq.nlargest(limit, matches, key=lambda key: (self.counts[key], -len(key)))
+        return [
+            {"value": self.spellings[key].most_common(1)[0][0], "count": self.counts[key]}
+            for key in best
+        ]
+
+
+class SuggestIndex:
+    """Typeahead for category and location, over approved items only (unmoderated text never surfaces)."""
+
+    def __init__(self):
+        self.fields = {field: PrefixIndex() for field in SUGGEST_FIELDS}
+
+    async def startup(self, collection) -> None:
+        fields = {field: PrefixIndex() for field in SUGGEST_FIELDS}
+        for field, index in fields.items():
+            pipeline = [{"$match": {"status": "approved"}}, {"$group": {"_id": f"${field}", "n": {"$sum": 1}}}]
+            async for row in collection.aggregate(pipeline):
+                if isinstance(row["_id"], str):
+                    index.add(row["_id"], row["n"])
+        self.fields = fields
+        logger.info("💡 Suggest index built: " + ", ".join(f"{len(ix)} {f} values" for f, ix in fields.items()))
+
+    def add(self, item: dict) -> None:
+        for field, index in self.fields.items():
+            if isinstance(item.get(field), str):
+                index.add(item[field])
+
+    def remove(self, item: dict) -> None:
+        for field, index in self.fields.items():
+            if isinstance(item.get(field), str):
+                index.remove(item[field])
+
+    def suggest(self, prefix: str, field: Optional[str] = None, limit: int = 8) -> Dict[str, List[dict]]:
+        fields = [field] if field else SUGGEST_FIELDS
+        return {name: self.fields[name].suggest(prefix, limit) for name in fields}
+
+
+suggest_index = SuggestIndex()
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DIMENSIONS = ("status", "type", "category")
+
+
+def _known(counter: Counter) -> dict:
+    """Drop the bucket for documents missing the field (not a valid JSON key)."""
+    return {key: n for key, n in counter.items() if key is not None}
+
+
+class ItemStats:
+    """In-process item counters, kept current by the submit/moderation routes.
+
+    Counts by status, type and category plus per-submitter totals (whose keys
+    are the distinct-submitters set). Updates are plain dict arithmetic on the
+    event loop, so they never interleave; `reconcile` recomputes everything
+    from the collection to correct drift (e.g. writes made outside the API).
+
+    The counters are approximate: each worker keeps its own and only sees its
+    own writes between reconciliations, so workers may disagree by what the
+    others did since then. They cover live items (the hot collection);
+    archived items are not in any breakdown and are only counted, separately,
+    as `archived_items`.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.archived = 0
+        self.counts = {dim: Counter() for dim in DIMENSIONS}
+        self.per_user = Counter()
+        self.reconciled_at: Optional[datetime] = None
+        self.last_drift = 0
+
+    def item_added(self, item: dict) -> None:
+        self.total += 1
+        for dim in DIMENSIONS:
+            self.counts[dim][item.get(dim)] += 1
+        if item.get("submitted_by"):
+            self.per_user[item["submitted_by"]] += 1
+
+    def item_removed(self, item: dict) -> None:
+        self.total -= 1
+        for dim in DIMENSIONS:
+            self._decrement(self.counts[dim], item.get(dim))
+        if item.get("submitted_by"):
+            self._decrement(self.per_user, item["submitted_by"])
+
+    def item_archived(self, item: dict) -> None:
+        """The item left the live counts for the archive."""
+        self.item_removed(item)
+        self.archived += 1
+
+    @staticmethod
+    def _decrement(counter: Counter, key) -> None:
+        counter[key] -= 1
+        if counter[key] <= 0:
+            del counter[key]
+
+    def status_changed(self, old_status: Optional[str], new_status: str) -> None:
+        if old_status == new_status:
+            return
+        self._decrement(self.counts["status"], old_status)
+        self.counts["status"][new_status] += 1
+
+    @property
+    def submitters(self):
+        return sorted(self.per_user)
+
+    async def reconcile(self, collection, archive=None) -> int:
+        """Recompute the counters with one aggregation per dimension; returns how far they had drifted."""
+        pipelines = [[{"$group": {"_id": f"${dim}", "n": {"$sum": 1}}}] for dim in DIMENSIONS + ("submitted_by",)]
+        results = await asyncio.gather(*(collection.aggregate(p).to_list(length=None) for p in pipelines))
+        if archive is not None:
+            self.archived = await archive.count_documents({})
+        fresh = [Counter({row["_id"]: row["n"] for row in rows}) for rows in results]
+        counts, per_user = dict(zip(DIMENSIONS, fresh[:-1])), fresh[-1]
+        per_user.pop(None, None)
+
+        drift = sum(
+            abs(new[key] - old[key])
+            for new, old in [(counts[dim], self.counts[dim]) for dim in DIMENSIONS] + [(per_user, self.per_user)]
+            for key in set(new) | set(old)
+        )
+        self.counts, self.per_user = counts, per_user
+        self.total = sum(counts["status"].values())
+        self.reconciled_at = datetime.utcnow()
+        self.last_drift = drift
+        return drift
+
+    async def startup(self, collection, archive=None) -> None:
+        await self.reconcile(collection, archive)
+        logger.info(f"📊 Item stats loaded: {self.total} items, {len(self.per_user)} submitters")
+
+    async def reconcile_forever(self, collection, interval: int, archive=None) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                drift = await self.reconcile(collection, archive)
+                if drift:
+                    logger.warning(f"⚠️ Item stats drifted by {drift}; counters corrected")
+            except Exception as e:
+                logger.error(f"Item stats reconciliation failed: {e}")
+
+    def snapshot(self) -> dict:
+        return {
+            "total_items": self.total,
+            "by_status": _known(self.counts["status"]),
+            "by_type": _known(self.counts["type"]),
+            "by_category": _known(self.counts["category"]),
+            "distinct_submitters": len(self.per_user),
+            "archived_items": self.archived,
+            "reconciled_at": self.reconciled_at,
+            # Per-worker counters, exact as of reconciled_at (see ItemStats)
+            "approximate": True,
+        }
+
+
+item_stats = ItemStats()
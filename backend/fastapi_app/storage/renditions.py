@@ -0,0 +1,54 @@
+import logging
+import os
+from typing import Dict
+
+from PIL import Image, ImageOps
+from starlette.concurrency import run_in_threadpool
+
+from fastapi_app.config import IMAGE_WORKERS, IMAGE_QUEUE_SIZE
+from fastapi_app.tasks.background import BackgroundQueue
+
+logger = logging.getLogger(__name__)
+
+# name -> longest edge in pixels
+RENDITION_SIZES = {"thumb": 320, "medium": 960}
+JPEG_QUALITY = 82
+WEBP_QUALITY = 78
+
+image_queue = BackgroundQueue("images", workers=IMAGE_WORKERS, maxsize=IMAGE_QUEUE_SIZE)
+
+
+def rendition_paths(image_path: str) -> Dict[str, str]:
+    """Relative paths of every rendition derived from an original image path."""
+    stem = os.path.splitext(image_path)[0]
+    paths = {}
+    for name in RENDITION_SIZES:
+        paths[name] = f"{stem}_{name}.jpg"
+        paths[f"{name}_webp"] = f"{stem}_{name}.webp"
+    return paths
+
+
+def build_renditions(upload_folder: str, image_path: str) -> Dict[str, str]:
+    """Write resized JPEG and WebP copies next to the original (blocking, CPU-bound).
+
+    Originals are content-addressed, so renditions that already exist are reused.
+    """
+    paths = rendition_paths(image_path)
+    if all(os.path.exists(os.path.join(upload_folder, p)) for p in paths.values()):
+        return paths
+
+    with Image.open(os.path.join(upload_folder, image_path)) as original:
+        image = ImageOps.exif_transpose(original).convert("RGB")
+    for name, edge in RENDITION_SIZES.items():
+        resized = image.copy()
+        resized.thumbnail((edge, edge), Image.LANCZOS)
+        resized.save(os.path.join(upload_folder, paths[name]), "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+        resized.save(os.path.join(upload_folder, paths[f"{name}_webp"]), "WEBP", quality=WEBP_QUALITY, method=4)
+    return paths
+
+
+async def generate_renditions(collection, item_id, upload_folder: str, image_path: str) -> None:
+    """Background job: build renditions for an item's photo and record them on the item."""
+    renditions = await run_in_threadpool(build_renditions, upload_folder, image_path)
+    await collection.update_one({"_id": item_id}, {"$set": {"image_renditions": renditions}})
+    logger.info(f"🖼️ Renditions ready for item {item_id}")
@@ -0,0 +1,169 @@
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import zipfile
+from typing import Dict, NamedTuple, Tuple
+
+import orjson
+
+from fastapi import HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from fastapi_app.config import MAX_UPLOAD_BYTES, UPLOAD_CHUNK_BYTES, MULTIPART_OVERHEAD_BYTES, MAX_IMPORT_BYTES
+
+logger = logging.getLogger(__name__)
+
+EXTENSION_RE = re.compile(r"^\.[a-z0-9]{1,5}$")
+
+
+class StoredUpload(NamedTuple):
+    path: str      # relative to the upload folder, e.g. "ab/ab12...ef.jpg"
+    sha256: str
+    size: int
+    deduplicated: bool
+
+
+def _safe_extension(filename: str) -> str:
+    ext = os.path.splitext(filename or "")[1].lower()
+    return ext if EXTENSION_RE.match(ext) else ""
+
+
+def _finalize(tmp_path: str, final_path: str) -> bool:
+    """Move the temp file into place; returns True if an identical file was already stored."""
+    os.makedirs(os.path.dirname(final_path), exist_ok=True)
+    try:
+        # Reusing the stored copy: refresh its mtime so the archiver leaves it alone (see retire_images)
+        os.utime(final_path)
+    except FileNotFoundError:
+        os.replace(tmp_path, final_path)
+        return False
+    os.remove(tmp_path)
+    return True
+
+
+async def save_upload(file: UploadFile, upload_folder: str, max_bytes: int = MAX_UPLOAD_BYTES,
+                      chunk_size: int = UPLOAD_CHUNK_BYTES) -> StoredUpload:
+    """Stream `file` to a content-addressed path under `upload_folder`.
+
+    The file is read and written chunk by chunk off the event loop, hashed in
+    the same pass and rejected with 413 as soon as it exceeds `max_bytes`.
+    Identical photos end up at the same path and are stored only once.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=upload_folder, prefix=".upload-")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = await file.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Image exceeds the {max_bytes // (1024 * 1024)} MB upload limit"
+                    )
+                digest.update(chunk)
+                await run_in_threadpool(out.write, chunk)
+
+        sha256 = digest.hexdigest()
+        rel_path = f"{sha256[:2]}/{sha256}{_safe_extension(file.filename)}"
+        deduplicated = await run_in_threadpool(_finalize, tmp_path, os.path.join(upload_folder, rel_path))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    if deduplicated:
+        logger.info(f"♻️ Upload matches existing image {rel_path}; stored once")
+    return StoredUpload(path=rel_path, sha256=sha256, size=size, deduplicated=deduplicated)
+
+
+def store_archive_member(archive: zipfile.ZipFile, name: str, upload_folder: str,
+                         max_bytes: int = MAX_UPLOAD_BYTES, chunk_size: int = UPLOAD_CHUNK_BYTES) -> StoredUpload:
+    """Blocking counterpart of `save_upload` for one image inside a zip archive (run it in a thread).
+
+    The size limit applies to the decompressed bytes, so a zip bomb stops at `max_bytes`.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=upload_folder, prefix=".upload-")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out, archive.open(name) as src:
+            while True:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ValueError(f"image exceeds the {max_bytes // (1024 * 1024)} MB upload limit")
+                digest.update(chunk)
+                out.write(chunk)
+
+        sha256 = digest.hexdigest()
+        rel_path = f"{sha256[:2]}/{sha256}{_safe_extension(name)}"
+        deduplicated = _finalize(tmp_path, os.path.join(upload_folder, rel_path))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return StoredUpload(path=rel_path, sha256=sha256, size=size, deduplicated=deduplicated)
+
+
+# (method, path) -> max request body bytes
+BODY_LIMITS: Dict[Tuple[str, str], int] = {
+    ("POST", "/items/submit"): MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES,
+    ("POST", "/items/import"): MAX_IMPORT_BYTES,
+}
+
+
+class BodySizeLimitMiddleware:
+    """ASGI middleware capping the request body of upload routes while it is received.
+
+    FastAPI reads a whole multipart body into a temp file before the handler
+    runs, so save_upload's own check comes too late to stop a huge upload.
+    This rejects on Content-Length up front, and otherwise counts body chunks
+    and aborts with 413 as soon as the cap is passed.
+    """
+
+    def __init__(self, app, limits: Dict[Tuple[str, str], int] = BODY_LIMITS):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get((scope.get("method"), scope.get("path", "").rstrip("/"))) \
+            if scope["type"] == "http" else None
+        if limit is None:
+            return await self.app(scope, receive, send)
+
+        detail = f"Request body exceeds the {limit // (1024 * 1024)} MB limit"
+        length = dict(scope["headers"]).get(b"content-length", b"")
+        if length.isdigit() and int(length) > limit:
+            return await self.reject(send, detail)
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Raised inside body parsing, so FastAPI renders it as the response
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    @staticmethod
+    async def reject(send, detail: str) -> None:
+        body = orjson.dumps({"detail": detail})
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundQueue:
+    """In-process job queue drained by a fixed number of worker tasks.
+
+    The queue is bounded: `submit` refuses work instead of growing without
+    limit, so a burst of uploads cannot exhaust memory. Start and stop it from
+    the app lifespan.
+    """
+
+    def __init__(self, name: str, workers: int, maxsize: int):
+        self.name = name
+        self.workers = workers
+        self._queue: Optional[asyncio.Queue] = None
+        self._maxsize = maxsize
+        self._tasks: List[asyncio.Task] = []
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+
+    def start(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self._maxsize)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, job: Callable[..., Awaitable], *args) -> bool:
+        """Queue `job(*args)`; returns False if the queue is full or not running."""
+        if self._queue is None:
+            self.dropped += 1
+            return False
+        try:
+            self._queue.put_nowait((job, args))
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"⚠️ Background queue '{self.name}' is full; dropping {job.__name__}")
+            return False
+
+    async def _worker(self) -> None:
+        while True:
+            job, args = await self._queue.get()
+            try:
+                await job(*args)
+                self.completed += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"❌ Background job {job.__name__} failed in '{self.name}': {e}")
+            finally:
+                self._queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until everything queued so far has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize() if self._queue else 0,
+            "workers": self.workers,
+            "completed": self.completed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+        }
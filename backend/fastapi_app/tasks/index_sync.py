@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Set
+
+from bson import ObjectId
+
+from fastapi_app.config import SEARCH_BACKEND
+from fastapi_app.matching.engine import match_index
+from fastapi_app.matching.image_hash import image_hash_index, item_hashes
+from fastapi_app.search.engine import search_engine
+from fastapi_app.search.suggest import suggest_index
+
+logger = logging.getLogger(__name__)
+
+# Each sync re-reads a little of the previous one, covering writes stamped just
+# before a sync started but committed after it read (and modest clock skew)
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+async def load_indexes(collection, include_search: bool = True) -> None:
+    """(Re)build every in-process index of approved items; they are independent, so together."""
+    loaders = [
+        suggest_index.startup(collection),
+        match_index.startup(collection),
+        image_hash_index.startup(collection),
+    ]
+    if include_search:
+        loaders.append(search_engine.startup(collection))
+    await asyncio.gather(*loaders)
+
+
+class IndexSync:
+    """Keeps this worker's in-process indexes in step with the items collection.
+
+    Each worker updates its own indexes as it moderates; `sync` brings in what
+    other workers did by reading only the items moderated (`moderated_at`) or
+    archived (`archived_at`) since the previous sync. The set of listed ids
+    makes applying a change twice harmless, which is what lets consecutive
+    syncs overlap.
+    """
+
+    def __init__(self):
+        self.listed: Set[ObjectId] = set()
+        self.synced_to: Optional[datetime] = None
+
+    def item_listed(self, item: dict) -> None:
+        """An item became public (approved): add it to the in-process indexes."""
+        if item["_id"] in self.listed:
+            return
+        self.listed.add(item["_id"])
+        search_engine.index_item(item)
+        match_index.add(item)
+        suggest_index.add(item)
+        hashes = item_hashes(item)
+        if hashes:
+            image_hash_index.add(item["_id"], hashes)
+
+    def item_unlisted(self, item: dict) -> None:
+        """An approved item was withdrawn or archived: drop it from the in-process indexes."""
+        if item["_id"] not in self.listed:
+            return
+        self.listed.discard(item["_id"])
+        search_engine.remove_item(item["_id"])
+        match_index.remove(item["_id"])
+        suggest_index.remove(item)
+        image_hash_index.remove(item["_id"])
+
+    async def rebuild(self, collection, archive, include_search: bool = True) -> None:
+        """Full rebuild, then replay whatever was moderated while it ran (the swap drops those updates)."""
+        started = datetime.utcnow()
+        listed = {doc["_id"] async for doc in collection.find({"status": "approved"}, {"_id": 1})}
+        await load_indexes(collection, include_search)
+        self.listed = listed
+        self.synced_to = started - SYNC_OVERLAP
+        await self.sync(collection, archive)
+
+    async def sync(self, collection, archive) -> int:
+        """Apply items moderated or archived since the last sync; returns how many were read."""
+        started = datetime.utcnow()
+        since = {"$gte": self.synced_to}
+        changed = 0
+        async for item in collection.find({"moderated_at": since}):
+            if item.get("status") == "approved":
+                self.item_listed(item)
+            else:
+                self.item_unlisted(item)
+            changed += 1
+        async for item in archive.find({"archived_at": since}):
+            self.item_unlisted(item)
+            changed += 1
+        self.synced_to = started - SYNC_OVERLAP
+        return changed
+
+
+index_sync = IndexSync()
+
+
+async def sync_indexes_forever(collection, archive, interval: int, rebuild_interval: int) -> None:
+    """Incrementally sync the indexes every `interval` seconds.
+
+    A full rebuild every `rebuild_interval` seconds (0 never) catches anything
+    the timestamps do not, such as items edited or deleted by hand.
+    """
+    rebuilt = time.monotonic()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if rebuild_interval > 0 and time.monotonic() - rebuilt >= rebuild_interval:
+                # The mongo search backend has no in-process state to refresh
+                await index_sync.rebuild(collection, archive, include_search=SEARCH_BACKEND == "memory")
+                rebuilt = time.monotonic()
+            else:
+                await index_sync.sync(collection, archive)
+        except Exception as e:
+            logger.error(f"Index sync failed: {e}")
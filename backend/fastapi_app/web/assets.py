@@ -0,0 +1,183 @@
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+from typing import Dict, Optional, Set, Tuple
+
+from fastapi import HTTPException, Request
+from fastapi.responses import Response
+
+try:
+    import brotli
+except ImportError:  # optional: without it assets are served gzip-only
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+ASSET_DIRS = ("css", "js", "assets")
+# Pages rendered into memory, keyed by the URL they are served at
+PAGES = {
+    "/": "index.html",
+    "/signup": "signup.html",
+    "/static/pages/user-dashboard.html": "pages/user-dashboard.html",
+    "/static/pages/admin-dashboard.html": "pages/admin-dashboard.html",
+}
+COMPRESSIBLE = {".css", ".js", ".html", ".svg", ".json", ".txt"}
+MIN_COMPRESS_BYTES = 512
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Local (relative or /static-prefixed) asset references in HTML, e.g. href="../css/styles.css"
+ASSET_REF = re.compile(r'(href|src)="(?:\.\./|/static/|/)?((?:css|js|assets)/[^"?#]+)"')
+# Each encoded body is a different representation, so it gets its own entity tag
+ETAG_SUFFIXES = {"identity": "", "gzip": "-gz", "br": "-br"}
+# One entity tag in an If-None-Match list: optionally weak, quoted (commas are allowed inside)
+ENTITY_TAG = re.compile(r'\s*(?:W/)?("[^"]*")\s*(?:,|$)')
+
+
+class Asset:
+    """One file held in memory, with its pre-compressed variants."""
+
+    __slots__ = ("media_type", "etag", "etags", "variants")
+
+    def __init__(self, body: bytes, media_type: str, compress: bool):
+        self.media_type = media_type
+        digest = hashlib.sha256(body).hexdigest()[:16]
+        self.etag = '"%s"' % digest
+        self.variants = {"identity": body}
+        if compress and len(body) >= MIN_COMPRESS_BYTES:
+            self.variants["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+            if brotli is not None:
+                self.variants["br"] = brotli.compress(body, quality=11)
+        self.etags = {coding: '"%s%s"' % (digest, ETAG_SUFFIXES[coding]) for coding in self.variants}
+
+    @property
+    def fingerprint(self) -> str:
+        return self.etag.strip('"')[:8]
+
+
+def accepted_encodings(header: str) -> Dict[str, float]:
+    """Parse Accept-Encoding into {coding: q}."""
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if coding:
+            accepted[coding.lower()] = q
+    return accepted
+
+
+def entity_tags(header: str) -> Optional[Set[str]]:
+    """Parse If-None-Match into its opaque tags (weakness dropped: the comparison is weak);
+    None for "*", which matches any current representation."""
+    if header.strip() == "*":
+        return None
+    return {match.group(1) for match in ENTITY_TAG.finditer(header)}
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    tags = entity_tags(header)
+    return tags is None or etag in tags
+
+
+def negotiate(asset: Asset, header: str) -> str:
+    """Pick the smallest variant the client accepts (br, then gzip, else identity)."""
+    accepted = accepted_encodings(header)
+    for coding in ("br", "gzip"):
+        if coding in asset.variants and accepted.get(coding, accepted.get("*", 0)) > 0:
+            return coding
+    return "identity"
+
+
+def fingerprinted(url: str, asset: Asset) -> str:
+    """/css/styles.css -> /css/styles.<hash>.css"""
+    root, ext = os.path.splitext(url)
+    return f"{root}.{asset.fingerprint}{ext}"
+
+
+class AssetBundle:
+    """Frontend HTML, CSS, JS and images loaded once at startup and served from memory.
+
+    Assets are reachable under their plain URL (revalidated via ETag) and a
+    content-fingerprinted URL that is cached as immutable; HTML pages are
+    rewritten to reference the fingerprinted URLs.
+    """
+
+    def __init__(self):
+        self.assets: Dict[str, Tuple[Asset, bool]] = {}  # url -> (asset, immutable)
+        self.urls: Dict[str, str] = {}  # plain url -> fingerprinted url
+        self.pages: Dict[str, Asset] = {}
+
+    def load(self, frontend_path: str) -> None:
+        assets, urls = {}, {}
+        for directory in ASSET_DIRS:
+            base = os.path.join(frontend_path, directory)
+            for dirpath, _, filenames in os.walk(base):
+                for filename in filenames:
+                    full = os.path.join(dirpath, filename)
+                    url = "/" + os.path.relpath(full, frontend_path).replace(os.sep, "/")
+                    asset = self._read(full)
+                    assets[url] = (asset, False)
+                    urls[url] = fingerprinted(url, asset)
+                    assets[urls[url]] = (asset, True)
+        self.assets, self.urls = assets, urls
+
+        pages = {}
+        for route, filename in PAGES.items():
+            with open(os.path.join(frontend_path, filename), encoding="utf-8") as f:
+                html = self.rewrite(f.read())
+            pages[route] = Asset(html.encode("utf-8"), "text/html; charset=utf-8", compress=True)
+        self.pages = pages
+
+        compressed = sum(1 for asset, immutable in assets.values() if not immutable and "gzip" in asset.variants)
+        logger.info(f"🗜️ Loaded {len(urls)} static assets ({compressed} pre-compressed) and {len(pages)} pages"
+                    f"{'' if brotli else ' (brotli unavailable, gzip only)'}")
+
+    @staticmethod
+    def _read(path: str) -> Asset:
+        with open(path, "rb") as f:
+            body = f.read()
+        ext = os.path.splitext(path)[1].lower()
+        media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if media_type.startswith("text/") or ext == ".js":
+            media_type += "; charset=utf-8"
+        return Asset(body, media_type, compress=ext in COMPRESSIBLE)
+
+    def rewrite(self, html: str) -> str:
+        """Point local css/js/asset references at their fingerprinted URLs."""
+        def replace(match):
+            url = self.urls.get("/" + match.group(2))
+            return f'{match.group(1)}="{url}"' if url else match.group(0)
+        return ASSET_REF.sub(replace, html)
+
+    def respond(self, request: Request, asset: Asset, cache_control: str) -> Response:
+        coding = negotiate(asset, request.headers.get("accept-encoding", ""))
+        headers = {"ETag": asset.etags[coding], "Cache-Control": cache_control}
+        if len(asset.variants) > 1:
+            headers["Vary"] = "Accept-Encoding"
+        if not_modified(request, asset.etags[coding]):
+            return Response(status_code=304, headers=headers)
+        if coding != "identity":
+            headers["Content-Encoding"] = coding
+        return Response(asset.variants[coding], media_type=asset.media_type, headers=headers)
+
+    def asset_response(self, request: Request, url: Optional[str] = None) -> Response:
+        entry = self.assets.get(url or request.url.path)
+        if entry is None:
+            raise HTTPException(status_code=404, detail="Not Found")
+        asset, immutable = entry
+        return self.respond(request, asset, IMMUTABLE if immutable else "no-cache")
+
+    def page_response(self, request: Request, route: str) -> Response:
+        return self.respond(request, self.pages[route], "no-cache")
+
+
+static_assets = AssetBundle()
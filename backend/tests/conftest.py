@@ -0,0 +1,4 @@
+import os
+
+# Settings are read at import time, so set them before any fastapi_app module is imported
+os.environ.setdefault("SECRET_KEY", "test-secret")
@@ -0,0 +1,57 @@
+import asyncio
+import os
+import time
+
+from mongomock_motor import AsyncMongoMockClient
+
+from fastapi_app.db.archive import Archiver, RECENT_UPLOAD_SECONDS
+
+
+def store(folder, rel_path, age_seconds):
+    path = os.path.join(folder, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write("img")
+    then = time.time() - age_seconds
+    os.utime(path, (then, then))
+
+
+def make_archiver(tmp_path):
+    database = AsyncMongoMockClient()["test"]
+    uploads = str(tmp_path / "uploads")
+    os.makedirs(uploads)
+    return Archiver(database.items, database.items_archive, uploads, image_policy="delete")
+
+
+def test_unreferenced_old_photo_is_retired(tmp_path):
+    archiver = make_archiver(tmp_path)
+    store(archiver.upload_folder, "ab/old.jpg", age_seconds=10 * RECENT_UPLOAD_SECONDS)
+
+    assert asyncio.run(archiver.retire_images([{"image_path": "ab/old.jpg"}])) == 1
+    assert not os.path.exists(os.path.join(archiver.upload_folder, "ab/old.jpg"))
+
+
+def test_photo_reused_by_a_recent_upload_is_kept(tmp_path):
+    archiver = make_archiver(tmp_path)
+    # A deduplicated upload refreshed the mtime but has not inserted its item yet
+    store(archiver.upload_folder, "ab/reused.jpg", age_seconds=1)
+
+    assert asyncio.run(archiver.retire_images([{"image_path": "ab/reused.jpg"}])) == 0
+    assert os.path.exists(os.path.join(archiver.upload_folder, "ab/reused.jpg"))
+
+
+def test_photo_referenced_while_being_retired_is_restored(tmp_path):
+    archiver = make_archiver(tmp_path)
+    store(archiver.upload_folder, "ab/claimed.jpg", age_seconds=10 * RECENT_UPLOAD_SECONDS)
+    checks = []
+
+    async def referenced(image_path):
+        # Unreferenced at the first check; a new item uses the photo by the second
+        checks.append(image_path)
+        return len(checks) > 1
+
+    archiver.referenced = referenced
+
+    assert asyncio.run(archiver.retire_images([{"image_path": "ab/claimed.jpg"}])) == 0
+    assert os.path.exists(os.path.join(archiver.upload_folder, "ab/claimed.jpg"))
+    assert not os.listdir(os.path.join(archiver.staging_dir, "ab"))
@@ -0,0 +1,30 @@
+from starlette.requests import Request
+
+from fastapi_app.web.assets import Asset, AssetBundle, entity_tags
+
+CSS = Asset(b"body { color: black; }\n" * 100, "text/css; charset=utf-8", compress=True)
+
+
+def get(**headers):
+    request = Request({"type": "http", "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()]})
+    return AssetBundle().respond(request, CSS, "no-cache")
+
+
+def test_each_encoding_has_its_own_etag():
+    etags = {get(accept_encoding=coding).headers["etag"] for coding in ("br", "gzip", "identity")}
+    assert len(etags) == len(CSS.variants)
+
+
+def test_if_none_match_is_compared_per_encoding():
+    gzip_etag = get(accept_encoding="gzip").headers["etag"]
+    assert get(accept_encoding="gzip", if_none_match=gzip_etag).status_code == 304
+    # A cached gzip body is not a valid identity response
+    assert get(accept_encoding="identity", if_none_match=gzip_etag).status_code == 200
+
+
+def test_if_none_match_lists_weak_tags_and_star():
+    identity_etag = get().headers["etag"]
+    assert get(if_none_match=f'"other", W/{identity_etag}').status_code == 304
+    assert get(if_none_match="*").status_code == 304
+    assert get(if_none_match='"other"').status_code == 200
+    assert entity_tags('W/"a", "b,c"') == {'"a"', '"b,c"'}
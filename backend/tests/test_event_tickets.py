@@ -0,0 +1,27 @@
+import asyncio
+
+from mongomock_motor import AsyncMongoMockClient
+
+from fastapi_app.events.tickets import issue_ticket, redeem_ticket
+
+ADMIN = {"username": "admin", "role": "admin", "id": 1}
+
+
+def test_ticket_works_once():
+    async def scenario():
+        tickets = AsyncMongoMockClient()["test"]["event_tickets"]
+        ticket = await issue_ticket(tickets, ADMIN)
+        return await redeem_ticket(tickets, ticket), await redeem_ticket(tickets, ticket)
+
+    first, second = asyncio.run(scenario())
+    assert first["username"] == "admin" and first["role"] == "admin"
+    assert second is None
+
+
+def test_expired_ticket_is_refused():
+    async def scenario():
+        tickets = AsyncMongoMockClient()["test"]["event_tickets"]
+        ticket = await issue_ticket(tickets, ADMIN, ttl=-1)
+        return await redeem_ticket(tickets, ticket)
+
+    assert asyncio.run(scenario()) is None
@@ -0,0 +1,48 @@
+import asyncio
+import io
+
+import orjson
+from mongomock_motor import AsyncMongoMockClient
+
+from fastapi_app.ingest.importer import ItemImporter, iter_rows
+
+ROW = {"title": "Blue wallet", "description": "Leather", "category": "Wallets",
+       "location": "Library", "type": "lost", "date": "2024-05-01"}
+
+
+def run_import(lines, batch_size=2):
+    collection = AsyncMongoMockClient()["test"]["items"]
+    importer = ItemImporter(collection, "/tmp", "admin", batch_size=batch_size)
+    body = b"".join(orjson.dumps(line) + b"\n" for line in lines)
+
+    async def collect():
+        return [entry async for batch in importer.run(iter_rows(io.BytesIO(body), "ndjson")) for entry in batch]
+
+    report = asyncio.run(collect())
+    count = asyncio.run(collection.count_documents({}))
+    return report, importer.totals, count
+
+
+def test_non_string_image_is_reported_invalid_and_import_continues():
+    report, totals, count = run_import([ROW, {**ROW, "image": 5}, ROW, ROW])
+    assert [entry["status"] for entry in report] == ["inserted", "invalid", "inserted", "inserted"]
+    assert report[1]["errors"] == ["image: must be a file name"]
+    assert totals == {"inserted": 3, "invalid": 1, "failed": 0}
+    assert count == 3
+
+
+def test_unexpected_batch_error_is_reported_failed_and_later_batches_run(monkeypatch):
+    original = ItemImporter.import_batch
+    calls = []
+
+    async def flaky(self, batch):
+        calls.append(batch)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return await original(self, batch)
+
+    monkeypatch.setattr(ItemImporter, "import_batch", flaky)
+    report, totals, count = run_import([ROW, ROW, ROW])
+    assert [entry["status"] for entry in report] == ["failed", "failed", "inserted"]
+    assert totals == {"inserted": 1, "invalid": 0, "failed": 2}
+    assert count == 1
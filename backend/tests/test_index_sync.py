@@ -0,0 +1,65 @@
+import asyncio
+from datetime import datetime
+
+from mongomock_motor import AsyncMongoMockClient
+
+from fastapi_app.search.engine import search_engine
+from fastapi_app.tasks import index_sync as sync_module
+from fastapi_app.tasks.index_sync import IndexSync
+
+
+def item(title, status="approved", **extra):
+    return {"title": title, "description": "", "category": "Keys", "location": "Gym", "type": "lost",
+            "date": datetime(2024, 6, 1), "status": status, **extra}
+
+
+def searched(keyword):
+    return asyncio.run(search_engine.search(None, keyword, 10))
+
+
+def test_sync_applies_moderation_done_by_other_workers():
+    database = AsyncMongoMockClient()["test"]
+    sync = IndexSync()
+
+    async def scenario():
+        kept = await database.items.insert_one(item("brass key"))
+        withdrawn = await database.items.insert_one(item("steel key"))
+        pending = await database.items.insert_one(item("copper key", status="pending"))
+        await sync.rebuild(database.items, database.items_archive)
+
+        # Another worker approves one item, rejects another, and archives the third
+        now = datetime.utcnow()
+        await database.items.update_one({"_id": pending.inserted_id},
+                                        {"$set": {"status": "approved", "moderated_at": now}})
+        await database.items.update_one({"_id": withdrawn.inserted_id},
+                                        {"$set": {"status": "rejected", "moderated_at": now}})
+        archived = await database.items.find_one({"_id": kept.inserted_id})
+        await database.items.delete_one({"_id": kept.inserted_id})
+        await database.items_archive.insert_one({**archived, "archived_at": now})
+        return await sync.sync(database.items, database.items_archive)
+
+    assert asyncio.run(scenario()) == 3
+    assert searched("copper")
+    assert not searched("steel")
+    assert not searched("brass")
+
+
+def test_rebuild_replays_moderation_that_happened_while_it_ran(monkeypatch):
+    database = AsyncMongoMockClient()["test"]
+    sync = IndexSync()
+    load_indexes = sync_module.load_indexes
+
+    async def approve_during_load(collection, include_search=True):
+        await load_indexes(collection, include_search)
+        # Lands after the snapshot was read, before the fresh indexes are swapped in
+        await collection.update_one({"title": "silver key"},
+                                    {"$set": {"status": "approved", "moderated_at": datetime.utcnow()}})
+
+    monkeypatch.setattr(sync_module, "load_indexes", approve_during_load)
+
+    async def scenario():
+        await database.items.insert_one(item("silver key", status="pending"))
+        await sync.rebuild(database.items, database.items_archive)
+
+    asyncio.run(scenario())
+    assert searched("silver")
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+
+from fastapi_app.matching.engine import MatchIndex
+
+DAY = datetime(2024, 6, 15)
+
+
+def item(_id, type_="found", category="Bags", days=0, title="black leather wallet", location="central library"):
+    return {"_id": _id, "type": type_, "category": category, "date": DAY + timedelta(days=days),
+            "title": title, "description": "", "location": location}
+
+
+def scored_ids(index, monkeypatch, probe):
+    scored = []
+    score = index._score
+
+    def recording_score(probe_, weights, norm, other):
+        scored.append(other.id)
+        return score(probe_, weights, norm, other)
+
+    monkeypatch.setattr(index, "_score", recording_score)
+    return [m["id"] for m in index.match(probe)], scored
+
+
+def test_only_candidates_in_block_and_date_window_are_scored(monkeypatch):
+    index = MatchIndex(date_window_days=30)
+    index.add(item("near", days=5))
+    index.add(item("edge", days=-30))
+    index.add(item("far", days=200))
+    index.add(item("other-category", category="Electronics"))
+    index.add(item("same-type", type_="lost"))
+
+    matches, scored = scored_ids(index, monkeypatch, item("probe", type_="lost"))
+
+    assert set(matches) == {"near", "edge"}
+    assert "far" not in scored
+    assert "other-category" not in scored
+    assert "same-type" not in scored
+
+
+def test_common_postings_do_not_pull_in_candidates(monkeypatch):
+    index = MatchIndex(date_window_days=30, max_posting=3)
+    for n in range(10):
+        index.add(item(f"common-{n}", title="black bag", location="station"))
+    index.add(item("rare", title="black bag with lighthouse keyring", location="station"))
+
+    matches, scored = scored_ids(index, monkeypatch, item("probe", type_="lost", title="lighthouse keyring",
+                                                          location="station"))
+
+    assert matches == ["rare"]
+    assert scored == ["rare"]
@@ -0,0 +1,44 @@
+import asyncio
+
+from fastapi_app.auth import dependencies
+from fastapi_app.auth.jwt_handler import create_access_token
+from fastapi_app.auth.principal_cache import invalidate_principal
+
+
+def resolve_all(monkeypatch, tokens, roles):
+    """Resolve each token in turn; the users DB answers with the next role from `roles`."""
+    loads = []
+
+    async def load_principal(username):
+        loads.append(username)
+        return {"username": username, "role": roles[len(loads) - 1], "id": len(loads)}
+
+    monkeypatch.setattr(dependencies, "load_principal", load_principal)
+
+    async def scenario():
+        return [await dependencies.get_current_user(token) for token in tokens]
+
+    return asyncio.run(scenario()), loads
+
+
+def test_principal_is_cached_per_token(monkeypatch):
+    first = create_access_token({"sub": "cache-user-1"})
+    second = create_access_token({"sub": "cache-user-1"})
+
+    principals, loads = resolve_all(monkeypatch, [first, first, second], ["user", "admin"])
+
+    assert len(loads) == 2
+    # The second token is resolved on its own, not served the first token's principal
+    assert [p["role"] for p in principals] == ["user", "user", "admin"]
+
+
+def test_invalidation_drops_every_cached_token_of_the_user(monkeypatch):
+    token = create_access_token({"sub": "cache-user-2"})
+
+    def resolve():
+        return resolve_all(monkeypatch, [token], ["user"])[1]
+
+    assert resolve() == ["cache-user-2"]
+    assert resolve() == []
+    invalidate_principal("cache-user-2")
+    assert resolve() == ["cache-user-2"]
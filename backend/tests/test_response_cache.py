@@ -0,0 +1,31 @@
+import asyncio
+
+from mongomock_motor import AsyncMongoMockClient
+from starlette.requests import Request
+
+from fastapi_app.cache.response_cache import ResponseCache
+from fastapi_app.cache.ttl_cache import TTLCache
+
+
+def test_invalidation_in_one_worker_reaches_the_others():
+    async def scenario():
+        generations = AsyncMongoMockClient()["test"]["cache_generations"]
+        workers = [ResponseCache(TTLCache(maxsize=10, ttl=300)) for _ in range(2)]
+        for worker in workers:
+            worker.attach(generations)
+        request = Request({"type": "http", "headers": []})
+        listing = ["v1"]
+
+        async def compute():
+            return list(listing)
+
+        first = await workers[1].respond(request, "approved", {}, compute)
+        listing[0] = "v2"
+        stale = await workers[1].respond(request, "approved", {}, compute)
+        await workers[0].invalidate("approved")
+        fresh = await workers[1].respond(request, "approved", {}, compute)
+        return first.body, stale.body, fresh.body
+
+    first, stale, fresh = asyncio.run(scenario())
+    assert first == stale == b'["v1"]'
+    assert fresh == b'["v2"]'
@@ -0,0 +1,32 @@
+import asyncio
+
+import orjson
+from mongomock_motor import AsyncMongoMockClient
+
+from fastapi_app.db.mongo import mongo_connection
+from fastapi_app.matching.image_hash import backfill_image_hashes
+from fastapi_app.routes.items import get_similar_images
+
+
+def test_unhashable_photo_is_reported_failed_not_pending(tmp_path):
+    database = AsyncMongoMockClient()["test"]
+
+    async def scenario():
+        broken = await database.items.insert_one({"image_path": "missing.jpg", "status": "approved"})
+        before = await get_similar_images(str(broken.inserted_id), limit=5, max_distance=10)
+        # Nothing in the upload folder, so hashing fails
+        await backfill_image_hashes(database.items, str(tmp_path))
+        pending = await database.items.insert_one({"image_path": "queued.jpg", "status": "approved"})
+        after = await get_similar_images(str(broken.inserted_id), limit=5, max_distance=10)
+        still_pending = await get_similar_images(str(pending.inserted_id), limit=5, max_distance=10)
+        return [orjson.loads(response.body) for response in (before, after, still_pending)]
+
+    mongo_connection.attach(database)
+    try:
+        before, after, still_pending = asyncio.run(scenario())
+    finally:
+        mongo_connection.database = None
+
+    assert before.get("hash_pending") is True
+    assert after.get("hash_failed") is True and "hash_pending" not in after
+    assert still_pending.get("hash_pending") is True
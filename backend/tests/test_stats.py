@@ -0,0 +1,34 @@
+import asyncio
+
+from mongomock_motor import AsyncMongoMockClient
+
+from fastapi_app.stats.counters import ItemStats
+
+
+def test_archived_items_leave_the_breakdowns_and_are_counted_separately():
+    database = AsyncMongoMockClient()["test"]
+    stats = ItemStats()
+
+    async def scenario():
+        await database.items.insert_many([
+            {"status": "approved", "type": "lost", "category": "Keys", "submitted_by": "a"},
+            {"status": "rejected", "type": "found", "category": "Bags", "submitted_by": "b"},
+        ])
+        await stats.startup(database.items, database.items_archive)
+        # The archiver moves the rejected item out of the hot collection
+        old = await database.items.find_one_and_delete({"status": "rejected"})
+        await database.items_archive.insert_one(old)
+        stats.item_archived(old)
+        live = stats.snapshot()
+        drift = await stats.reconcile(database.items, database.items_archive)
+        return live, drift, stats.snapshot()
+
+    live, drift, reconciled = asyncio.run(scenario())
+    assert live["total_items"] == 1
+    assert live["by_status"] == {"approved": 1}
+    assert live["by_category"] == {"Keys": 1}
+    assert live["archived_items"] == 1
+    assert live["approximate"] is True
+    # Reconciling from the collections agrees with the incremental counts
+    assert drift == 0
+    assert reconciled["total_items"] == 1 and reconciled["archived_items"] == 1
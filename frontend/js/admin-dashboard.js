@@ -59,6 +59,18 @@ document.addEventListener("DOMContentLoaded", () => {
     });
   });
 
+  // Helper: <picture> for an item photo, preferring the small rendition when it exists
+  function itemPicture(item, size, style) {
+    const renditions = item.image_renditions || {};
+    const src = renditions[size] || item.image_path;
+    const webp = renditions[`${size}_webp`];
+    return `
+      <picture>
+        ${webp ? `<source srcset="/images/${webp}" type="image/webp">` : ""}
+        <img src="/images/${src}" style="${style}" alt="Item" loading="lazy">
+      </picture>`;
+  }
+
   // Helper: Create Item Card
   function createItemCard(item, isPending = true) {
     const card = document.createElement("div");
@@ -78,7 +90,7 @@ document.addEventListener("DOMContentLoaded", () => {
             
             ${imgSrc ? `
                 <div class="admin-image-preview" style="width: 100%; height: 180px; border-radius: 8px; overflow: hidden; margin-bottom: 1rem; border: 1px solid var(--glass-border);">
-                    <img src="${imgSrc}" style="width: 100%; height: 100%; object-fit: cover;" alt="Item">
+                    ${itemPicture(item, "thumb", "width: 100%; height: 100%; object-fit: cover;")}
                 </div>
             ` : `
                 <div class="admin-no-image" style="width: 100%; height: 60px; display: flex; align-items: center; justify-content: center; background: rgba(0,0,0,0.2); border-radius: 8px; margin-bottom: 1rem; color: var(--text-muted); font-size: 0.8rem; border: 1px dashed var(--glass-border);">
@@ -115,14 +127,15 @@ document.addEventListener("DOMContentLoaded", () => {
       const res = await fetch("/items/pending", {
         headers: { "Authorization": `Bearer ${token}` }
       });
-      const data = await res.json();
+      const { items: data, next_cursor } = await res.json();
       container.innerHTML = "";
-      pendingCountEl.textContent = data.length;
+      pendingCountEl.textContent = next_cursor ? `${data.length}+` : data.length;
 
       if (data.length === 0) {
         container.innerHTML = '<div class="no-items"><p>All caught up! No reports pending.</p></div>';
         return;
       }
+      container.appendChild(createBulkToolbar(data));
       data.forEach(item => container.appendChild(createItemCard(item, true)));
     } catch (err) {
       showNotification("Failed to load queue", "error");
@@ -134,7 +147,7 @@ document.addEventListener("DOMContentLoaded", () => {
     container.innerHTML = '<div class="loading-spinner"><i class="fas fa-circle-notch fa-spin"></i><p>Loading verified items...</p></div>';
     try {
       const res = await fetch("/items/approved");
-      const data = await res.json();
+      const { items: data } = await res.json();
       container.innerHTML = "";
       if (data.length === 0) {
         container.innerHTML = '<div class="no-items"><p>No approved items to show.</p></div>';
@@ -165,8 +178,88 @@ document.addEventListener("DOMContentLoaded", () => {
     }
   }
 
+  // Bulk Approve/Reject for the loaded page
+  function createBulkToolbar(items) {
+    const bar = document.createElement("div");
+    bar.className = "card-actions bulk-actions";
+    bar.style.cssText = "grid-column: 1 / -1; margin-bottom: 1rem;";
+    bar.innerHTML = `
+            <button class="btn btn-primary bulk-approve-btn">Approve all (${items.length})</button>
+            <button class="btn btn-outline bulk-reject-btn" style="border-color: var(--danger); color: var(--danger);">Reject all (${items.length})</button>
+        `;
+    bar.querySelector(".bulk-approve-btn").onclick = () => handleBulkModeration(items, 'approve');
+    bar.querySelector(".bulk-reject-btn").onclick = () => handleBulkModeration(items, 'reject');
+    return bar;
+  }
+
+  async function handleBulkModeration(items, action) {
+    if (!confirm(`${action === 'approve' ? 'Approve' : 'Reject'} ${items.length} items?`)) return;
+    try {
+      const res = await fetch("/items/moderate/bulk", {
+        method: "POST",
+        headers: { "Authorization": `Bearer ${token}`, "Content-Type": "application/json" },
+        body: JSON.stringify({ actions: items.map(item => ({ id: item.id, action })) })
+      });
+
+      if (res.ok) {
+        const { updated } = await res.json();
+        showNotification(`${updated} items ${action}d!`, "success");
+        loadPendingItems(); // Refresh
+      } else {
+        showNotification(`Could not ${action} items`, "error");
+      }
+    } catch (err) {
+      showNotification("Bulk moderation failed", "error");
+    }
+  }
+
+  // Live updates: refresh the open tab when items change instead of re-fetching blindly
+  let refreshTimeout;
+  function scheduleRefresh() {
+    clearTimeout(refreshTimeout);
+    refreshTimeout = setTimeout(() => {
+      const activeTab = document.querySelector(".nav-item.active")?.dataset.tab;
+      if (activeTab === 'pending') loadPendingItems();
+      else if (activeTab === 'approved') loadApprovedItems();
+    }, 500);
+  }
+
+  // EventSource cannot send the Authorization header, so each connection
+  // trades the token for a single-use ticket; the token never goes in the URL
+  let events;
+  let reconnectTimeout;
+  async function connectEvents() {
+    try {
+      const res = await fetch("/items/events/ticket", {
+        method: "POST",
+        headers: { "Authorization": `Bearer ${token}` }
+      });
+      if (!res.ok) throw new Error(`ticket request failed (${res.status})`);
+      const { ticket } = await res.json();
+      events = new EventSource(`/items/events?ticket=${encodeURIComponent(ticket)}`);
+    } catch (err) {
+      reconnectTimeout = setTimeout(connectEvents, 5000);
+      return;
+    }
+    ["item.submitted", "item.approved", "item.rejected", "item.withdrawn", "resync"].forEach(name =>
+      events.addEventListener(name, scheduleRefresh)
+    );
+    events.addEventListener("item.submitted", (e) => {
+      const item = JSON.parse(e.data);
+      showNotification(`New report: ${item.title || 'Untitled'}`, "info");
+    });
+    // The ticket is spent, so reconnect with a fresh one instead of letting EventSource retry it
+    events.onerror = () => {
+      events.close();
+      reconnectTimeout = setTimeout(() => { connectEvents(); scheduleRefresh(); }, 5000);
+    };
+  }
+  connectEvents();
+
   // Logout
   document.getElementById("logoutBtn").onclick = () => {
+    clearTimeout(reconnectTimeout);
+    if (events) events.close();
     localStorage.clear();
     window.location.href = "/";
   };
@@ -138,6 +138,18 @@ document.addEventListener("DOMContentLoaded", () => {
         return card;
     }
 
+    // Helper: <picture> for an item photo, preferring the resized rendition when it exists
+    function itemPicture(item, size, style) {
+        const renditions = item.image_renditions || {};
+        const src = renditions[size] || item.image_path;
+        const webp = renditions[`${size}_webp`];
+        return `
+            <picture>
+                ${webp ? `<source srcset="/images/${webp}" type="image/webp">` : ""}
+                <img src="/images/${src}" style="${style}" alt="Item Photo">
+            </picture>`;
+    }
+
     // Show Details in Modal
     function showItemDetails(item) {
         const date = new Date(item.date).toLocaleDateString(undefined, {
@@ -153,7 +165,7 @@ document.addEventListener("DOMContentLoaded", () => {
             </div>
             ${imgSrc ? `
                 <div class="modal-image-container" style="width: 100%; height: 250px; border-radius: 12px; overflow: hidden; margin: 1rem 0; border: 1px solid var(--glass-border);">
-                    <img src="${imgSrc}" style="width: 100%; height: 100%; object-fit: cover;" alt="Item Photo">
+                    ${itemPicture(item, "medium", "width: 100%; height: 100%; object-fit: cover;")}
                 </div>
             ` : `
                 <div class="no-image-placeholder" style="width: 100%; padding: 2rem; background: rgba(0,0,0,0.2); border-radius: 12px; text-align: center; margin: 1rem 0; color: var(--text-muted); border: 1px dashed var(--glass-border);">
@@ -196,23 +208,82 @@ document.addEventListener("DOMContentLoaded", () => {
         }
     };
 
+    // "Load more" button for cursor-paginated feeds
+    function appendLoadMore(url, nextCursor) {
+        if (!nextCursor) return;
+        const btn = document.createElement("button");
+        btn.className = "btn btn-outline load-more-btn";
+        btn.textContent = "Load more";
+        btn.onclick = async () => {
+            btn.disabled = true;
+            try {
+                const sep = url.includes("?") ? "&" : "?";
+                const res = await fetch(`${url}${sep}after=${encodeURIComponent(nextCursor)}`);
+                const { items, next_cursor } = await res.json();
+                btn.remove();
+                items.forEach(item => itemsGrid.appendChild(createItemCard(item)));
+                appendLoadMore(url, next_cursor);
+            } catch (err) {
+                btn.disabled = false;
+                showNotification("Failed to load more items", "error");
+            }
+        };
+        itemsGrid.appendChild(btn);
+    }
+
     // Load Approved Items
     async function loadApprovedItems() {
         itemsGrid.innerHTML = '<div class="loading-spinner"><i class="fas fa-spinner fa-spin"></i><p>Syncing feed...</p></div>';
         try {
             const res = await fetch("/items/approved");
-            const data = await res.json();
+            const { items: data, next_cursor } = await res.json();
             itemsGrid.innerHTML = "";
             if (data.length === 0) {
                 itemsGrid.innerHTML = '<div class="no-items"><p>No items found. Check back later!</p></div>';
                 return;
             }
             data.forEach(item => itemsGrid.appendChild(createItemCard(item)));
+            appendLoadMore("/items/approved", next_cursor);
         } catch (err) {
             showNotification("Failed to load feed", "error");
         }
     }
 
+    // Typeahead: attach a <datalist> fed by /items/suggest (served from memory)
+    function attachSuggestions(input, field) {
+        const list = document.createElement("datalist");
+        list.id = `${input.id}Suggestions`;
+        input.setAttribute("list", list.id);
+        input.after(list);
+        let timer;
+        input.addEventListener("input", () => {
+            clearTimeout(timer);
+            const q = input.value.trim();
+            if (!q) return;
+            timer = setTimeout(async () => {
+                try {
+                    const params = new URLSearchParams({ q, limit: 8 });
+                    if (field) params.set("field", field);
+                    const res = await fetch(`/items/suggest?${params}`);
+                    const data = await res.json();
+                    const values = [...new Set(Object.values(data).flat().map(s => s.value))];
+                    list.innerHTML = "";
+                    values.forEach(value => {
+                        const option = document.createElement("option");
+                        option.value = value;
+                        list.appendChild(option);
+                    });
+                } catch (err) {
+                    // Suggestions are a nicety; typing still works without them
+                }
+            }, 150);
+        });
+    }
+
+    attachSuggestions(searchInput);
+    attachSuggestions(document.getElementById("itemCategory"), "category");
+    attachSuggestions(document.getElementById("itemLocation"), "location");
+
     // Search
     let searchTimeout;
     searchInput.addEventListener("input", (e) => {
@@ -224,13 +295,15 @@ document.addEventListener("DOMContentLoaded", () => {
                 return;
             }
             try {
-                const res = await fetch(`/items/search?keyword=${encodeURIComponent(query)}`);
-                const data = await res.json();
+                const url = `/items/search?keyword=${encodeURIComponent(query)}`;
+                const res = await fetch(url);
+                const { items: data, next_cursor } = await res.json();
                 itemsGrid.innerHTML = "";
                 if (data.length === 0) {
                     itemsGrid.innerHTML = '<div class="no-items"><p>No results found.</p></div>';
                 } else {
                     data.forEach(item => itemsGrid.appendChild(createItemCard(item)));
+                    appendLoadMore(url, next_cursor);
                 }
             } catch (err) {
                 showNotification("Search failed", "error");
@@ -307,11 +380,11 @@ document.addEventListener("DOMContentLoaded", () => {
         }
 
         try {
-            // Diagnostic: check global user associations
-            const diagRes = await fetch("/items/diag/users");
-            const diagData = await diagRes.json();
-            diagHtml += `Global Users in DB: [${diagData.submitted_by_values ? diagData.submitted_by_values.join(', ') : 'Error'}]<br>`;
-            diagHtml += `Total Items in DB: ${diagData.total_items_in_db || 0}<br>`;
+            // Diagnostic: global counters (precomputed server-side, no collection scan)
+            const statsRes = await fetch("/items/stats");
+            const stats = await statsRes.json();
+            diagHtml += `Submitters in DB: ${stats.distinct_submitters ?? 'Error'}<br>`;
+            diagHtml += `Total Items in DB: ${stats.total_items || 0}<br>`;
             if (diagContent) diagContent.innerHTML = diagHtml + "Fetching your specific items...";
 
             const res = await fetch("/items/my-items", {
@@ -353,8 +426,22 @@ document.addEventListener("DOMContentLoaded", () => {
         }
     }
 
+    // Live updates: refresh the feed when items are approved or withdrawn
+    let refreshTimeout;
+    const events = new EventSource("/items/events");
+    ["item.approved", "item.withdrawn", "resync"].forEach(name =>
+        events.addEventListener(name, () => {
+            clearTimeout(refreshTimeout);
+            refreshTimeout = setTimeout(() => {
+                const browsing = document.querySelector(".nav-btn.active")?.dataset.view === "browse";
+                if (browsing && !searchInput.value.trim()) loadApprovedItems();
+            }, 500);
+        })
+    );
+
     // Logout
     document.getElementById("logoutBtn").addEventListener("click", () => {
+        events.close();
         localStorage.clear();
         window.location.href = "/";
     });